@@ -0,0 +1,73 @@
+"""Benchmark of `CommandGraph` compilation and `ParsedInputValidator.validate_commands_path` on growing configs.
+
+Run: `python benchmarks/bench_command_graph.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import timeit
+
+from typing import Dict, Any
+
+import untils
+
+NUMBER: int = 20000
+"""Count of validations for every config."""
+
+def make_config(width: int) -> untils.utils.UnknownConfigType:
+    """Returns a config with `width` root commands, flags and options and small subtrees."""
+
+    def level(prefix: str, depth: int) -> Dict[str, Any]:
+        children: Dict[str, Any] = {}
+        for i in range(width if depth == 0 else 8):
+            children[f"{prefix}f{i}"] = {"aliases": [f"{prefix}F{i}"], "type": "flag", "default": None}
+            children[f"{prefix}o{i}"] = {"aliases": [f"{prefix}O{i}"], "type": "option", "default": "1"}
+        for i in range(width if depth == 0 else 4):
+            command: Dict[str, Any] = {"aliases": [f"{prefix}W{i}"], "type": "word"}
+            if depth < 2:
+                command["children"] = level(f"{prefix}{i}x", depth + 1)
+            children[f"{prefix}w{i}"] = command
+        return children
+
+    return {
+        "version": 1,
+        "states": {
+            "__base__": [f"w{i}" for i in range(width)],
+            "__init__": [],
+            **{f"state{i}": [f"w{i}"] for i in range(width)}
+        },
+        "commands": level("", 0)
+    }
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.IGNORE
+
+    for width in (10, 100, 1000):
+        config: untils.CommandsConfig = untils.Parser.parse_config(
+            untils.ConfigValidator.validate_config(settings, make_config(width))
+        )
+        last: int = width - 1
+        input_dict: untils.utils.InputDict = {
+            "path": [f"W{last}", f"{last}xw3", f"{last}x3xW1"],
+            "flags": {f"F{last}": None, f"{last}xf7": None, f"{last}x3xF0": None},
+            "options": {f"O{last}": "1", f"{last}x3xo7": "2"}
+        }
+        assert untils.ParsedInputValidator.validate_commands_path(settings, input_dict, config)
+
+        build: float = min(timeit.repeat(
+            lambda: untils.CommandGraph.build(untils.CommandTrieNode.build(config.commands), config.states),    # pylint: disable=cell-var-from-loop
+            number=1,
+            repeat=3
+        ))
+        validate: float = min(timeit.repeat(
+            lambda: untils.ParsedInputValidator.validate_commands_path(settings, input_dict, config),    # pylint: disable=cell-var-from-loop
+            number=NUMBER,
+            repeat=3
+        ))
+        print(f"width {width:>5}: compile {build * 1000:>9.2f} ms, validate {NUMBER / validate:>12,.0f} inputs/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark of `CommandSystem.complete` against a linear scan of `get_all_commands_str` for growing configs.
+
+Run: `python benchmarks/bench_completion.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import timeit
+
+from typing import Any, Dict
+
+import untils
+
+SIZES = (100, 1_000, 10_000, 100_000)
+"""Counts of root commands."""
+CALLS: int = 10_000
+"""Count of timed completions."""
+
+def make_command_system(roots: int) -> untils.CommandSystem:
+    """Returns a command system with `roots` root commands and a few actions in each."""
+
+    commands: Dict[str, Any] = {}
+    for i in range(roots):
+        commands[f"entity{i}"] = {"aliases": [f"e{i}"], "type": "word", "children": {
+            f"action{j}": {"aliases": [], "type": "word"} for j in range(3)
+        }}
+
+    return untils.CommandSystem(untils.Settings(), untils.Parser.parse_config(
+        {"version": 1, "states": {"__base__": list(commands)}, "commands": commands}
+    ))
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    for roots in SIZES:
+        command_system: untils.CommandSystem = make_command_system(roots)
+        command_system.complete("entity1")
+        names = command_system.get_all_commands_str()
+
+        trie: float = timeit.timeit(lambda: command_system.complete("entity1"), number=CALLS) / CALLS
+        scan: float = timeit.timeit(lambda: sorted(name for name in names if name.startswith("entity1"))[:10], number=CALLS // 100) / (CALLS // 100)
+        print(f"{roots:>7,} roots: trie {trie * 1e6:8.2f} us, linear scan {scan * 1e6:10.2f} us")
+
+if __name__ == "__main__":
+    main()
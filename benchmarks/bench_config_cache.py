@@ -0,0 +1,67 @@
+"""Benchmark of warm starts with `ConfigCache` against `Processor.load_config` on a generated config file.
+
+Run: `python benchmarks/bench_config_cache.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import json
+import os
+import tempfile
+import time
+
+from typing import Any, Dict
+
+import untils
+
+ROOTS: int = 200
+"""Count of root commands."""
+ACTIONS: int = 20
+"""Count of `Word` children in every root command."""
+LEAVES: int = 12
+"""Count of `Flag` and `Option` pairs in every action."""
+
+def make_config() -> Dict[str, Any]:
+    """Returns a config in game data style: entities with actions, which share flag and option names."""
+
+    commands: Dict[str, Any] = {}
+    for i in range(ROOTS):
+        actions: Dict[str, Any] = {}
+        for j in range(ACTIONS):
+            leaves: Dict[str, Any] = {}
+            for k in range(LEAVES):
+                leaves[f"flag{k}"] = {"aliases": [f"f{k}"], "type": "flag", "default": None}
+                leaves[f"option{k}"] = {"aliases": [f"o{k}"], "type": "option", "default": "0"}
+            actions[f"action{j}"] = {"aliases": [f"a{j}"], "type": "word", "children": leaves}
+        commands[f"entity{i}"] = {"aliases": [f"e{i}"], "type": "word", "children": actions}
+
+    return {"version": 1, "states": {"__base__": list(commands)}, "commands": commands}
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    settings: untils.Settings = untils.Settings()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path: str = os.path.join(directory, "config.json")
+        with open(config_path, "w", encoding="utf-8") as file:
+            json.dump(make_config(), file)
+        cache: untils.ConfigCache = untils.ConfigCache(os.path.join(directory, "cache"))
+
+        start: float = time.perf_counter()
+        untils.Processor.load_config(settings, config_path)
+        plain: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cache.load_config(settings, config_path)
+        cold: float = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cache.load_config(settings, config_path)
+        warm: float = time.perf_counter() - start
+
+        print(f"config {os.path.getsize(config_path) / 2 ** 20:.1f} MiB, cache {os.path.getsize(cache.get_cache_path(config_path)) / 2 ** 20:.1f} MiB")
+        print(f"load_config {plain:.2f} s, cold cache {cold:.2f} s, warm cache {warm:.2f} s ({plain / warm:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark of peak memory of `Processor.load_config_streaming` against `Processor.load_config` on a generated config file.
+
+Every loader runs in a new process, so its peak RSS is measured separately. Requires the `resource` module (Unix).
+
+Run: `python benchmarks/bench_config_memory.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from typing import Any, Dict
+
+import untils
+
+ROOTS: int = 300
+"""Count of root commands."""
+ACTIONS: int = 20
+"""Count of `Word` children in every root command."""
+LEAVES: int = 12
+"""Count of `Flag` and `Option` pairs in every action."""
+
+def write_config(file_path: str) -> None:
+    """Writes a config in game data style root command by root command, so the generator doesn't hold the whole tree."""
+
+    with open(file_path, "w", encoding="utf-8") as file:
+        file.write('{"version": 1, "states": {"__base__": ' + json.dumps([f"entity{i}" for i in range(ROOTS)]) + '}, "commands": {')
+        for i in range(ROOTS):
+            actions: Dict[str, Any] = {}
+            for j in range(ACTIONS):
+                leaves: Dict[str, Any] = {}
+                for k in range(LEAVES):
+                    leaves[f"flag{k}"] = {"aliases": [f"f{k}"], "type": "flag", "default": None}
+                    leaves[f"option{k}"] = {"aliases": [f"o{k}"], "type": "option", "default": "0"}
+                actions[f"action{j}"] = {"aliases": [f"a{j}"], "type": "word", "children": leaves}
+            file.write(("," if i else "") + json.dumps(f"entity{i}") + ": " + json.dumps({"aliases": [f"e{i}"], "type": "word", "children": actions}))
+        file.write("}}")
+
+def measure(mode: str, file_path: str) -> None:
+    """Loads the config in a mode and prints peak RSS and time."""
+
+    settings: untils.Settings = untils.Settings()
+    before: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start: float = time.perf_counter()
+    if mode == "stream":
+        config: untils.CommandsConfig = untils.Processor.load_config_streaming(settings, file_path)
+    else:
+        config = untils.Processor.load_config(settings, file_path)
+    elapsed: float = time.perf_counter() - start
+
+    peak: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    scale: int = 1 if sys.platform == "darwin" else 1024
+    print(f"{mode:>6}: peak RSS {peak * scale / 2 ** 20:7.1f} MiB (+{(peak - before) * scale / 2 ** 20:6.1f} MiB), {elapsed:.2f} s, {len(config.commands)} root commands")
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    if len(sys.argv) == 3:
+        measure(sys.argv[1], sys.argv[2])
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path: str = os.path.join(directory, "config.json")
+        write_config(file_path)
+        print(f"config {os.path.getsize(file_path) / 2 ** 20:.1f} MiB")
+
+        for mode in ("load", "stream"):
+            subprocess.run([sys.executable, __file__, mode, file_path], check=True)
+
+if __name__ == "__main__":
+    main()
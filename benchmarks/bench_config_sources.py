@@ -0,0 +1,57 @@
+"""Benchmark of loading a small config from temporary files, bytes and mappings, as test suites do.
+
+Run: `python benchmarks/bench_config_sources.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import json
+import os
+import tempfile
+import timeit
+
+from typing import Any, Dict
+
+import untils
+
+LOADS: int = 1000
+"""Count of timed loads."""
+
+CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "states": {"__base__": ["go", "look"]},
+    "commands": {
+        "go": {"aliases": ["g"], "type": "word", "children": {"north": {"aliases": ["n"], "type": "word"}}},
+        "look": {"aliases": ["l"], "type": "word", "children": {"quiet": {"aliases": ["q"], "type": "flag", "default": None}}}
+    }
+}
+"""The loaded config."""
+
+def load_temp_file(settings: untils.Settings, data: bytes) -> untils.CommandsConfig:
+    """Loads the config from a new temporary file."""
+
+    descriptor, file_path = tempfile.mkstemp(".json")
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(data)
+        return untils.Processor.load_config(settings, file_path)
+    finally:
+        os.remove(file_path)
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    settings: untils.Settings = untils.Settings()
+    data: bytes = json.dumps(CONFIG).encode("utf-8")
+
+    timings: Dict[str, float] = {
+        "temp file": timeit.timeit(lambda: load_temp_file(settings, data), number=LOADS),
+        "bytes": timeit.timeit(lambda: untils.Processor.load_config_from_bytes(settings, data), number=LOADS),
+        "mapping": timeit.timeit(lambda: untils.Processor.load_config_from_mapping(settings, CONFIG), number=LOADS)
+    }
+
+    for name, total in timings.items():
+        print(f"{name:>9}: {total / LOADS * 1e6:8.1f} us per load")
+
+if __name__ == "__main__":
+    main()
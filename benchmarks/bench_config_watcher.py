@@ -0,0 +1,67 @@
+"""Benchmark of `ConfigWatcher` reloads with a single changed root command against `CommandSystem.load_config`.
+
+Run: `python benchmarks/bench_config_watcher.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import json
+import os
+import tempfile
+import time
+
+from typing import Any, Dict
+
+import untils
+
+ROOTS: int = 200
+"""Count of root commands."""
+ACTIONS: int = 20
+"""Count of `Word` children in every root command."""
+LEAVES: int = 12
+"""Count of `Flag` and `Option` pairs in every action."""
+
+def make_config() -> Dict[str, Any]:
+    """Returns a config in game data style: entities with actions, which share flag and option names."""
+
+    commands: Dict[str, Any] = {}
+    for i in range(ROOTS):
+        actions: Dict[str, Any] = {}
+        for j in range(ACTIONS):
+            leaves: Dict[str, Any] = {}
+            for k in range(LEAVES):
+                leaves[f"flag{k}"] = {"aliases": [f"f{k}"], "type": "flag", "default": None}
+                leaves[f"option{k}"] = {"aliases": [f"o{k}"], "type": "option", "default": "0"}
+            actions[f"action{j}"] = {"aliases": [f"a{j}"], "type": "word", "children": leaves}
+        commands[f"entity{i}"] = {"aliases": [f"e{i}"], "type": "word", "children": actions}
+
+    return {"version": 1, "states": {"__base__": list(commands)}, "commands": commands}
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+    config_dict: Dict[str, Any] = make_config()
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path: str = os.path.join(directory, "config.json")
+        with open(config_path, "w", encoding="utf-8") as file:
+            json.dump(config_dict, file)
+
+        watcher: untils.ConfigWatcher = untils.ConfigWatcher(command_system, config_path)
+        initial: untils.ConfigReload = watcher.reload()
+
+        config_dict["commands"]["entity7"]["aliases"] = ["seventh"]
+        with open(config_path, "w", encoding="utf-8") as file:
+            json.dump(config_dict, file)
+
+        start: float = time.perf_counter()
+        command_system.load_config(config_path)
+        full: float = time.perf_counter() - start
+
+        report: untils.ConfigReload = watcher.reload()
+        print(f"initial reload {initial.time:.2f} s ({initial.changed} root commands)")
+        print(f"load_config {full:.2f} s, reload {report.time:.2f} s ({report.changed} of {report.commands} root commands changed, {full / report.time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
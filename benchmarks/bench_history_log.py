@@ -0,0 +1,48 @@
+"""Benchmark of `HistoryLog` with a million notes: appending, reopening, random reads and reverse search.
+
+Run: `python benchmarks/bench_history_log.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import os
+import random
+import tempfile
+import time
+
+import untils
+
+NOTES: int = 1_000_000
+"""Count of written notes."""
+READS: int = 100_000
+"""Count of random reads."""
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "history.log")
+        parsed_input: untils.ParsedInput = untils.ParsedInput(["go", "north"], {"fast": True}, {"steps": "2"})
+
+        start: float = time.perf_counter()
+        with untils.HistoryLog(path, buffer_size=4096) as log:
+            for i in range(NOTES):
+                log.append((f"go north --steps {i}", parsed_input))
+        print(f"append and flush {NOTES:,} notes in {time.perf_counter() - start:.2f} s, log {os.path.getsize(path) / 2 ** 20:.1f} MiB, index {os.path.getsize(path + '.idx') / 2 ** 20:.1f} MiB")
+
+        start = time.perf_counter()
+        with untils.HistoryLog(path, is_background_flush=False) as log:
+            print(f"reopen in {(time.perf_counter() - start) * 1000:.1f} ms, {len(log):,} notes")
+
+            indices = [random.randrange(NOTES) for _ in range(READS)]
+            start = time.perf_counter()
+            for i in indices:
+                log.get_input(i)
+            print(f"random input reads {READS / (time.perf_counter() - start):,.0f}/s")
+
+            start = time.perf_counter()
+            found = next(log.search("--steps 1000", is_prefix=False))
+            print(f"reverse search hit {found} after {NOTES - found[0]:,} notes in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark of memory per history note with `InputDict` and `ParsedInput`.
+
+Notes are measured after the realistic path: processing, validation of the input against the config and writing to history.
+
+Run: `python benchmarks/bench_parsed_input.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import tracemalloc
+
+from typing import Any, Callable, List
+
+import untils
+
+NOTES: int = 20000
+"""Count of history notes."""
+
+CONFIG: untils.utils.UnknownConfigType = {
+    "version": 1,
+    "states": {
+        "__base__": ["go", "give", "help", "look"]
+    },
+    "commands": {
+        "go": {
+            "aliases": [],
+            "type": "word",
+            "children": {
+                "north": {"aliases": [], "type": "word"},
+                "q": {"aliases": [], "type": "flag", "default": None}
+            }
+        },
+        "give": {
+            "aliases": [],
+            "type": "word",
+            "children": {
+                "$player": {
+                    "type": "fallback",
+                    "default": "me",
+                    "children": {
+                        "sword": {"aliases": [], "type": "word"},
+                        "count": {"aliases": [], "type": "option", "default": "1"},
+                        "silent": {"aliases": [], "type": "flag", "default": None}
+                    }
+                }
+            }
+        },
+        "help": {"aliases": [], "type": "word"},
+        "look": {"aliases": [], "type": "word", "children": {"around": {"aliases": [], "type": "word"}}}
+    }
+}
+"""Config of the benchmark."""
+
+INPUTS: List[str] = [
+    "go north -q",
+    "give player42 sword --count 64 -!silent",
+    "help",
+    "look around"
+]
+"""Typical commands."""
+
+def measure(make: Callable[[untils.ParsedInput], Any]) -> float:
+    """Returns allocated bytes per note, which is processed, validated and converted by `make`."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.IGNORE
+    command_system: untils.CommandSystem = untils.CommandSystem(settings)
+    command_system.set_config(untils.Parser.parse_config(untils.ConfigValidator.validate_config(settings, CONFIG)))
+
+    tracemalloc.start()
+    notes: List[Any] = []
+    for i in range(NOTES):
+        parsed_input: untils.ParsedInput = command_system.process_input(INPUTS[i % len(INPUTS)])
+        assert command_system.is_input_valid(parsed_input)
+        notes.append(make(parsed_input))
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del notes
+    return size / NOTES
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    dicts: float = measure(lambda parsed_input: parsed_input.to_dict())
+    compact: float = measure(lambda parsed_input: parsed_input)
+
+    print(f"InputDict   {dicts:>8.0f} bytes/note")
+    print(f"ParsedInput {compact:>8.0f} bytes/note  x{dicts / compact:.2f} less")
+
+if __name__ == "__main__":
+    main()
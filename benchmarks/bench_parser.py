@@ -0,0 +1,53 @@
+"""Benchmark of `Parser.parse_config` on a generated config with about 500k command nodes.
+
+Run: `python benchmarks/bench_parser.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import time
+
+from typing import Dict, Any
+
+import untils
+
+ROOTS: int = 1000
+"""Count of root commands."""
+ACTIONS: int = 20
+"""Count of `Word` children in every root command."""
+LEAVES: int = 12
+"""Count of `Flag` and `Option` pairs in every action."""
+
+def make_config() -> untils.utils.ConfigType:
+    """Returns a config in game data style: entities with actions, which share flag and option names."""
+
+    commands: Dict[str, Any] = {}
+
+    for i in range(ROOTS):
+        actions: Dict[str, Any] = {}
+        for j in range(ACTIONS):
+            leaves: Dict[str, Any] = {}
+            for k in range(LEAVES):
+                leaves[f"flag{k}"] = {"aliases": [f"f{k}"], "type": "flag", "default": None}
+                leaves[f"option{k}"] = {"aliases": [f"o{k}"], "type": "option", "default": "0"}
+            actions[f"action{j}"] = {"aliases": [f"a{j}"], "type": "word", "children": leaves}
+        commands[f"entity{i}"] = {"aliases": [f"e{i}"], "type": "word", "children": actions}
+
+    return {"version": 1, "states": {"__base__": list(commands)}, "commands": commands}
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    start: float = time.perf_counter()
+    config_dict: untils.utils.ConfigType = make_config()
+    print(f"generated in {time.perf_counter() - start:.2f} s")
+
+    stats: untils.ParseStats = untils.ParseStats()
+    untils.Parser.parse_config(config_dict, stats)
+
+    print(f"nodes {stats.nodes:,} (words {stats.words:,}, flags {stats.flags:,}, options {stats.options:,}), depth {stats.depth}")
+    print(f"aliases {stats.aliases:,}, distinct alias nodes {stats.alias_nodes:,}")
+    print(f"commands {stats.commands_time:.2f} s, config {stats.config_time:.2f} s, {stats.nodes / stats.config_time:,.0f} nodes/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark of `Processor.process_input` pipelines on typical commands.
+
+Run: `python benchmarks/bench_pipeline.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import timeit
+
+from typing import Callable, List, Tuple
+
+import untils
+
+CONFIG: untils.utils.UnknownConfigType = {
+    "version": 1,
+    "states": {
+        "__base__": ["help", "give", "go"]
+    },
+    "commands": {
+        "help": {"aliases": ["h"], "type": "word"},
+        "give": {
+            "aliases": ["gv"],
+            "type": "word",
+            "children": {
+                "$player": {
+                    "type": "fallback",
+                    "default": "me",
+                    "children": {
+                        "sword": {"aliases": ["sw"], "type": "word"},
+                        "count": {"aliases": ["c"], "type": "option", "default": "1"},
+                        "silent": {"aliases": ["s"], "type": "flag", "default": None}
+                    }
+                }
+            }
+        },
+        "go": {
+            "aliases": ["g"],
+            "type": "word",
+            "children": {
+                "north": {"aliases": ["n"], "type": "word"},
+                "south": {"aliases": ["s"], "type": "word"},
+                "quiet": {"aliases": ["q"], "type": "flag", "default": None}
+            }
+        }
+    }
+}
+"""Config of the benchmark."""
+
+INPUTS: Tuple[str, ...] = (
+    "help",
+    "go north -q",
+    "give player42 sword --count 64 -!silent",
+    "gv \"Some Player\" sw --c 3",
+    "go s"
+)
+"""Typical commands."""
+
+NUMBER: int = 20000
+"""Count of runs for every input."""
+
+def measure(settings: untils.Settings, config: untils.CommandsConfig) -> float:
+    """Returns processed inputs per second."""
+
+    def run() -> None:
+        for input_str in INPUTS:
+            untils.Processor.process_input(settings, config, input_str)
+
+    return NUMBER * len(INPUTS) / min(timeit.repeat(run, number=NUMBER, repeat=3))
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.IGNORE
+    config: untils.CommandsConfig = untils.Parser.parse_config(
+        untils.ConfigValidator.validate_config(settings, CONFIG)
+    )
+
+    def staged(backend: untils.utils.TokenizerBackend) -> Callable[[], None]:
+        def setup() -> None:
+            settings.is_fused_input = False
+            settings.tokenizer_backend = backend
+        return setup
+
+    def fused() -> None:
+        settings.is_fused_input = True
+
+    modes: List[Tuple[str, Callable[[], None]]] = [
+        ("staged, character scanner", staged(untils.utils.TokenizerBackend.CHARACTER)),
+        ("staged, table scanner", staged(untils.utils.TokenizerBackend.TABLE)),
+        ("fused", fused)
+    ]
+
+    baseline: float = 0.0
+    for name, setup in modes:
+        setup()
+        throughput: float = measure(settings, config)
+        baseline = baseline or throughput
+        print(f"{name:<28} {throughput:>12,.0f} inputs/s  x{throughput / baseline:.2f}")
+
+if __name__ == "__main__":
+    main()
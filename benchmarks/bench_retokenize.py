@@ -0,0 +1,60 @@
+"""Benchmark of typing latency with `Tokenizer.retokenize` against full tokenization by line length.
+
+Run: `python benchmarks/bench_retokenize.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import time
+
+from typing import List
+
+import untils
+
+KEYSTROKES: int = 2000
+"""Count of edits for every line length."""
+
+def measure(settings: untils.Settings, tokens_count: int, position: float, is_full: bool) -> float:
+    """Returns microseconds per edit at a relative position of a line with about `tokens_count` tokens.
+
+    A character is typed and erased by turns, so the line is not copied in the timed loop.
+    """
+
+    line: str = "go 'far away' -q " * (tokens_count // 7)
+    offset: int = int(len(line) * position)
+    typed: str = line[:offset] + "x" + line[offset:]
+    tokens: List[untils.utils.RawInputProtocol] = untils.Tokenizer(settings, line).tokenize_input_spans()
+
+    def edit(i: int) -> None:
+        nonlocal tokens
+        tokenizer: untils.Tokenizer = untils.Tokenizer(settings, typed if i % 2 == 0 else line)
+        if is_full:
+            tokens = tokenizer.tokenize_input_spans()
+        elif i % 2 == 0:
+            tokens = tokenizer.retokenize(tokens, offset, 0, "x")
+        else:
+            tokens = tokenizer.retokenize(tokens, offset, 1, "")
+
+    # The first edit at a new place moves the gap between token sources.
+    edit(0)
+    edit(1)
+
+    start: float = time.perf_counter()
+    for i in range(KEYSTROKES):
+        edit(i)
+
+    return (time.perf_counter() - start) / KEYSTROKES * 1e6
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    settings: untils.Settings = untils.Settings()
+
+    for tokens_count in (100, 1000, 10000, 100000):
+        end: float = measure(settings, tokens_count, 1.0, False)
+        middle: float = measure(settings, tokens_count, 0.5, False)
+        full: float = measure(settings, tokens_count, 1.0, True) if tokens_count <= 10000 else float("nan")
+        print(f"{tokens_count:>7} tokens  end {end:>6.1f} us  middle {middle:>6.1f} us  full tokenization {full:>9.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark of route dispatch with `RouteIndex` against the linear scan with `CommandSystem.access_path`.
+
+Run: `python benchmarks/bench_route_index.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import random
+import timeit
+
+from typing import Any, List, Optional
+
+import untils
+
+NUMBER: int = 2000
+"""Count of dispatches for every path."""
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    generator: random.Random = random.Random(0)
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+
+    for i in range(100):
+        command_system.register_command((f"cmd{i}", "-any"), lambda input_str, input_dict: None)
+        command_system.register_command((f"cmd{i}", (f"on{i}", f"off{i}")), lambda input_str, input_dict: None)
+        command_system.register_command((f"cmd{i}", f"sub{i}", "-any"), lambda input_str, input_dict: None)
+        command_system.register_command((f"cmd{i}", f"sub{i}", "last"), lambda input_str, input_dict: None)
+
+    paths: List[List[str]] = [
+        [f"cmd{i}", generator.choice((f"sub{i}", f"on{i}", "x")), generator.choice(("last", "y"))]
+        for i in generator.sample(range(100), 20)
+    ]
+
+    def scan() -> None:
+        for path in paths:
+            found: Optional[Any] = None
+            for route, func in command_system.route.items():
+                if command_system.access_path(path, route, False):
+                    found = func
+                    break
+
+    def index() -> None:
+        for path in paths:
+            command_system.resolve_command(path)
+
+    for name, run in (("linear scan", scan), ("route index", index)):
+        seconds: float = min(timeit.repeat(run, number=NUMBER, repeat=3))
+        print(f"{name:<12} {NUMBER * len(paths) / seconds:>12,.0f} dispatches/s ({len(command_system.route)} routes)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark of `ScriptRunner` on a script of 100k lines with a thread pool, a process pool and a sequential loop.
+
+Run: `python benchmarks/bench_script_runner.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import time
+
+from typing import List, Union
+
+import untils
+
+LINES: int = 100_000
+"""Count of script lines."""
+
+def make_command_system() -> untils.CommandSystem:
+    """Returns a command system with `go` and `look` commands."""
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings(), untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__base__": ["go", "look"]},
+        "commands": {
+            "go": {"aliases": ["g"], "type": "word", "children": {
+                "$where": {"type": "fallback"},
+                "fast": {"aliases": ["f"], "type": "flag", "default": None},
+                "steps": {"aliases": ["s"], "type": "option", "default": "1"}
+            }},
+            "look": {"aliases": ["l"], "type": "word"}
+        }
+    }))
+
+    def command(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        pass
+
+    command_system.register_command(("go",), command)
+    command_system.register_command(("look",), command)
+
+    return command_system
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    script: List[str] = [f"go north{i} -f --steps {i}" if i % 2 else "look" for i in range(LINES)]
+
+    command_system: untils.CommandSystem = make_command_system()
+    start: float = time.perf_counter()
+    for input_str in script:
+        input_dict: untils.ParsedInput = command_system.process_input(input_str)
+        if command_system.is_input_valid(input_dict):
+            command_system.execute(input_str, input_dict, command_system.get_normalized_path(input_dict), False)
+    print(f"sequential loop {LINES / (time.perf_counter() - start):,.0f} lines/s")
+
+    for is_processes in (False, True):
+        print("processes" if is_processes else "threads", end=": ")
+        make_command_system().run_script(script, chunk_size=2000, is_processes=is_processes)
+
+if __name__ == "__main__":
+    main()
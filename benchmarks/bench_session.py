@@ -0,0 +1,52 @@
+"""Benchmark of memory per user: a `Session` of a shared `CommandSystem` against a `CommandSystem` per user.
+
+Run: `python benchmarks/bench_session.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import tracemalloc
+
+from typing import Any, Callable, List
+
+import untils
+
+USERS: int = 10_000
+"""Count of users."""
+
+def measure(create: Callable[[], Any]) -> float:
+    """Returns allocated bytes per created object."""
+
+    objects: List[Any] = []
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    for _ in range(USERS):
+        objects.append(create())
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return (after - before) / USERS
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    config: untils.CommandsConfig = untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__base__": ["look"], "fight": ["hit"]},
+        "commands": {"look": {"aliases": ["l"], "type": "word"}, "hit": {"aliases": ["h"], "type": "word"}}
+    })
+    shared: untils.CommandSystem = untils.CommandSystem(untils.Settings(), config)
+    note: untils.HistoryNote = ("look", untils.ParsedInput(["look"]))
+
+    def session_with_history() -> untils.Session:
+        session: untils.Session = shared.create_session("fight")
+        for _ in range(10):
+            session.history.append(note)
+        return session
+
+    print(f"empty session {measure(shared.create_session):,.0f} bytes")
+    print(f"session with 10 notes {measure(session_with_history):,.0f} bytes")
+    print(f"command system per user {measure(lambda: untils.CommandSystem(untils.Settings(), config)):,.0f} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Benchmark of `CommandSystem.suggest` against a linear scan with `get_edit_distance` for growing configs.
+
+Run: `python benchmarks/bench_suggestions.py` from the repository root with `untils` importable.
+"""
+
+# pylint: disable=line-too-long
+
+import random
+import time
+import timeit
+
+from typing import Any, Dict, List
+
+import untils
+
+SIZES = (100, 1_000, 10_000)
+"""Counts of root commands."""
+CALLS: int = 200
+"""Count of timed suggestions."""
+
+def make_command_system(roots: int) -> untils.CommandSystem:
+    """Returns a command system with `roots` random root command names."""
+
+    rng: random.Random = random.Random(roots)
+    names = {"".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))) for _ in range(roots)}
+    commands: Dict[str, Any] = {name: {"aliases": [], "type": "word"} for name in names}
+
+    return untils.CommandSystem(untils.Settings(), untils.Parser.parse_config(
+        {"version": 1, "states": {"__base__": list(commands)}, "commands": commands}
+    ))
+
+def main() -> None:
+    """Runs the benchmark."""
+
+    for roots in SIZES:
+        command_system: untils.CommandSystem = make_command_system(roots)
+        names: List[str] = command_system.get_all_commands_str()
+        typo: untils.ParsedInput = command_system.process_input(names[0][::-1])
+
+        start: float = time.perf_counter()
+        command_system.suggest(typo)
+        build: float = time.perf_counter() - start
+
+        tree: float = timeit.timeit(lambda: command_system.suggest(typo), number=CALLS) / CALLS
+        word: str = typo["path"][0]
+        scan: float = timeit.timeit(lambda: sorted(name for name in names if untils.get_edit_distance(word, name) <= 2)[:3], number=3) / 3
+        print(f"{roots:>6,} roots: build {build * 1e3:8.1f} ms, deletion index {tree * 1e3:7.2f} ms, linear scan {scan * 1e3:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -7,16 +7,32 @@ from untils.utils import *
 
 from untils.command_system import *
 from untils.command import *
+from untils.command_trie import *
+from untils.command_executor import *
+from untils.command_graph import *
 from untils.commands_config import *
+from untils.completion import *
+from untils.config_cache import *
 from untils.config_validator import *
+from untils.config_watcher import *
+from untils.diagnostics import *
 from untils.factories import *
+from untils.history import *
+from untils.history_log import *
+from untils.input_cache import *
 from untils.input_token import *
 from untils.input_validator import *
 from untils.ioreader import *
 from untils.iovalidator import *
+from untils.parsed_input import *
 from untils.parser import *
 from untils.processor import *
+from untils.repl import *
+from untils.route_index import *
+from untils.script_runner import *
+from untils.session import *
 from untils.settings import *
+from untils.suggestions import *
 from untils.tokenizer import *
 
 __version__ = "1.0.1"
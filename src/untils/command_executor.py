@@ -0,0 +1,294 @@
+"""command_executor.py - Thread pool executor of commands."""
+
+from typing import Callable, Deque, Dict, Hashable, Optional, Sequence, Union
+from types import TracebackType
+from dataclasses import dataclass
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import contextvars
+import queue
+import threading
+import time
+
+from untils.utils.type_aliases import InputDict, CallableCommand
+from untils.parsed_input import ParsedInput
+
+@dataclass
+class ExecutorStats:
+    """Counters of `CommandExecutor`."""
+
+    submitted: int = 0
+    """Count of accepted commands."""
+    rejected: int = 0
+    """Count of commands, which were rejected on the full queue."""
+    completed: int = 0
+    """Count of finished commands, including failed ones."""
+    failed: int = 0
+    """Count of commands, which raised exceptions."""
+    queue_depth: int = 0
+    """Count of accepted commands, which are not finished."""
+    max_queue_depth: int = 0
+    """Max reached queue depth."""
+    wait_time: float = 0.0
+    """Total time of commands from submission to start in seconds."""
+    max_wait_time: float = 0.0
+    """Max time of a command from submission to start in seconds."""
+
+    @property
+    def mean_wait_time(self) -> float:
+        """Mean time of finished commands from submission to start in seconds."""
+
+        return self.wait_time / self.completed if self.completed else 0.0
+
+class _Task:
+    """A submitted command."""
+
+    __slots__ = ["func", "input_str", "input_dict", "key", "future", "submitted", "context"]
+
+    func: CallableCommand
+    """The command function."""
+    input_str: str
+    """The input string."""
+    input_dict: Union[InputDict, ParsedInput]
+    """The input dict."""
+    key: Optional[Hashable]
+    """The serialization key."""
+    future: "Future[None]"
+    """Future of the command."""
+    submitted: float
+    """Time of submission."""
+    context: contextvars.Context
+    """Context of submission, where the command runs."""
+
+    def __init__(
+        self,
+        func: CallableCommand,
+        input_str: str,
+        input_dict: Union[InputDict, ParsedInput],
+        key: Optional[Hashable]
+    ) -> None:
+        self.func = func
+        self.input_str = input_str
+        self.input_dict = input_dict
+        self.key = key
+        self.future = Future()
+        self.submitted = time.perf_counter()
+        self.context = contextvars.copy_context()
+
+class CommandExecutor:
+    """Bounded thread pool executor of command functions.
+
+    Commands run in the context of their submission, so they see the active `Session`. Commands with the same serialization key run one by one in submission order, other commands overlap. A waiting command of a key doesn't hold a thread, it is started by the thread of the previous one. Submission blocks or fails with `queue.Full`, when `max_queue` commands are not finished.
+    """
+
+    __slots__ = ["pool", "max_queue", "key_func", "stats", "_slots", "_lock", "_chains", "_is_shutdown"]
+
+    pool: ThreadPoolExecutor
+    """Thread pool of commands."""
+    max_queue: int
+    """Max count of not finished commands."""
+    key_func: Optional[Callable[[Sequence[str]], Optional[Hashable]]]
+    """Returns a serialization key by a normalized path. Commands are not serialized by default."""
+    stats: ExecutorStats
+    """Counters of the executor."""
+    _slots: threading.BoundedSemaphore
+    """Free places in the queue."""
+    _lock: threading.Lock
+    """Lock of counters and chains."""
+    _chains: Dict[Hashable, Deque[_Task]]
+    """Waiting commands by serialization keys, which have a running command."""
+    _is_shutdown: bool
+    """Is `shutdown` called."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int]=None,
+        max_queue: int=128,
+        key_func: Optional[Callable[[Sequence[str]], Optional[Hashable]]]=None
+    ) -> None:
+        """
+        Args:
+            max_workers: Count of threads. By default is chosen by `ThreadPoolExecutor`.
+            max_queue: Max count of not finished commands.
+            key_func: Returns a serialization key by a normalized path, for example `CommandExecutor.root_key`. Commands are not serialized by default.
+        """
+
+        self.pool = ThreadPoolExecutor(max_workers, "untils-command")
+        self.max_queue = max_queue
+        self.key_func = key_func
+        self.stats = ExecutorStats()
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._lock = threading.Lock()
+        self._chains = {}
+        self._is_shutdown = False
+
+    @staticmethod
+    def root_key(normalized_path: Sequence[str]) -> Optional[Hashable]:
+        """Serialization key by the root command of a normalized path.
+
+        Args:
+            normalized_path: The normalized path.
+
+        Returns:
+            The root command name, else `None`.
+        """
+
+        return normalized_path[0] if normalized_path else None
+
+    def get_key(self, normalized_path: Sequence[str]) -> Optional[Hashable]:
+        """Returns a serialization key of a normalized path with `key_func`.
+
+        Args:
+            normalized_path: The normalized path.
+
+        Returns:
+            The key, `None` if the command is not serialized.
+        """
+
+        return None if self.key_func is None else self.key_func(normalized_path)
+
+    def submit(
+        self,
+        func: CallableCommand,
+        input_str: str,
+        input_dict: Union[InputDict, ParsedInput],
+        key: Optional[Hashable]=None,
+        block: bool=True,
+        timeout: Optional[float]=None
+    ) -> "Future[None]":
+        """Submits a command function.
+
+        Args:
+            func: The command function.
+            input_str: The input string.
+            input_dict: The input dict.
+            key: The serialization key. Commands with the same key run one by one, `None` is not serialized.
+            block: Is wait for a free place in the full queue, else fail immediately.
+            timeout: Max wait time for a free place in seconds. Not limited by default.
+
+        Returns:
+            Future of the command with its exception if raised.
+
+        Raises:
+            queue.Full: If the queue is full after waiting.
+
+            RuntimeError: If the executor is shut down.
+        """
+
+        if self._is_shutdown:
+            raise RuntimeError("command executor is shut down")
+
+        if not self._slots.acquire(block, timeout):
+            with self._lock:
+                self.stats.rejected += 1
+            raise queue.Full
+
+        task: _Task = _Task(func, input_str, input_dict, key)
+
+        with self._lock:
+            if self._is_shutdown:
+                self._slots.release()
+                raise RuntimeError("command executor is shut down")
+
+            self.stats.submitted += 1
+            self.stats.queue_depth += 1
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+
+            if key is not None:
+                chain: Optional[Deque[_Task]] = self._chains.get(key)
+                if chain is not None:
+                    chain.append(task)
+                    return task.future
+                self._chains[key] = deque()
+
+        try:
+            self.pool.submit(self._run, task)
+        except BaseException as e:
+            # The pool may be shut down directly.
+            self._abandon(task, e)
+            raise
+
+        return task.future
+
+    def shutdown(self, wait: bool=True) -> None:
+        """Stops the executor. New commands are not accepted, running commands still start waiting commands of their keys.
+
+        Args:
+            wait: Is wait for all submitted commands.
+        """
+
+        with self._lock:
+            self._is_shutdown = True
+
+        self.pool.shutdown(wait)
+
+    def _abandon(self, task: _Task, error: BaseException) -> None:
+        """Rolls back a command, which the pool didn't accept, and fails commands, which wait for it.
+
+        Args:
+            task: The command.
+            error: The error of the pool.
+        """
+
+        with self._lock:
+            waiting: Deque[_Task] = deque()
+            if task.key is not None:
+                waiting = self._chains.pop(task.key, waiting)
+
+            self.stats.submitted -= 1 + len(waiting)
+            self.stats.queue_depth -= 1 + len(waiting)
+
+        self._slots.release()
+        for waiting_task in waiting:
+            waiting_task.future.set_exception(error)
+            self._slots.release()
+
+    def _run(self, task: _Task) -> None:
+        """Runs a command and then waiting commands of its key in the same thread."""
+
+        next_task: Optional[_Task] = task
+        while next_task is not None:
+            task = next_task
+            next_task = None
+            wait_time: float = time.perf_counter() - task.submitted
+            is_failed: bool = False
+
+            if task.future.set_running_or_notify_cancel():
+                try:
+                    task.context.run(task.func, task.input_str, task.input_dict)
+                except BaseException as e:    # pylint: disable=broad-exception-caught
+                    is_failed = True
+                    task.future.set_exception(e)
+                else:
+                    task.future.set_result(None)
+
+            with self._lock:
+                self.stats.completed += 1
+                self.stats.failed += is_failed
+                self.stats.queue_depth -= 1
+                self.stats.wait_time += wait_time
+                self.stats.max_wait_time = max(self.stats.max_wait_time, wait_time)
+
+                if task.key is not None:
+                    chain: Deque[_Task] = self._chains[task.key]
+                    if chain:
+                        next_task = chain.popleft()
+                    else:
+                        del self._chains[task.key]
+
+            self._slots.release()
+
+    def __enter__(self) -> "CommandExecutor":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        self.shutdown()
+
+__all__ = ["CommandExecutor", "ExecutorStats"]
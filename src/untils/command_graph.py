@@ -0,0 +1,123 @@
+"""command_graph.py - Compiled command graph for input validation."""
+
+from typing import Dict, List, FrozenSet, Set, Sequence, Tuple
+
+from dataclasses import dataclass, field
+
+from untils.utils.enums import InternalState
+
+from untils.command import StateNode, CommandNode
+from untils.command_trie import CommandTrieNode
+
+@dataclass(frozen=True, eq=False)
+class CommandGraph:
+    """Immutable graph of the commands config.
+
+    Legal flags and options are indexed in nodes of the command tree, allowed root commands are indexed by states, so an input is validated with set operations. Available root commands are precomputed by states in config order.
+    """
+
+    root: CommandTrieNode
+    """The root node of the command tree."""
+    states: Dict[str, FrozenSet[str]]
+    """Allowed root commands by state names, including `__base__` commands."""
+    base: FrozenSet[str]
+    """Allowed root commands for unknown states."""
+    commands: Tuple[CommandNode, ...] = ()
+    """All `Word` and `Fallback` root commands in config order."""
+    available: Dict[str, Tuple[CommandNode, ...]] = field(default_factory=dict)    # pyright: ignore[reportUnknownVariableType]
+    """Allowed `Word` and `Fallback` root commands in config order by state names."""
+    available_names: Dict[str, Tuple[str, ...]] = field(default_factory=dict)    # pyright: ignore[reportUnknownVariableType]
+    """Names of allowed `Word` and `Fallback` root commands in config order by state names."""
+    available_base: Tuple[CommandNode, ...] = ()
+    """Allowed `Word` and `Fallback` root commands for unknown states."""
+    available_base_names: Tuple[str, ...] = ()
+    """Names of allowed `Word` and `Fallback` root commands for unknown states."""
+
+    def get_roots(self, state: str) -> FrozenSet[str]:
+        """Returns allowed root commands in a state.
+
+        Args:
+            state: The state name.
+
+        Returns:
+            Original names of allowed root commands.
+        """
+
+        return self.states.get(state, self.base)
+
+    def get_available(self, state: str) -> Tuple[CommandNode, ...]:
+        """Returns allowed `Word` and `Fallback` root commands in a state.
+
+        Args:
+            state: The state name.
+
+        Returns:
+            Command nodes in config order.
+        """
+
+        return self.available.get(state, self.available_base)
+
+    def get_available_names(self, state: str) -> Tuple[str, ...]:
+        """Returns names of allowed `Word` and `Fallback` root commands in a state.
+
+        Args:
+            state: The state name.
+
+        Returns:
+            Command names in config order.
+        """
+
+        return self.available_names.get(state, self.available_base_names)
+
+    @staticmethod
+    def build(
+        root: CommandTrieNode,
+        states: List[StateNode],
+        commands: Sequence[CommandNode]=()
+    ) -> "CommandGraph":
+        """Compiles a command graph.
+
+        `__base__` commands are allowed in a state, if `__base__` is written before the state.
+
+        Args:
+            root: The root node of the command tree.
+            states: The parsed states.
+            commands: The parsed root commands.
+
+        Returns:
+            The command graph.
+        """
+
+        base: Set[str] = set()
+        allowed: Dict[str, FrozenSet[str]] = {}
+
+        for state_node in states:
+            if state_node.name not in allowed:
+                allowed[state_node.name] = frozenset(base.union(state_node.commands))
+            if state_node.is_internal and state_node.name == InternalState.BASE.value:
+                base.update(state_node.commands)
+
+        words: Tuple[CommandNode, ...] = tuple(
+            command for command in commands if command.type in ("word", "fallback")
+        )
+        available: Dict[str, Tuple[CommandNode, ...]] = {
+            state: tuple(command for command in words if command.name in names)
+            for state, names in allowed.items()
+        }
+        available_base: Tuple[CommandNode, ...] = tuple(command for command in words if command.name in base)
+
+        return CommandGraph(
+            root,
+            allowed,
+            frozenset(base),
+            words,
+            available,
+            {state: tuple(command.name for command in nodes) for state, nodes in available.items()},
+            available_base,
+            tuple(command.name for command in available_base)
+        )
+
+    def __str__(self) -> str:
+        return f"CommandGraph(states={list(self.states)})"
+
+__all__ = ["CommandGraph"]
@@ -2,62 +2,174 @@
 
 # pyright: reportUnnecessaryIsInstance=false
 
-from typing import Optional, List, Union, cast, Dict, Tuple
-
-from untils.utils.type_aliases import InputDict, CommandPath, CallableCommand, CommandHistory
+from typing import (
+    Optional, List, Union, Dict, Tuple, Mapping, Sequence, Iterator, Iterable, Awaitable, TextIO, BinaryIO, Any,
+    TYPE_CHECKING
+)
+from types import TracebackType
+
+import asyncio
+import concurrent.futures
+import contextvars
+import inspect
+import os
+import sys
+
+from untils.utils.type_aliases import InputDict, CommandPath, CallableCommand, CommandHistory, ConfigSupportedExtensions
 from untils.utils.constants import Strings
+from untils.utils.enums import InternalState, WarningsLevel
 
 from untils.commands_config import CommandsConfig
+from untils.parsed_input import ParsedInput
 from untils.settings import Settings
+from untils.diagnostics import Diagnostics
 from untils.processor import Processor
 from untils.input_validator import ParsedInputValidator
-from untils.command import CommandNode, CommandWordNode, CommandFallbackNode
+from untils.command import CommandNode
+from untils.command_trie import CommandTrieNode
+from untils.route_index import RouteIndex, RouteTable
+from untils.input_cache import InputCache
+from untils.history import HistoryBuffer, HistoryColumn, search_inputs
+from untils.history_log import HistoryLog
+from untils.command_executor import CommandExecutor
+from untils.session import Session
+from untils.completion import Completion, CompletionIndex
+from untils.suggestions import Suggestion, SuggestionIndex
+from untils.config_cache import ConfigCache
+
+if TYPE_CHECKING:
+    from untils.script_runner import ScriptSummary
 
 class CommandSystem:
     """Core class with command config, API, processing and much more."""
 
-    __slots__ = ["settings", "config", "route", "history"]
+    __slots__ = [
+        "settings", "config", "_route", "route_index", "_route_version", "history", "input_cache", "history_log",
+        "command_executor", "completion_index", "suggestion_index", "config_cache"
+    ]
 
     settings: Settings
     config: Optional[CommandsConfig]
-    route: Dict[CommandPath, CallableCommand]
+    _route: RouteTable
+    route_index: RouteIndex
+    _route_version: int
     history: CommandHistory
+    input_cache: Optional[InputCache]
+    history_log: Optional[HistoryLog]
+    command_executor: Optional[CommandExecutor]
+    completion_index: Optional[CompletionIndex]
+    suggestion_index: Optional[SuggestionIndex]
+    config_cache: Optional[ConfigCache]
 
     def __init__(
         self,
         settings: Settings,
         config: Optional[CommandsConfig]=None,
-        history: Optional[CommandHistory]=None
+        history: Optional[CommandHistory]=None,
+        input_cache: Optional[InputCache]=None,
+        history_log: Optional[HistoryLog]=None,
+        command_executor: Optional[CommandExecutor]=None,
+        config_cache: Optional[ConfigCache]=None
     ) -> None:
         """
         Args:
             settings: A `Settings` object as context.
             config: A `Config` object as configuration.
             history: A command history object.
+            input_cache: A cache of processed inputs. Inputs are not cached by default.
+            history_log: A persistent log of command history. The newest notes of the log are restored to empty history.
+            command_executor: A thread pool executor of commands for `submit`.
+            config_cache: An on-disk cache of compiled configs for `load_config`. Configs are not cached by default.
         """
 
         self.settings = settings
         self.config = config
-        self.route = {}
+        self._route = RouteTable()
+        self.route_index = RouteIndex()
+        self._route_version = self._route.version
         self.history = {
             "max_size": 100,
             "is_write_overflow": True,
             "notes": []
         } if history is None else history
+        self.input_cache = input_cache
+        self.history_log = history_log
+        self.command_executor = command_executor
+        self.completion_index = None
+        self.suggestion_index = None
+        self.config_cache = config_cache
+
+        buffer: HistoryBuffer = self.get_history_buffer()
+        if history_log is not None and len(buffer) == 0:
+            for i in range(max(len(history_log) - buffer.max_size, 0), len(history_log)):
+                buffer.append(history_log[i])
+
+    @property
+    def route(self) -> RouteTable:
+        """The command routing. It can be changed directly, `route_index` is rebuilt then. A plain dictionary is copied to a `RouteTable` on assignment."""
+
+        return self._route
+
+    @route.setter
+    def route(self, route: Dict[CommandPath, CallableCommand]) -> None:
+        self._route = route if isinstance(route, RouteTable) else RouteTable(route)
 
     def is_config_loaded(self) -> bool:
         """Returns a `bool` value, what determines is config loaded."""
 
         return self.config is not None
 
-    def load_config(self, config_path: str) -> None:
-        """Loads a `CommandsConfig` object.
+    def load_config(self, config_path: str, is_streaming: bool=False) -> None:
+        """Loads a `CommandsConfig` object. The config is loaded with `config_cache`, if it is set.
         
         Args:
             config_path: Path of config file.
+            is_streaming: Is the config read incrementally with `Processor.load_config_streaming` for lower peak memory.
+        """
+
+        if self.config_cache is not None:
+            self.config = self.config_cache.load_config(self.settings, config_path, is_streaming)
+        elif is_streaming:
+            self.config = Processor.load_config_streaming(self.settings, config_path)
+        else:
+            self.config = Processor.load_config(self.settings, config_path)
+        if self.input_cache is not None:
+            self.input_cache.clear()
+
+    def load_config_from_mapping(self, config_dict: Mapping[str, Any]) -> None:
+        """Loads a `CommandsConfig` object from a raw config mapping with `Processor.load_config_from_mapping`.
+        
+        Args:
+            config_dict: The raw config.
+        """
+
+        self.set_config(Processor.load_config_from_mapping(self.settings, config_dict))
+
+    def load_config_from_bytes(self, data: Union[bytes, str], extension: ConfigSupportedExtensions=".json") -> None:
+        """Loads a `CommandsConfig` object from an encoded config with `Processor.load_config_from_bytes`.
+        
+        Args:
+            data: The encoded config.
+            extension: Format of the config, as an extension of a config file.
         """
 
-        self.config = Processor.load_config(self.settings, config_path)
+        self.set_config(Processor.load_config_from_bytes(self.settings, data, extension))
+
+    def load_config_from_stream(
+        self,
+        stream: Union[BinaryIO, TextIO],
+        extension: ConfigSupportedExtensions=".json",
+        is_streaming: bool=False
+    ) -> None:
+        """Loads a `CommandsConfig` object from a readable file object with `Processor.load_config_from_stream`.
+        
+        Args:
+            stream: The binary or text file object.
+            extension: Format of the config, as an extension of a config file.
+            is_streaming: Is the config read incrementally.
+        """
+
+        self.set_config(Processor.load_config_from_stream(self.settings, stream, extension, is_streaming))
 
     def set_config(self, config: Optional[CommandsConfig]) -> None:
         """Sets an already processed config or deletes exist.
@@ -67,9 +179,11 @@ class CommandSystem:
         """
 
         self.config = config
+        if self.input_cache is not None:
+            self.input_cache.clear()
 
-    def process_input(self, input_str: str) -> InputDict:
-        """Processes a user input and returns `InputDict` as input representation.
+    def process_input(self, input_str: str) -> ParsedInput:
+        """Processes a user input and returns `ParsedInput` as input representation. Inputs without warnings are cached in `input_cache`, if it is set.
         
         Args:
             input_str: Input raw string.
@@ -78,9 +192,35 @@ class CommandSystem:
             An input representation.
         """
 
-        return Processor.process_input(self.settings, self.config, input_str)
+        if self.input_cache is None:
+            return Processor.process_input(self.settings, self.config, input_str)
+
+        parsed_input: Optional[ParsedInput] = self.input_cache.get(self.config, input_str)
+        if parsed_input is not None:
+            return parsed_input
+
+        with self.settings.collect_diagnostics(is_silent=False) as diagnostics:
+            parsed_input = Processor.process_input(self.settings, self.config, input_str)
+
+        if diagnostics.warnings_count == 0:
+            # Inputs with warnings are not cached, so warnings are issued on every call.
+            self.input_cache.put(self.config, input_str, parsed_input)
 
-    def is_input_valid(self, input_dict: InputDict) -> bool:
+        return parsed_input
+
+    def process_input_with_diagnostics(self, input_str: str) -> Tuple[ParsedInput, Diagnostics]:
+        """Processes a user input and collects warnings instead of issuing them.
+        
+        Args:
+            input_str: Input raw string.
+        
+        Returns:
+            An input representation and collected warnings.
+        """
+
+        return Processor.process_input_with_diagnostics(self.settings, self.config, input_str)
+
+    def is_input_valid(self, input_dict: Union[InputDict, ParsedInput]) -> bool:
         """Validates an input.
         
         Args:
@@ -97,7 +237,7 @@ class CommandSystem:
 
         return False
 
-    def get_normalized_path(self, input_dict: InputDict) -> List[str]:
+    def get_normalized_path(self, input_dict: Union[InputDict, ParsedInput]) -> List[str]:
         """Returns original key-names in config by `path` in `input_dict`.
         
         Args:
@@ -111,28 +251,17 @@ class CommandSystem:
             self.settings.logger.warning(Strings.LOG_CONFIG_NOT_LOADED)
             return []
 
-        input_path: List[str] = input_dict["path"]
-        commands: List[CommandNode] = self.config.commands
+        input_path: Sequence[str] = input_dict["path"]
+        node: CommandTrieNode = self.config.trie
         result: List[str] = []
 
         self.settings.logger.info(Strings.LOG_CALCULATE_NORMALIZED_PATH_START)
 
         for part in input_path:
-            for command in commands:
-                if command.type == "word":
-                    command = cast(CommandWordNode, command)
-                    if (
-                        part == command.name
-                        or part in [alias.alias_name for alias in command.aliases]
-                    ):
-                        result.append(command.name)
-                        commands = command.children
-                        break
-                elif command.type == "fallback":
-                    command = cast(CommandFallbackNode, command)
-                    result.append(command.name)
-                    commands = command.children
-                    break
+            child: Optional[CommandTrieNode] = node.get_child(part)
+            if child is not None:
+                result.append(child.name)
+                node = child
 
         self.settings.logger.info(Strings.LOG_CALCULATE_NORMALIZED_PATH_END)
 
@@ -145,13 +274,7 @@ class CommandSystem:
             self.settings.logger.warning(Strings.LOG_CONFIG_NOT_LOADED)
             return []
 
-        result: List[CommandNode] = []
-
-        for command in self.config.commands:
-            if command.type in ("word", "fallback"):
-                result.append(command)
-
-        return result
+        return list(self.config.graph.commands)
 
     def get_all_commands_str(self) -> List[str]:
         """Returns all commands as name strings."""
@@ -160,58 +283,92 @@ class CommandSystem:
             self.settings.logger.warning(Strings.LOG_CONFIG_NOT_LOADED)
             return []
 
-        result: List[str] = []
+        return [command.name for command in self.config.graph.commands]
 
-        for command in self.config.commands:
-            if command.type in ("word", "fallback"):
-                result.append(command.name)
+    def get_available_commands(self) -> List[CommandNode]:
+        """Returns all available commands in current state, including `__base__` commands, as command nodes.
 
-        return result
+        Commands are precomputed by states with the config.
+        """
 
-    def get_available_commands(self) -> List[CommandNode]:
-        """Returns all available commands in current state as command nodes."""
+        if self.config is None:
+            self.settings.logger.warning(Strings.LOG_CONFIG_NOT_LOADED)
+            return []
+
+        return list(self.config.graph.get_available(self.settings.current_state))
+
+    def get_available_commands_str(self) -> List[str]:
+        """Returns all available commands in current state, including `__base__` commands, as name strings.
+
+        Names are precomputed by states with the config.
+        """
 
         if self.config is None:
             self.settings.logger.warning(Strings.LOG_CONFIG_NOT_LOADED)
             return []
 
-        result: List[CommandNode] = []
+        return list(self.config.graph.get_available_names(self.settings.current_state))
 
-        for command in self.config.commands:
-            if command.type in ("word", "fallback"):
-                for state in self.config.states:
-                    if command.name in state.commands:
-                        result.append(command)
+    def complete(self, line: str, limit: int=10) -> List[Completion]:
+        """Completes the last word of a partial input line with commands, flags and options, which are legal in current state.
 
-        return result
+        The completion index is built lazily for the current config.
+        
+        Args:
+            line: The partial input line.
+            limit: Max count of completions.
 
-    def get_available_commands_str(self) -> List[str]:
-        """Returns all available commands in current state as name strings."""
+        Returns:
+            Ranked completions.
+        """
 
         if self.config is None:
             self.settings.logger.warning(Strings.LOG_CONFIG_NOT_LOADED)
             return []
 
-        result: List[str] = []
+        if self.completion_index is None or self.completion_index.config is not self.config:
+            self.completion_index = CompletionIndex(self.config)
 
-        for command in self.config.commands:
-            if command.type in ("word", "fallback"):
-                for state in self.config.states:
-                    if command.name in state.commands:
-                        result.append(command.name)
+        return self.completion_index.complete(line, self.settings.current_state, limit)
 
-        return result
+    def suggest(
+        self,
+        input_dict: Union[InputDict, ParsedInput],
+        limit: int=3,
+        max_distance: int=2
+    ) -> List[Suggestion]:
+        """Suggests the closest command names and aliases for the first unknown part of an input path, which is legal in current state.
+
+        The suggestion index is built lazily for the current config.
+        
+        Args:
+            input_dict: A processed input.
+            limit: Max count of suggestions.
+            max_distance: Max edit distance.
+
+        Returns:
+            Ranked suggestions, empty if the path is known.
+        """
+
+        if self.config is None:
+            self.settings.logger.warning(Strings.LOG_CONFIG_NOT_LOADED)
+            return []
+
+        if self.suggestion_index is None or self.suggestion_index.config is not self.config:
+            self.suggestion_index = SuggestionIndex(self.config)
+
+        return self.suggestion_index.suggest(input_dict["path"], self.settings.current_state, limit, max_distance)
 
     def access_path(
         self,
-        input_dict: Union[InputDict, List[str]],
+        input_dict: Union[InputDict, ParsedInput, Sequence[str]],
         path: CommandPath,
         is_inclusive: bool=True
     ) -> bool:
         """Validates command path by input.
         
         Args:
-            input_dict: A parsed input dict. Accepts `InputDict` for a path and `List[str]` only for a path.
+            input_dict: A parsed input dict. Accepts `InputDict` or `ParsedInput` for a path and `Sequence[str]` only for a path.
             path: A command path, which determines all posible correct ways in path.
             is_inclusive: Always returns `False` if length of two paths are different. This argument changes validation mode: `False` (determines any command input from deferred path) and `True` (determines a single variant for command tree branching).
         
@@ -219,10 +376,10 @@ class CommandSystem:
             `False` if input path is mispath. `True` if input path equals the deferred path.
         """
 
-        if isinstance(input_dict, dict):
-            input_path: List[str] = input_dict["path"]
-        elif isinstance(input_dict, list):
-            input_path: List[str] = input_dict
+        if isinstance(input_dict, (list, tuple)):
+            input_path: Sequence[str] = input_dict
+        elif isinstance(input_dict, Mapping):
+            input_path: Sequence[str] = input_dict["path"]
         else:
             return False
 
@@ -268,10 +425,13 @@ class CommandSystem:
             `False` if path in the command routing. `True` if path not in the command routing and was added.
         """
 
-        if path in self.route:
+        if path in self._route:
             return False
 
-        self.route[path] = func
+        route_index: RouteIndex = self.get_route_index()
+        self._route[path] = func
+        route_index.add(path)
+        self._route_version = self._route.version
         return True
 
     def change_command(self, path: CommandPath, func: CallableCommand) -> bool:
@@ -301,75 +461,205 @@ class CommandSystem:
             `False` if path not in the command routing. `True` if path in the command routing and was deleted.
         """
 
-        if path not in self.route:
+        if path not in self._route:
             return False
 
-        del self.route[path]
+        route_index: RouteIndex = self.get_route_index()
+        del self._route[path]
+        route_index.remove(path)
+        self._route_version = self._route.version
         return True
 
-    def get_history(self) -> List[Tuple[str, InputDict]]:
+    def resolve_command(self, normalized_path: Sequence[str]) -> Optional[CallableCommand]:
+        """Finds a command in the command routing for a normalized path. The most specific command path wins, see `RouteIndex`.
+        
+        Args:
+            normalized_path: A normalized path.
+        
+        Returns:
+            `CallableCommand` if a command path matches the normalized path. `None` if no command path matches.
+        """
+
+        path: Optional[CommandPath] = self.get_route_index().resolve(normalized_path)
+        if path is None:
+            return None
+
+        return self._route[path]
+
+    def get_route_index(self) -> RouteIndex:
+        """Returns `route_index`, which is rebuilt if command paths of the command routing were changed directly.
+        
+        Returns:
+            The route index of the current command paths.
+        """
+
+        if self._route_version != self._route.version:
+            self.route_index = RouteIndex(list(self._route))
+            self._route_version = self._route.version
+
+        return self.route_index
+
+    def get_history_buffer(self) -> HistoryBuffer:
+        """Returns the ring buffer of command history with limits from `history`, or history of the active `Session`.
+
+        Notes of a plain list are moved to a new buffer. The buffer is resized if limits in `history` were changed.
+        
+        Returns:
+            The history buffer.
+        """
+
+        session: Optional[Session] = Session.get_current()
+        if session is not None:
+            return session.history
+
+        notes: Sequence[Tuple[str, Union[InputDict, ParsedInput]]] = self.history["notes"]
+        max_bytes: Optional[int] = self.history.get("max_bytes")
+
+        if not isinstance(notes, HistoryBuffer):
+            notes = HistoryBuffer(
+                self.history["max_size"],
+                ((note[0], ParsedInput.from_dict(note[1])) for note in notes),
+                max_bytes
+            )
+            self.history["notes"] = notes
+        elif notes.max_size != self.history["max_size"] or notes.max_bytes != max_bytes:
+            notes.resize(self.history["max_size"], max_bytes)
+
+        return notes
+
+    def get_history_log(self) -> Optional[HistoryLog]:
+        """Returns the persistent log of command history, which is used out of sessions.
+
+        Returns:
+            `history_log`, `None` if a `Session` is active, so session history is never written to the shared log.
+        """
+
+        if Session.get_current() is not None:
+            return None
+        return self.history_log
+
+    def create_session(
+        self,
+        current_state: Union[str, InternalState]=InternalState.INIT,
+        warnings_level: Optional[WarningsLevel]=None
+    ) -> Session:
+        """Creates a session with history limits from `history`. Activate it with `Session.activate`.
+
+        Args:
+            current_state: Initial commands state. Internal states except `__init__` are rejected as by `Settings.current_state`, then `__init__` is used.
+            warnings_level: Warnings level of the session. The settings warnings level is used by default.
+
+        Returns:
+            The session.
+
+        Raises:
+            ValueError: If the state is rejected with the strict warnings level.
+        """
+
+        state: str = Session.get_state_name(current_state)
+        if not Session.is_state_allowed(state):
+            self.settings.warning(
+                Strings.INVALID_INTERNAL_STATE_CHANGE,
+                Strings.AUTO_CORRECT_TO_DEFAULTS,
+                RuntimeWarning,
+                ValueError,
+                state=state
+            )
+            state = InternalState.INIT.value
+
+        return Session(
+            state,
+            warnings_level,
+            HistoryBuffer(self.history["max_size"], max_bytes=self.history.get("max_bytes"))
+        )
+
+    def get_history(self) -> HistoryBuffer:
         """Returns all notes from command history.
         
         Returns:
-            List from tuples with input string and parsed input dict.
+            Live view of tuples with input string and parsed input from the oldest.
         """
 
-        return self.history["notes"]
+        return self.get_history_buffer()
 
-    def get_history_input(self) -> List[str]:
+    def get_history_input(self) -> Sequence[str]:
         """Returns all input strings from command history.
         
         Returns:
-            List with input string.
+            Live view of input strings from the oldest. Input strings of the history log are read from disk, if it is set and no `Session` is active.
         """
 
-        return [note[0] for note in self.history["notes"]]
+        history_log: Optional[HistoryLog] = self.get_history_log()
+        if history_log is not None:
+            return history_log.get_inputs()
+        return HistoryColumn(self.get_history_buffer(), 0)    # pyright: ignore[reportReturnType]
 
-    def get_history_dict(self) -> List[InputDict]:
+    def get_history_dict(self) -> HistoryColumn:
         """Returns all parsed input dicts from command history.
         
         Returns:
-            List with parsed input dict.
+            Live view of parsed inputs from the oldest.
         """
 
-        return [note[1] for note in self.history["notes"]]
+        return HistoryColumn(self.get_history_buffer(), 1)
 
-    def write_history(self, input_str: str, input_dict: InputDict) -> bool:
-        """Writes a new note to command history.
+    def write_history(self, input_str: str, input_dict: Union[InputDict, ParsedInput]) -> bool:
+        """Writes a new note to command history. Input dicts are stored as compact `ParsedInput`.
         
         Args:
             input_str: Original input string.
             input_dict: Parsed input dict.
 
         Returns:
-            `False` if max note count limit reached and overwrite disabled, else `True`.
+            `False` if max note count or size limit reached and overwrite disabled, else `True`. The oldest notes are removed on limits if overwrite enabled.
         """
 
-        if (
-            len(self.history["notes"]) >= self.history["max_size"]
-            and not self.history["is_write_overflow"]
-        ):
-            return False
+        note: Tuple[str, ParsedInput] = (input_str, ParsedInput.from_dict(input_dict))
 
-        self.history["notes"].append((input_str, input_dict))
+        if not self.get_history_buffer().append(note, self.history["is_write_overflow"]):
+            return False
+        history_log: Optional[HistoryLog] = self.get_history_log()
+        if history_log is not None:
+            history_log.append(note)
         return True
 
-    def read_history(self, index: int) -> Tuple[str, InputDict]:
+    def read_history(self, index: int) -> Tuple[str, ParsedInput]:
         """Returns a note by index in saved indexes.
         
         Args:
-            index: Positive note index by latest. Will clamped to limits.
+            index: Positive note index by latest, where `0` is the latest. Will clamped to limits.
 
         Returns:
             A note from history.
+
+        Raises:
+            IndexError: If history is empty.
         """
 
-        return self.history["notes"][max(min(0, index), self.history["max_size"] - 1)]
+        return self.get_history_buffer().get_latest(index)
+
+    def search_history(self, text: str, is_prefix: bool=False) -> Iterator[Tuple[int, str]]:
+        """Searches input strings of command history from the newest to the oldest, like reverse search of shells.
+
+        The history log is searched with `HistoryLog.search`, if it is set and no `Session` is active, else only notes in memory.
+        
+        Args:
+            text: The searched text.
+            is_prefix: Is input strings must start with the text, else contain it.
+
+        Returns:
+            Iterator of indices from the oldest and input strings of matched notes.
+        """
+
+        history_log: Optional[HistoryLog] = self.get_history_log()
+        if history_log is not None:
+            return history_log.search(text, is_prefix)
+        return search_inputs(self.get_history_input(), text, is_prefix)
 
     def execute(
         self,
         input_str: str,
-        input_dict: InputDict,
+        input_dict: Union[InputDict, ParsedInput],
         normalized_path: List[str],
         tracking: bool=True
     ) -> bool:
@@ -392,14 +682,192 @@ class CommandSystem:
             self.settings.logger.info(Strings.COMMAND_NOT_WRITTEN)
             return False
 
-        for path, func in self.route.items():
-            if self.access_path(normalized_path, path, False):
-                func(input_str, input_dict)
-                return True
+        func: Optional[CallableCommand] = self.resolve_command(normalized_path)
+        if func is not None:
+            func(input_str, input_dict)
+            return True
 
         self.settings.logger.warning(
             Strings.COMMAND_NOT_IMPLEMENTED.substitute(input_str=input_str)
         )
         return False
 
+    async def execute_async(
+        self,
+        input_str: str,
+        input_dict: Union[InputDict, ParsedInput],
+        normalized_path: List[str],
+        tracking: bool=True,
+        timeout: Optional[float]=None,
+        executor: Optional[concurrent.futures.Executor]=None
+    ) -> bool:
+        """Executes an input string with the command routing without blocking the event loop.
+
+        Coroutine functions are awaited, other functions are called in an executor. Cancellation of the call cancels the command, but a running sync function can't be interrupted and finishes in its thread. Exceptions of the command are propagated, including `TimeoutError`, which is raised by the command itself before the timeout.
+        
+        Args:
+            input_str: An input string.
+            input_dict: A cached input for validation.
+            normalized_path: A command path, which determines all posible correct ways in path.
+            tracking: Is save current command in history.
+            timeout: Max time of the command in seconds. Not limited by default.
+            executor: An executor of sync functions. The default executor of the event loop by default.
+        
+        Returns:
+            `False` if a command is not written, not in the command routing or timed out. `True` if a command was completed.
+        """
+
+        if tracking:
+            self.write_history(input_str, input_dict)
+
+        if len(normalized_path) == 0:
+            self.settings.logger.info(Strings.COMMAND_NOT_WRITTEN)
+            return False
+
+        func: Optional[CallableCommand] = self.resolve_command(normalized_path)
+        if func is None:
+            self.settings.logger.warning(
+                Strings.COMMAND_NOT_IMPLEMENTED.substitute(input_str=input_str)
+            )
+            return False
+
+        try:
+            async with asyncio.timeout(timeout) as scope:
+                await CommandSystem.call_async(func, input_str, input_dict, executor)
+        except TimeoutError:
+            if not scope.expired():
+                # Raised by the command itself.
+                raise
+            self.settings.logger.warning(
+                Strings.COMMAND_TIMED_OUT.substitute(timeout=timeout, input_str=input_str)
+            )
+            return False
+
+        return True
+
+    def submit(
+        self,
+        input_str: str,
+        input_dict: Union[InputDict, ParsedInput],
+        normalized_path: List[str],
+        tracking: bool=True,
+        block: bool=True,
+        timeout: Optional[float]=None
+    ) -> "Optional[concurrent.futures.Future[None]]":
+        """Submits an input string with the command routing to `command_executor`.
+
+        Commands are serialized by the key of `CommandExecutor.key_func` for the normalized path.
+        
+        Args:
+            input_str: An input string.
+            input_dict: A cached input for validation.
+            normalized_path: A command path, which determines all posible correct ways in path.
+            tracking: Is save current command in history.
+            block: Is wait for a free place in the full queue of the executor, else fail immediately.
+            timeout: Max wait time for a free place in seconds. Not limited by default.
+        
+        Returns:
+            `None` if a command is not written or not in the command routing, else future of the command.
+
+        Raises:
+            ValueError: If `command_executor` is not set.
+            queue.Full: If the queue of the executor is full after waiting.
+        """
+
+        if self.command_executor is None:
+            raise ValueError(Strings.COMMAND_EXECUTOR_NOT_SET)
+
+        if tracking:
+            self.write_history(input_str, input_dict)
+
+        if len(normalized_path) == 0:
+            self.settings.logger.info(Strings.COMMAND_NOT_WRITTEN)
+            return None
+
+        func: Optional[CallableCommand] = self.resolve_command(normalized_path)
+        if func is None:
+            self.settings.logger.warning(
+                Strings.COMMAND_NOT_IMPLEMENTED.substitute(input_str=input_str)
+            )
+            return None
+
+        return self.command_executor.submit(
+            func, input_str, input_dict, self.command_executor.get_key(normalized_path), block, timeout
+        )
+
+    def run_script(
+        self,
+        script: Union[str, "os.PathLike[str]", Iterable[str]],
+        chunk_size: int=1000,
+        max_workers: Optional[int]=None,
+        is_processes: bool=False,
+        tracking: bool=False,
+        output: Optional[TextIO]=sys.stdout
+    ) -> "ScriptSummary":
+        """Runs a command script with `ScriptRunner`: lines are processed on a pool and executed in order. Failed lines don't stop the script.
+
+        Args:
+            script: Path of a UTF-8 script file or lines.
+            chunk_size: Count of lines in a chunk.
+            max_workers: Count of workers. By default is chosen by the pool.
+            is_processes: Is a process pool used, else a thread pool.
+            tracking: Is save executed lines in history.
+            output: Stream of the summary. The summary is not written if it is `None`.
+
+        Returns:
+            Summary of the run.
+        """
+
+        # The runner creates command systems in workers, so it is imported here.
+        from untils.script_runner import ScriptRunner    # pylint: disable=import-outside-toplevel
+
+        return ScriptRunner(
+            self, chunk_size, max_workers, is_processes, tracking=tracking, output=output
+        ).run(script)
+
+    @staticmethod
+    async def call_async(
+        func: CallableCommand,
+        input_str: str,
+        input_dict: Union[InputDict, ParsedInput],
+        executor: Optional[concurrent.futures.Executor]=None
+    ) -> None:
+        """Calls a command function without blocking the event loop.
+
+        Args:
+            func: The command function. Coroutine functions are awaited, other functions are called in the executor and their awaitable results are awaited.
+            input_str: An input string.
+            input_dict: A cached input.
+            executor: An executor of sync functions. The default executor of the event loop by default.
+        """
+
+        result: Optional[Awaitable[None]]
+        if inspect.iscoroutinefunction(func):
+            result = func(input_str, input_dict)
+        else:
+            # The context is copied, so the active session is seen in the thread.
+            result = await asyncio.get_running_loop().run_in_executor(
+                executor, contextvars.copy_context().run, func, input_str, input_dict
+            )
+
+        if inspect.isawaitable(result):
+            await result
+
+    def close(self) -> None:
+        """Closes `history_log`, so its pending notes are written. The command system can be closed by `with` too."""
+
+        if self.history_log is not None:
+            self.history_log.close()
+
+    def __enter__(self) -> "CommandSystem":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
 __all__ = ["CommandSystem"]
@@ -0,0 +1,132 @@
+"""command_trie.py - Compiled command tree for path resolution."""
+
+from typing import Dict, List, Optional, Tuple, FrozenSet, Union, cast
+
+from dataclasses import dataclass
+
+from untils.command import (
+    CommandNode, CommandWordNode, CommandFallbackNode, CommandFlagNode, CommandOptionNode
+)
+
+@dataclass(frozen=True, eq=False)
+class CommandTrieNode:
+    """Immutable node of the compiled command tree.
+
+    Positioned children are indexed by names and aliases, so a path is resolved with a single dictionary lookup per level.
+    """
+
+    name: str
+    """Original command name. Is empty for the root."""
+    command: Optional[CommandNode]
+    """The command node. Is `None` for the root."""
+    children: List[CommandNode]
+    """All children of the command, including flags and options."""
+    words: Dict[str, "CommandTrieNode"]
+    """Positioned children by original names and aliases. Children after the first `Fallback` are unreachable, so they are not indexed."""
+    fallback: Optional["CommandTrieNode"]
+    """The first `Fallback` child."""
+    flags: FrozenSet[str]
+    """Names and aliases of `Flag` children."""
+    options: FrozenSet[str]
+    """Names and aliases of `Option` children."""
+
+    def get_child(self, name: str) -> Optional["CommandTrieNode"]:
+        """Returns a positioned child, which accepts a path part.
+
+        Args:
+            name: The path part.
+
+        Returns:
+            The child, which is found by a name or an alias, else the `Fallback` child, else `None`.
+        """
+
+        child: Optional[CommandTrieNode] = self.words.get(name)
+        if child is None:
+            return self.fallback
+        return child
+
+    @staticmethod
+    def create(
+        name: str,
+        command: Optional[CommandNode],
+        children: List[CommandNode]
+    ) -> "CommandTrieNode":
+        """Creates a node without positioned children, which are added by `CommandTrieNode.build`.
+
+        Args:
+            name: Original command name.
+            command: The command node.
+            children: All children of the command.
+
+        Returns:
+            The node with indexed flags and options.
+        """
+
+        flags: List[str] = []
+        options: List[str] = []
+
+        for child in children:
+            if child.type == "flag":
+                child = cast(CommandFlagNode, child)
+                flags.append(child.name)
+                flags.extend(alias.alias_name for alias in child.aliases)
+            elif child.type == "option":
+                child = cast(CommandOptionNode, child)
+                options.append(child.name)
+                options.extend(alias.alias_name for alias in child.aliases)
+
+        return CommandTrieNode(
+            name, command, children, {}, None, frozenset(flags), frozenset(options)
+        )
+
+    @staticmethod
+    def build(
+        commands: List[CommandNode],
+        compiled: Optional[Dict[int, "CommandTrieNode"]]=None
+    ) -> "CommandTrieNode":
+        """Compiles a command tree.
+
+        Args:
+            commands: The root commands.
+            compiled: Already compiled nodes by `id` of their command nodes, which are reused with their subtrees. Command nodes must be alive while the mapping is used.
+
+        Returns:
+            The root node.
+        """
+
+        root: CommandTrieNode = CommandTrieNode.create("", None, commands)
+        stack: List[Tuple[CommandTrieNode, List[CommandNode]]] = [(root, commands)]
+
+        while stack:
+            parent, children = stack.pop()
+
+            for command in children:
+                if command.type not in ("word", "fallback"):
+                    continue
+
+                reused: Optional[CommandTrieNode] = None if compiled is None else compiled.get(id(command))
+                node: CommandTrieNode = reused if reused is not None else CommandTrieNode.create(
+                    command.name, command, cast(Union[CommandWordNode, CommandFallbackNode], command).children
+                )
+
+                if command.type == "word":
+                    command = cast(CommandWordNode, command)
+                    parent.words.setdefault(command.name, node)
+                    for alias in command.aliases:
+                        parent.words.setdefault(alias.alias_name, node)
+                else:
+                    object.__setattr__(parent, "fallback", node)
+
+                if reused is None:
+                    stack.append((node, node.children))
+
+                if parent.fallback is not None:
+                    # Next children are unreachable.
+                    break
+
+        return root
+
+    def __str__(self) -> str:
+        return f"CommandTrieNode[{self.name}]({list(self.words)}, fallback={self.fallback})"
+
+__all__ = ["CommandTrieNode"]
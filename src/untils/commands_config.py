@@ -2,11 +2,13 @@
 
 from typing import List
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from untils.utils.type_aliases import ConfigVersion
 
 from untils.command import StateNode, CommandNode
+from untils.command_trie import CommandTrieNode
+from untils.command_graph import CommandGraph
 
 @dataclass(frozen=True)
 class CommandsConfig:
@@ -18,6 +20,16 @@ class CommandsConfig:
     """All written states. Use states for context separation."""
     commands: List[CommandNode]
     """All available commands for user."""
+    trie: CommandTrieNode = field(default=None, compare=False, repr=False)    # pyright: ignore[reportAssignmentType]
+    """Compiled command tree for path resolution. Is built from `commands`, if it is not passed."""
+    graph: CommandGraph = field(default=None, compare=False, repr=False)    # pyright: ignore[reportAssignmentType]
+    """Compiled command graph for input validation and available commands. Is built from `trie`, `states` and `commands`, if it is not passed."""
+
+    def __post_init__(self) -> None:
+        if self.trie is None:
+            object.__setattr__(self, "trie", CommandTrieNode.build(self.commands))
+        if self.graph is None:
+            object.__setattr__(self, "graph", CommandGraph.build(self.trie, self.states, self.commands))
 
     def __str__(self) -> str:
         return f"CommandsConfig(version={self.version}, states={self.states}, commands={self.commands})"
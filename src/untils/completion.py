@@ -0,0 +1,239 @@
+"""completion.py - Prefix trie completion of input lines."""
+
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from dataclasses import dataclass
+
+from untils.command_trie import CommandTrieNode
+from untils.commands_config import CommandsConfig
+
+_RANKS: Dict[str, int] = {"word": 0, "flag": 1, "option": 2}
+"""Ranks of completion kinds."""
+
+@dataclass(frozen=True)
+class Completion:
+    """A completion candidate."""
+
+    text: str
+    """Text, which replaces the last word of the input line, including `-`, `-!` or `--` for flags and options."""
+    kind: str
+    """`"word"`, `"flag"` or `"option"`."""
+    name: str
+    """Original name of the command."""
+    is_alias: bool = False
+    """Is the text an alias."""
+
+    def get_rank(self) -> Tuple[int, bool, int, str]:
+        """Returns the sort key: flags before options and names before aliases, then shorter and alphabetically first texts."""
+
+        return _RANKS[self.kind], self.is_alias, len(self.text), self.text
+
+class PrefixTrie:
+    """Prefix trie of completions, where every node keeps the best candidates of its subtree.
+
+    A lookup walks only the prefix, so it doesn't depend on count of completions.
+    """
+
+    __slots__ = ["children", "top"]
+
+    children: Dict[str, "PrefixTrie"]
+    """Children by characters."""
+    top: List[Completion]
+    """Best ranked completions of the subtree."""
+
+    def __init__(self) -> None:
+        self.children = {}
+        self.top = []
+
+    def insert(self, key: str, completion: Completion, max_candidates: int) -> None:
+        """Inserts a completion by a key.
+
+        Args:
+            key: The key, which is matched by prefixes.
+            completion: The completion.
+            max_candidates: Max count of kept candidates in every node.
+        """
+
+        node: PrefixTrie = self
+        node.add_top(completion, max_candidates)
+        for char in key:
+            child: Optional[PrefixTrie] = node.children.get(char)
+            if child is None:
+                child = node.children[char] = PrefixTrie()
+            node = child
+            node.add_top(completion, max_candidates)
+
+    def add_top(self, completion: Completion, max_candidates: int) -> None:
+        """Adds a completion to the best candidates of the node."""
+
+        rank: Tuple[int, bool, int, str] = completion.get_rank()
+        top: List[Completion] = self.top
+        if len(top) == max_candidates and rank >= top[-1].get_rank():
+            return
+
+        i: int = len(top)
+        while i > 0 and top[i - 1].get_rank() > rank:
+            i -= 1
+        top.insert(i, completion)
+        del top[max_candidates:]
+
+    def find(self, prefix: str) -> List[Completion]:
+        """Returns the best completions, which keys start with a prefix.
+
+        Args:
+            prefix: The prefix.
+
+        Returns:
+            Ranked completions, which are shared, so they must not be changed.
+        """
+
+        node: Optional[PrefixTrie] = self
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        return node.top
+
+class _Level:
+    """Prefix tries of a command tree level."""
+
+    __slots__ = ["flags", "options"]
+
+    flags: PrefixTrie
+    """`Flag` children by names and aliases."""
+    options: PrefixTrie
+    """`Option` children by names and aliases."""
+
+    def __init__(self) -> None:
+        self.flags = PrefixTrie()
+        self.options = PrefixTrie()
+
+class CompletionIndex:
+    """Completion of input lines with prefix tries over names and aliases of commands, flags and options at every level of the command tree.
+
+    Tries are built lazily for visited levels and root commands are filtered by states, so a completion takes time proportional to the prefix and the path length.
+    """
+
+    __slots__ = ["config", "max_candidates", "_words", "_levels", "_roots"]
+
+    config: CommandsConfig
+    """The commands config."""
+    max_candidates: int
+    """Max count of kept candidates for a prefix."""
+    _words: Dict[CommandTrieNode, PrefixTrie]
+    """Positioned children of nodes by names and aliases."""
+    _levels: Dict[CommandTrieNode, _Level]
+    """Flags and options of nodes."""
+    _roots: Dict[str, PrefixTrie]
+    """Root commands by state names."""
+
+    def __init__(self, config: CommandsConfig, max_candidates: int=32) -> None:
+        """
+        Args:
+            config: The commands config.
+            max_candidates: Max count of kept candidates for a prefix.
+        """
+
+        self.config = config
+        self.max_candidates = max_candidates
+        self._words = {}
+        self._levels = {}
+        self._roots = {}
+
+    def get_words(self, node: CommandTrieNode, state: str) -> PrefixTrie:
+        """Returns the trie of positioned children of a node. Root commands are filtered by a state."""
+
+        is_root: bool = node is self.config.trie
+        trie: Optional[PrefixTrie] = self._roots.get(state) if is_root else self._words.get(node)
+        if trie is not None:
+            return trie
+
+        trie = PrefixTrie()
+        roots: FrozenSet[str] = self.config.graph.get_roots(state)
+        for key, child in node.words.items():
+            if is_root and child.name not in roots:
+                continue
+            trie.insert(key, Completion(key, "word", child.name, key != child.name), self.max_candidates)
+
+        if is_root:
+            self._roots[state] = trie
+        else:
+            self._words[node] = trie
+        return trie
+
+    def get_level(self, node: CommandTrieNode) -> _Level:
+        """Returns tries of flags and options of a node."""
+
+        level: Optional[_Level] = self._levels.get(node)
+        if level is not None:
+            return level
+
+        level = _Level()
+        for child in node.children:
+            if child.type not in ("flag", "option"):
+                continue
+            trie: PrefixTrie = level.flags if child.type == "flag" else level.options
+            prefix: str = "-" if child.type == "flag" else "--"
+            for key in (child.name, *(alias.alias_name for alias in child.aliases)):    # pyright: ignore[reportAttributeAccessIssue]
+                trie.insert(key, Completion(prefix + key, child.type, child.name, key != child.name), self.max_candidates)
+
+        self._levels[node] = level
+        return level
+
+    def complete(self, line: str, state: str, limit: int=10) -> List[Completion]:
+        """Completes the last word of an input line.
+
+        Words are separated by whitespaces. Completions of flags and options include legal ones of all visited commands, as `ParsedInputValidator` does.
+
+        Args:
+            line: The partial input line.
+            state: The current state.
+            limit: Max count of completions.
+
+        Returns:
+            Ranked completions, empty if the path is unknown or an option value is expected.
+        """
+
+        words: List[str] = line.split()
+        prefix: str = "" if not line or line[-1].isspace() else words.pop()
+
+        nodes: List[CommandTrieNode] = [self.config.trie]
+        is_value: bool = False
+        for word in words:
+            if is_value:
+                is_value = False
+            elif word.startswith("--"):
+                is_value = True
+            elif not word.startswith("-"):
+                child: Optional[CommandTrieNode] = nodes[-1].get_child(word)
+                if child is None:
+                    return []
+                nodes.append(child)
+
+        if is_value:
+            return []
+
+        if not prefix.startswith("-"):
+            return self.get_words(nodes[-1], state).find(prefix)[:limit]
+
+        candidates: List[Completion] = []
+        if prefix.startswith("--") or prefix == "-":
+            for node in nodes:
+                candidates.extend(self.get_level(node).options.find(prefix[2:]))
+        if not prefix.startswith("--"):
+            operator: str = "-!" if prefix.startswith("-!") else "-"
+            for node in nodes:
+                candidates.extend(
+                    Completion(operator + completion.text[1:], completion.kind, completion.name, completion.is_alias)
+                    if operator == "-!" else completion
+                    for completion in self.get_level(node).flags.find(prefix[len(operator):])
+                )
+
+        candidates.sort(key=Completion.get_rank)
+        return candidates[:limit]
+
+    def __str__(self) -> str:
+        return f"CompletionIndex(levels={len(self._levels) + len(self._words)}, states={list(self._roots)})"
+
+__all__ = ["Completion", "CompletionIndex", "PrefixTrie"]
@@ -0,0 +1,219 @@
+"""config_cache.py - On-disk cache of compiled configs for warm starts."""
+
+from typing import Optional, Any
+
+from dataclasses import dataclass, field
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from untils.utils.constants import Strings
+from untils.commands_config import CommandsConfig
+from untils.processor import Processor
+from untils.settings import Settings
+
+_MAGIC: bytes = b"UNTILSCC"
+"""Start of cache files."""
+
+_FORMAT: int = 1
+"""Version of the cache file layout."""
+
+def _get_library_version() -> str:
+    """Returns `untils.__version__`. It is read on call, because the package is not initialized yet, when this module is imported."""
+
+    import untils    # pylint: disable=import-outside-toplevel,cyclic-import
+    return untils.__version__
+
+@dataclass(frozen=True)
+class ConfigCacheKey:
+    """Identity of a config file, which a cached config was compiled from."""
+
+    path: str
+    """Absolute path of the config file."""
+    mtime_ns: int
+    """Modification time of the config file in nanoseconds."""
+    size: int
+    """Size of the config file in bytes."""
+    sha256: str
+    """SHA-256 hex digest of the config file content."""
+    library_version: str = field(default_factory=_get_library_version)
+    """Version of the library, which compiled the config. Compiled configs of other versions are not loaded."""
+
+    @staticmethod
+    def from_file(file_path: str) -> "ConfigCacheKey":
+        """Returns the key of a config file.
+
+        Args:
+            file_path: The file path.
+
+        Returns:
+            The key with the current library version.
+
+        Raises:
+            OSError: If the file is not readable.
+        """
+
+        path: str = os.path.abspath(file_path)
+        with open(path, "rb") as file:
+            stat: os.stat_result = os.fstat(file.fileno())
+            digest: str = hashlib.file_digest(file, "sha256").hexdigest()
+
+        return ConfigCacheKey(path, stat.st_mtime_ns, stat.st_size, digest)
+
+class ConfigCache:
+    """Opt-in on-disk cache of parsed configs with their compiled command trees and graphs.
+
+    A cache file is keyed by the path, modification time, size and content hash of the config file and by the library version. A valid cache file is unpickled without reading JSON, validation and parsing. Stale, corrupted and truncated cache files are ignored: the config is loaded by `Processor.load_config` and the cache file is rewritten atomically. Configs, which were loaded with warnings, are not cached, so warnings are issued on every load.
+
+    Cache files are pickles, so the cache directory must not be writable by untrusted users.
+    """
+
+    __slots__ = ["cache_dir", "hits", "misses"]
+
+    cache_dir: str
+    """Directory of cache files."""
+    hits: int
+    """Count of configs loaded from cache files."""
+    misses: int
+    """Count of configs loaded from config files."""
+
+    def __init__(self, cache_dir: str) -> None:
+        """
+        Args:
+            cache_dir: Directory of cache files. It is created on the first write.
+        """
+
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def get_cache_path(self, file_path: str) -> str:
+        """Returns the cache file path of a config file.
+
+        Args:
+            file_path: The config file path.
+
+        Returns:
+            Path in `cache_dir`, named by a hash of the absolute config file path.
+        """
+
+        name: str = hashlib.sha256(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"{name}.untils-cache")
+
+    def read(self, settings: Settings, key: ConfigCacheKey) -> Optional[CommandsConfig]:
+        """Reads a cached config. The config is unpickled only if the header of the cache file matches the key.
+
+        Args:
+            settings: The settings.
+            key: Key of the config file.
+
+        Returns:
+            The cached config, `None` if the cache file is missing, stale or not readable.
+        """
+
+        cache_path: str = self.get_cache_path(key.path)
+
+        try:
+            with open(cache_path, "rb") as file:
+                if file.read(len(_MAGIC)) != _MAGIC:
+                    raise ValueError("unknown file format")
+
+                header: Any = pickle.load(file)
+                if header != (_FORMAT, key):
+                    settings.logger.info(Strings.CONFIG_CACHE_STALE.substitute(cache_path=cache_path))
+                    return None
+
+                config: Any = pickle.load(file)
+                if not isinstance(config, CommandsConfig):
+                    raise TypeError(f"expected `CommandsConfig`, got `{type(config).__name__}`")
+        except FileNotFoundError:
+            return None
+        except Exception as e:    # pylint: disable=broad-exception-caught
+            # Unpickling of corrupted data may raise almost any exception.
+            settings.logger.warning(Strings.CONFIG_CACHE_INVALID.substitute(cache_path=cache_path, error=repr(e)))
+            return None
+
+        return config
+
+    def write(self, settings: Settings, key: ConfigCacheKey, config: CommandsConfig) -> bool:
+        """Writes a cached config atomically: to a temporary file, which replaces the cache file.
+
+        Args:
+            settings: The settings.
+            key: Key of the config file.
+            config: The parsed config.
+
+        Returns:
+            `True` if the cache file is written, else `False`.
+        """
+
+        cache_path: str = self.get_cache_path(key.path)
+        temp_path: Optional[str] = None
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(".tmp", ".untils-cache-", self.cache_dir)
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(_MAGIC)
+                pickle.dump((_FORMAT, key), file, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(config, file, pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, cache_path)
+        except (OSError, pickle.PicklingError, RecursionError) as e:
+            # Very deep command trees exceed the recursion limit of `pickle`.
+            settings.logger.warning(Strings.CONFIG_CACHE_NOT_WRITTEN.substitute(cache_path=cache_path, error=repr(e)))
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+
+        return True
+
+    def load_config(self, settings: Settings, file_path: str, is_streaming: bool=False) -> CommandsConfig:
+        """Loads a config from the cache file, else from the config file and caches it.
+
+        Args:
+            settings: The settings.
+            file_path: The config file path.
+            is_streaming: Is the config file read with `Processor.load_config_streaming`.
+
+        Returns:
+            Validated and parsed config.
+        """
+
+        try:
+            key: ConfigCacheKey = ConfigCacheKey.from_file(file_path)
+        except OSError:
+            # `Processor.load_config` reports the missing file with the settings.
+            self.misses += 1
+            return Processor.load_config(settings, file_path)
+
+        config: Optional[CommandsConfig] = self.read(settings, key)
+        if config is not None:
+            self.hits += 1
+            return config
+
+        self.misses += 1
+        with settings.collect_diagnostics(is_silent=False) as diagnostics:
+            config = (
+                Processor.load_config_streaming(settings, file_path)
+                if is_streaming else Processor.load_config(settings, file_path)
+            )
+
+        if diagnostics.warnings_count == 0:
+            try:
+                stat: os.stat_result = os.stat(key.path)
+            except OSError:
+                return config
+            # The file may be changed while loading, then its content doesn't match the key.
+            if (stat.st_mtime_ns, stat.st_size) == (key.mtime_ns, key.size):
+                self.write(settings, key, config)
+
+        return config
+
+    def __str__(self) -> str:
+        return f"ConfigCache(cache_dir='{self.cache_dir}', hits={self.hits}, misses={self.misses})"
+
+__all__ = ["ConfigCache", "ConfigCacheKey"]
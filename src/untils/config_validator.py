@@ -3,7 +3,7 @@
 # pyright: reportUnnecessaryIsInstance=false
 # ^^^^^^^ (Raw dynamic data checking.)
 
-from typing import Dict, get_args, Optional, List, Any
+from typing import Dict, get_args, Optional, List, Any, Mapping
 
 from string import punctuation
 
@@ -51,17 +51,19 @@ class ConfigValidator:
 
             if version not in ConfigVersions:
                 settings.warning(
-                    Strings.INVALID_CONFIG_VERSION.substitute(version=repr(version)),
+                    Strings.INVALID_CONFIG_VERSION,
                     Strings.AUTO_CORRECT_TO_LATEST,
                     ConfigValuesWarning,
-                    ConfigValuesError
+                    ConfigValuesError,
+                    version=repr(version)
                 )
         else:
             settings.warning(
-                Strings.INVALID_CONFIG_VERSION.substitute(version=Strings.UNKNOWN_VERSION),
+                Strings.INVALID_CONFIG_VERSION,
                 Strings.AUTO_CORRECT_TO_LATEST,
                 ConfigStructureWarning,
-                ConfigStructureError
+                ConfigStructureError,
+                version=Strings.UNKNOWN_VERSION
             )
             version = Constants.LATEST_CONFIG_VERSION.value
 
@@ -145,19 +147,21 @@ class ConfigValidator:
                 for alias in command_dict["aliases"]:
                     if not isinstance(alias, str):
                         settings.warning(
-                            Strings.COMMAND_ALIAS_INVALID.substitute(alias=alias),
+                            Strings.COMMAND_ALIAS_INVALID,
                             Strings.AUTO_CORRECT_WITH_CASTING,
                             ConfigValuesWarning,
-                            ConfigValuesError
+                            ConfigValuesError,
+                            alias=alias
                         )
                         alias = str(alias)
 
                     if alias in aliases:
                         settings.warning(
-                            Strings.COMMAND_ALIAS_COPIED.substitute(alias=alias),
+                            Strings.COMMAND_ALIAS_COPIED,
                             Strings.AUTO_CORRECT_WITH_SKIPPING,
                             ConfigValuesWarning,
-                            ConfigValuesError
+                            ConfigValuesError,
+                            alias=alias
                         )
 
                     aliases.append(alias)
@@ -339,10 +343,11 @@ class ConfigValidator:
                         if i - start == 2:
                             continue
                         settings.warning(
-                            Strings.STATE_INTERNAL_NAME_INVALID.substitute(length=i - start),
+                            Strings.STATE_INTERNAL_NAME_INVALID,
                             Strings.AUTO_CORRECT_TO_DEFAULTS,
                             ConfigValuesWarning,
-                            ConfigValuesError
+                            ConfigValuesError,
+                            length=i - start
                         )
                         name = name[:start] + "__" + name[i:]
                         i = start + 2
@@ -382,10 +387,11 @@ class ConfigValidator:
                         continue
 
                 settings.warning(
-                    Strings.COMMAND_NAME_SPECIAL.substitute(character=name[i]),
+                    Strings.COMMAND_NAME_SPECIAL,
                     Strings.AUTO_CORRECT_WITH_REMOVING,
                     ConfigValuesWarning,
-                    ConfigValuesError
+                    ConfigValuesError,
+                    character=name[i]
                 )
                 removing_indexes.append(i)
             elif name[i].isalnum():
@@ -394,10 +400,11 @@ class ConfigValidator:
             else:
                 # Character is unknown.
                 settings.warning(
-                    Strings.UNKNOWN_CHARACTER.substitute(character=name[i]),
+                    Strings.UNKNOWN_CHARACTER,
                     Strings.AUTO_CORRECT_WITH_SKIPPING,
                     ConfigValuesWarning,
-                    ConfigValuesError
+                    ConfigValuesError,
+                    character=name[i]
                 )
 
             i += 1
@@ -474,50 +481,83 @@ class ConfigValidator:
                 command_dict
             )
             if command:
-                new_aliases: List[str] = []
-
                 if "aliases" in command_dict:
-                    for alias in command_dict["aliases"]:
-                        # Processing an alias in the command aliases.
-                        alias = ConfigValidator.validate_name(settings, alias)
-
-                        if alias in used_aliases:
-                            settings.warning(
-                                Strings.COMMAND_ALIAS_COPIED.substitute(alias=alias),
-                                Strings.AUTO_CORRECT_WITH_REMOVING,
-                                ConfigValuesWarning,
-                                ConfigValuesError
-                            )
-                        elif alias == key:
-                            settings.warning(
-                                Strings.COMMAND_ALIAS_REDUNDANCY.substitute(alias=alias),
-                                Strings.AUTO_CORRECT_WITH_REMOVING,
-                                ConfigValuesWarning,
-                                ConfigValuesError
-                            )
-                        else:
-                            used_aliases.append(alias)
-                            new_aliases.append(alias)
-
-                    command_dict["aliases"] = new_aliases
+                    command_dict["aliases"] = ConfigValidator.validate_used_aliases(
+                        settings,
+                        key,
+                        command_dict["aliases"],
+                        used_aliases
+                    )
 
                 key = ConfigValidator.validate_name(settings, key)
                 commands[key] = command
 
         return commands
 
+    @staticmethod
+    def validate_used_aliases(
+        settings: Settings,
+        key: str,
+        aliases: List[str],
+        used_aliases: List[str]
+    ) -> List[str]:
+        """Validates raw aliases of a root command against aliases of previous root commands.
+        
+        Args:
+            settings: The settings.
+            key: The validated command name.
+            aliases: The raw command aliases.
+            used_aliases: Aliases of previous root commands, which is extended with new aliases.
+
+        Returns:
+            New aliases.
+
+        Raises:
+            ConfigValuesWarning: Command aliases are duplicating or equals original command name.
+
+            ConfigValuesError: Command aliases are duplicating or equals original command name.
+        """
+
+        new_aliases: List[str] = []
+
+        for alias in aliases:
+            # Processing an alias in the command aliases.
+            alias = ConfigValidator.validate_name(settings, alias)
+
+            if alias in used_aliases:
+                settings.warning(
+                    Strings.COMMAND_ALIAS_COPIED,
+                    Strings.AUTO_CORRECT_WITH_REMOVING,
+                    ConfigValuesWarning,
+                    ConfigValuesError,
+                    alias=alias
+                )
+            elif alias == key:
+                settings.warning(
+                    Strings.COMMAND_ALIAS_REDUNDANCY,
+                    Strings.AUTO_CORRECT_WITH_REMOVING,
+                    ConfigValuesWarning,
+                    ConfigValuesError,
+                    alias=alias
+                )
+            else:
+                used_aliases.append(alias)
+                new_aliases.append(alias)
+
+        return new_aliases
+
     @staticmethod
     def validate_states(
         settings: Settings,
         config_dict: UnknownConfigType,
-        commands: Dict[str, CommandClass]
+        commands: Mapping[str, Any]
     ) -> CommandStates:
         """Validates config states.
         
         Args:
             settings: The settings.
             config_dict: The config dictionary, which was not validated yet.
-            commands: The proccessed commands dict.
+            commands: The proccessed commands dict. Only names are used.
 
         Returns:
             Validated command states.
@@ -0,0 +1,286 @@
+"""config_watcher.py - Hot reload of config files with change detection."""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from types import TracebackType
+from dataclasses import dataclass
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from untils.utils.type_aliases import UnknownConfigType, ConfigVersion, CommandStates
+from untils.utils.constants import Strings
+from untils.command import CommandNode
+from untils.command_trie import CommandTrieNode
+from untils.commands_config import CommandsConfig
+from untils.config_validator import ConfigValidator
+from untils.ioreader import IOReader
+from untils.parser import Parser
+from untils.processor import Processor
+from untils.settings import Settings
+from untils.command_system import CommandSystem
+
+_ENCODER: json.JSONEncoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+"""Encoder of raw commands for digests."""
+
+@dataclass(frozen=True)
+class ConfigReload:
+    """Report of a config reload."""
+
+    time: float
+    """Time of reading, validation, parsing and swap in seconds."""
+    commands: int
+    """Count of root commands in the config file."""
+    changed: int
+    """Count of new and changed root commands, which were validated and parsed."""
+    removed: int
+    """Count of removed root commands."""
+    is_swapped: bool
+    """Is a new config set to the command system. The config is not swapped, if nothing is changed."""
+
+class _Entry:
+    """A compiled root command."""
+
+    __slots__ = ["digest", "key", "node"]
+
+    digest: bytes
+    """Digest of the raw command JSON."""
+    key: str
+    """The validated name."""
+    node: Optional[CommandNode]
+    """The parsed command, `None` if it is not valid."""
+
+    def __init__(self, digest: bytes, key: str, node: Optional[CommandNode]) -> None:
+        self.digest = digest
+        self.key = key
+        self.node = node
+
+class ConfigWatcher:
+    """Stat-polling watcher, which reloads the config of a command system when its file is changed.
+
+    A reload validates and parses only root commands, which raw JSON is changed, and reuses parsed and compiled nodes of other commands. Version, states, aliases of root commands, the root of the command tree and the command graph are processed again. The new config is built in the watcher thread and replaces `CommandSystem.config` with a single assignment, so inputs in processing keep the old config object. A failed reload is logged and the old config stays.
+    """
+
+    __slots__ = [
+        "command_system", "file_path", "interval", "on_reload", "last_reload",
+        "_signature", "_entries", "_header", "_lock", "_stop", "_thread"
+    ]
+
+    command_system: CommandSystem
+    """The command system, which config is reloaded."""
+    file_path: str
+    """Path of the config file."""
+    interval: float
+    """Interval of file checks in seconds."""
+    on_reload: Optional[Callable[[ConfigReload], None]]
+    """Is called with the report after every reload."""
+    last_reload: Optional[ConfigReload]
+    """Report of the last reload."""
+    _signature: Optional[Tuple[int, int, int]]
+    """Modification time, size and inode of the last read file."""
+    _entries: Dict[str, _Entry]
+    """Compiled root commands by raw names."""
+    _header: Optional[Tuple[ConfigVersion, CommandStates]]
+    """The validated version and states of the current config."""
+    _lock: threading.Lock
+    """Lock of reloads."""
+    _stop: threading.Event
+    """Is set to stop the watcher thread."""
+    _thread: Optional[threading.Thread]
+    """The watcher thread."""
+
+    def __init__(
+        self,
+        command_system: CommandSystem,
+        file_path: str,
+        interval: float=1.0,
+        on_reload: Optional[Callable[[ConfigReload], None]]=None
+    ) -> None:
+        """
+        Args:
+            command_system: The command system, which config is reloaded.
+            file_path: Path of the config file.
+            interval: Interval of file checks in seconds.
+            on_reload: Is called with the report after every reload.
+        """
+
+        self.command_system = command_system
+        self.file_path = file_path
+        self.interval = interval
+        self.on_reload = on_reload
+        self.last_reload = None
+        self._signature = None
+        self._entries = {}
+        self._header = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def get_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Returns modification time, size and inode of the config file, `None` if it is not found."""
+
+        try:
+            stat: os.stat_result = os.stat(self.file_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def check(self) -> Optional[ConfigReload]:
+        """Reloads the config, if the file signature is changed since the last read.
+
+        Returns:
+            The reload report, `None` if the file is not changed, not found or the reload failed.
+        """
+
+        signature: Optional[Tuple[int, int, int]] = self.get_signature()
+        if signature is None or signature == self._signature:
+            return None
+
+        try:
+            return self.reload(signature)
+        except Exception as e:    # pylint: disable=broad-exception-caught
+            # The file may be in writing, it is read again after the next change.
+            self._signature = signature
+            self.command_system.settings.logger.warning(
+                Strings.CONFIG_RELOAD_FAILED.substitute(path=self.file_path, error=repr(e))
+            )
+            return None
+
+    def reload(self, signature: Optional[Tuple[int, int, int]]=None) -> ConfigReload:
+        """Reads the config file, compiles changed root commands and swaps the config.
+
+        Args:
+            signature: Signature of the file, which is read. Is read by default.
+
+        Returns:
+            The reload report.
+        """
+
+        with self._lock:
+            start: float = time.perf_counter()
+            settings: Settings = self.command_system.settings
+            self._signature = self.get_signature() if signature is None else signature
+
+            content: UnknownConfigType = IOReader.read_file(settings, self.file_path)
+            version: ConfigVersion = ConfigValidator.validate_version(settings, content)
+
+            raw_commands: Any = content.get("commands")
+            entries: Dict[str, _Entry] = {}
+            changed: int = 0
+            if isinstance(raw_commands, dict):
+                used_aliases: List[str] = []
+                for raw_key, command_dict in cast(Dict[str, Any], raw_commands).items():
+                    digest: bytes = hashlib.blake2b(_ENCODER.encode(command_dict).encode("utf-8"), digest_size=16).digest()
+                    entry: Optional[_Entry] = self._entries.get(raw_key)
+                    if entry is None or entry.digest != digest:
+                        entry = self.compile_command(raw_key, command_dict, digest)
+                        changed += 1
+                    entries[raw_key] = entry
+
+                    if entry.node is not None and "aliases" in command_dict:
+                        # Aliases are checked against previous root commands, as `ConfigValidator.validate_commands` does.
+                        ConfigValidator.validate_used_aliases(settings, entry.key, command_dict["aliases"], used_aliases)
+            else:
+                # Reports the invalid `commands` field.
+                ConfigValidator.validate_commands(settings, content)
+
+            nodes: Dict[str, CommandNode] = {
+                entry.key: entry.node for entry in entries.values() if entry.node is not None
+            }
+            states: CommandStates = ConfigValidator.validate_states(settings, content, nodes)
+            removed: int = len(self._entries.keys() - entries.keys())
+
+            is_swapped: bool = changed > 0 or removed > 0 or self._header != (version, states) or self.command_system.config is None
+            if is_swapped:
+                trie: CommandTrieNode = CommandTrieNode.build(list(nodes.values()), self.get_compiled())
+                config: CommandsConfig = CommandsConfig(version, Parser.parse_states(states), list(nodes.values()), trie)
+                self.command_system.set_config(config)
+
+            self._entries = entries
+            self._header = (version, states)
+
+            report: ConfigReload = ConfigReload(time.perf_counter() - start, len(entries), changed, removed, is_swapped)
+            self.last_reload = report
+
+        settings.logger.info(Strings.CONFIG_RELOADED.substitute(
+            path=self.file_path,
+            time=f"{report.time:.3f}",
+            changed=report.changed,
+            commands=report.commands,
+            removed=report.removed
+        ))
+        if self.on_reload is not None:
+            self.on_reload(report)
+
+        return report
+
+    def get_compiled(self) -> Dict[int, CommandTrieNode]:
+        """Returns compiled root commands of the current config by `id` of their command nodes."""
+
+        config: Optional[CommandsConfig] = self.command_system.config
+        if config is None:
+            return {}
+
+        compiled: Dict[int, CommandTrieNode] = {id(node.command): node for node in config.trie.words.values()}
+        if config.trie.fallback is not None:
+            compiled[id(config.trie.fallback.command)] = config.trie.fallback
+        return compiled
+
+    def compile_command(self, raw_key: str, command_dict: Any, digest: bytes) -> _Entry:
+        """Validates and parses a root command.
+
+        Args:
+            raw_key: The raw name.
+            command_dict: The raw command.
+            digest: Digest of the raw command JSON.
+
+        Returns:
+            The compiled root command.
+        """
+
+        key, node = Processor.load_command(self.command_system.settings, raw_key, command_dict)
+        return _Entry(digest, key, node)
+
+    def start(self) -> None:
+        """Loads the config, if it is changed, and starts the watcher thread."""
+
+        if self._thread is not None:
+            return
+
+        self.check()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="untils-config-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the watcher thread and waits for the current reload."""
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self) -> None:
+        """Checks the file every interval until the watcher is stopped."""
+
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def __enter__(self) -> "ConfigWatcher":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        self.stop()
+
+    def __str__(self) -> str:
+        return f"ConfigWatcher(file_path='{self.file_path}', interval={self.interval}, commands={len(self._entries)})"
+
+__all__ = ["ConfigReload", "ConfigWatcher"]
@@ -0,0 +1,151 @@
+"""diagnostics.py - Lightweight records of validation problems."""
+
+from typing import Dict, List, Optional, Type, Union, Any, Iterator
+
+from string import Template
+
+from untils.utils.constants import Strings
+
+_CODES: Dict[Union[int, str], str] = {}
+"""`Strings` attribute names by identifiers of templates and by plain messages."""
+
+def _get_code(message: Union[str, Template]) -> str:
+    """Returns the `Strings` attribute name of a message.
+
+    Args:
+        message: The message or the message template.
+
+    Returns:
+        The attribute name, else an empty string for messages, which are not defined in `Strings`.
+    """
+
+    if not _CODES:
+        for name, value in vars(Strings).items():
+            if isinstance(value, Template):
+                _CODES.setdefault(id(value), name)
+            elif isinstance(value, str) and not name.startswith('_'):
+                _CODES.setdefault(value, name)
+
+    return _CODES.get(id(message) if isinstance(message, Template) else message, "")
+
+class Diagnostic:
+    """A collected warning. The message is formatted only when it is read."""
+
+    __slots__ = ["template", "fields", "auto_correct", "warning_type", "position"]
+
+    template: Union[str, Template]
+    """The message or the message template."""
+    fields: Dict[str, Any]
+    """Substitutions of the message template."""
+    auto_correct: str
+    """The auto-correction message."""
+    warning_type: Type[Warning]
+    """The warning type, which would be issued out of the diagnostics mode."""
+    position: Optional[int]
+    """Index of the input token, if the warning is about an input."""
+
+    def __init__(
+        self,
+        template: Union[str, Template],
+        fields: Dict[str, Any],
+        auto_correct: str,
+        warning_type: Type[Warning],
+        position: Optional[int]=None
+    ) -> None:
+        """
+        Args:
+            template: The message or the message template.
+            fields: Substitutions of the message template.
+            auto_correct: The auto-correction message.
+            warning_type: The warning type.
+            position: Index of the input token.
+        """
+
+        self.template = template
+        self.fields = fields
+        self.auto_correct = auto_correct
+        self.warning_type = warning_type
+        self.position = position
+
+    @property
+    def code(self) -> str:
+        """The `Strings` attribute name of the message."""
+        return _get_code(self.template)
+
+    @property
+    def message(self) -> str:
+        """The formatted message."""
+        return Diagnostic.format(self.template, self.fields)
+
+    @staticmethod
+    def format(template: Union[str, Template], fields: Dict[str, Any]) -> str:
+        """Formats a message.
+
+        Args:
+            template: The message or the message template.
+            fields: Substitutions of the message template.
+
+        Returns:
+            The message.
+        """
+
+        if isinstance(template, Template):
+            return template.substitute(fields)
+        return template
+
+    def __str__(self) -> str:
+        return self.message + ' ' + self.auto_correct
+
+    def __repr__(self) -> str:
+        return f"Diagnostic[{self.code}](position={self.position}, fields={self.fields})"
+
+class Diagnostics:
+    """Collector of warnings, which is active in `Settings.collect_diagnostics`."""
+
+    __slots__ = ["records", "is_silent", "warnings_count"]
+
+    records: List[Diagnostic]
+    """Collected warnings in order of appearance."""
+    is_silent: bool
+    """Are collected warnings not logged and issued by `warnings.warn`."""
+    warnings_count: int
+    """Count of `Settings.warning` calls in the collection on any warnings level."""
+
+    def __init__(self, is_silent: bool=True) -> None:
+        """
+        Args:
+            is_silent: Are collected warnings not logged and issued.
+        """
+
+        self.records = []
+        self.is_silent = is_silent
+        self.warnings_count = 0
+
+    def add(self, record: Diagnostic) -> None:
+        """Adds a warning.
+
+        Args:
+            record: The warning.
+        """
+
+        self.records.append(record)
+
+    def get_messages(self) -> List[str]:
+        """Returns messages of all warnings in the same format as issued warnings.
+
+        Returns:
+            The list of formatted messages.
+        """
+
+        return [str(record) for record in self.records]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[Diagnostic]:
+        return iter(self.records)
+
+    def __str__(self) -> str:
+        return f"Diagnostics({self.records})"
+
+__all__ = ["Diagnostic", "Diagnostics"]
@@ -30,13 +30,23 @@ class CommandNodeFactory:
             aliases: The command aliases.
             default: The command default value.
             children: The nest commands.
+
+        Returns:
+            The node of the command type.
+
+        Raises:
+            KeyError: If the command type is unknown.
         """
 
-        return {
-            "word": CommandWordNode(name, node_type, aliases, children),
-            "fallback": CommandFallbackNode(name, node_type, default, children),
-            "flag": CommandFlagNode(name, node_type, aliases, default),
-            "option": CommandOptionNode(name, node_type, aliases, default)
-        }[node_type]
+        if node_type == "word":
+            return CommandWordNode(name, node_type, aliases, children)
+        if node_type == "fallback":
+            return CommandFallbackNode(name, node_type, default, children)
+        if node_type == "flag":
+            return CommandFlagNode(name, node_type, aliases, default)
+        if node_type == "option":
+            return CommandOptionNode(name, node_type, aliases, default)
+
+        raise KeyError(node_type)
 
 __all__ = ["CommandNodeFactory"]
@@ -0,0 +1,270 @@
+"""history.py - Ring buffer of the command history."""
+
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+import sys
+
+from untils.parsed_input import ParsedInput
+
+HistoryNote = Tuple[str, ParsedInput]
+"""Input string with the parsed input."""
+
+class HistoryBuffer(Sequence[HistoryNote]):
+    """Fixed-capacity ring buffer of history notes from the oldest to the newest.
+
+    Notes are appended and the oldest notes are evicted in O(1). Count and optional byte size limits are supported.
+    """
+
+    __slots__ = ["max_size", "max_bytes", "size_bytes", "_notes", "_sizes", "_start", "_count"]
+
+    max_size: int
+    """Max count of notes."""
+    max_bytes: Optional[int]
+    """Max size of notes in bytes, which are estimated by `sys.getsizeof`."""
+    size_bytes: int
+    """Current size of notes in bytes."""
+    _notes: List[Optional[HistoryNote]]
+    """Slots of the ring, which grow up to `max_size` before the first wrap."""
+    _sizes: List[int]
+    """Sizes of notes in slots."""
+    _start: int
+    """Slot of the oldest note."""
+    _count: int
+    """Count of notes."""
+
+    def __init__(
+        self,
+        max_size: int=100,
+        notes: Iterable[HistoryNote]=(),
+        max_bytes: Optional[int]=None
+    ) -> None:
+        """
+        Args:
+            max_size: Max count of notes.
+            notes: Initial notes from the oldest to the newest. The newest notes are kept on limits.
+            max_bytes: Max size of notes in bytes.
+        """
+
+        self.max_size = max(max_size, 0)
+        self.max_bytes = max_bytes
+        self.clear()
+
+        for note in notes:
+            self.append(note)
+
+    @staticmethod
+    def get_note_size(note: HistoryNote) -> int:
+        """Estimates a note size.
+
+        Args:
+            note: The note.
+
+        Returns:
+            The size in bytes.
+        """
+
+        return sys.getsizeof(note) + sys.getsizeof(note[0]) + sys.getsizeof(note[1])
+
+    def append(self, note: HistoryNote, is_write_overflow: bool=True) -> bool:
+        """Appends a note as the newest.
+
+        Args:
+            note: The note.
+            is_write_overflow: Is the oldest notes are evicted on limits, else the note is not written.
+
+        Returns:
+            `False` if the note is not written because of limits, else `True`.
+        """
+
+        size: int = HistoryBuffer.get_note_size(note)
+
+        if self.max_size == 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return False
+
+        if self._count == self.max_size or (
+            self.max_bytes is not None and self.size_bytes + size > self.max_bytes
+        ):
+            if not is_write_overflow:
+                return False
+
+            while self._count == self.max_size or (
+                self.max_bytes is not None and self.size_bytes + size > self.max_bytes
+            ):
+                self.pop_oldest()
+
+        slot: int = (self._start + self._count) % self.max_size
+        if slot == len(self._notes):
+            # Slots are allocated on demand, so small histories stay small.
+            self._notes.append(note)
+            self._sizes.append(size)
+        else:
+            self._notes[slot] = note
+            self._sizes[slot] = size
+        self.size_bytes += size
+        self._count += 1
+
+        return True
+
+    def pop_oldest(self) -> HistoryNote:
+        """Removes the oldest note.
+
+        Returns:
+            The removed note.
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+
+        if self._count == 0:
+            raise IndexError("pop from empty history")
+
+        note: Optional[HistoryNote] = self._notes[self._start]
+        self._notes[self._start] = None
+        self.size_bytes -= self._sizes[self._start]
+        self._sizes[self._start] = 0
+        self._start = (self._start + 1) % self.max_size
+        self._count -= 1
+
+        return note    # pyright: ignore[reportReturnType]
+
+    def get_latest(self, index: int) -> HistoryNote:
+        """Returns a note by index from the newest.
+
+        Args:
+            index: Note index, where `0` is the newest. Is clamped to limits.
+
+        Returns:
+            The note.
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+
+        if self._count == 0:
+            raise IndexError("history is empty")
+
+        return self[self._count - 1 - min(max(index, 0), self._count - 1)]
+
+    def iter_latest(self) -> Iterator[HistoryNote]:
+        """Iterates notes from the newest to the oldest."""
+
+        for i in range(self._count - 1, -1, -1):
+            yield self._notes[(self._start + i) % self.max_size]    # pyright: ignore[reportReturnType]
+
+    def resize(self, max_size: int, max_bytes: Optional[int]=None) -> None:
+        """Changes limits. The newest notes are kept.
+
+        Args:
+            max_size: Max count of notes.
+            max_bytes: Max size of notes in bytes.
+        """
+
+        notes: List[HistoryNote] = list(self)
+
+        self.max_size = max(max_size, 0)
+        self.max_bytes = max_bytes
+        self.clear()
+
+        for note in notes:
+            self.append(note)
+
+    def clear(self) -> None:
+        """Removes all notes."""
+
+        self.size_bytes = 0
+        self._notes = []
+        self._sizes = []
+        self._start = 0
+        self._count = 0
+
+    @overload
+    def __getitem__(self, index: int) -> HistoryNote: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[HistoryNote]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[HistoryNote, List[HistoryNote]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("history index out of range")
+
+        return self._notes[(self._start + index) % self.max_size]    # pyright: ignore[reportReturnType]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[HistoryNote]:
+        for i in range(self._count):
+            yield self._notes[(self._start + i) % self.max_size]    # pyright: ignore[reportReturnType]
+
+    def __reversed__(self) -> Iterator[HistoryNote]:
+        return self.iter_latest()
+
+    def __str__(self) -> str:
+        return f"HistoryBuffer({self._count}/{self.max_size}, bytes={self.size_bytes})"
+
+class HistoryColumn(Sequence[Union[str, ParsedInput]]):
+    """Live view of input strings or parsed inputs in a history buffer."""
+
+    __slots__ = ["buffer", "column"]
+
+    buffer: HistoryBuffer
+    """The history buffer."""
+    column: int
+    """`0` for input strings, `1` for parsed inputs."""
+
+    def __init__(self, buffer: HistoryBuffer, column: int) -> None:
+        """
+        Args:
+            buffer: The history buffer.
+            column: `0` for input strings, `1` for parsed inputs.
+        """
+
+        self.buffer = buffer
+        self.column = column
+
+    @overload
+    def __getitem__(self, index: int) -> Union[str, ParsedInput]: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[Union[str, ParsedInput]]: ...
+
+    def __getitem__(
+        self,
+        index: Union[int, slice]
+    ) -> Union[Union[str, ParsedInput], List[Union[str, ParsedInput]]]:
+        if isinstance(index, slice):
+            return [note[self.column] for note in self.buffer[index]]
+        return self.buffer[index][self.column]
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def __iter__(self) -> Iterator[Union[str, ParsedInput]]:
+        for note in self.buffer:
+            yield note[self.column]
+
+def search_inputs(
+    inputs: Sequence[str],
+    text: str,
+    is_prefix: bool=False
+) -> Iterator[Tuple[int, str]]:
+    """Searches input strings from the newest to the oldest, like reverse search of shells.
+
+    Args:
+        inputs: Input strings from the oldest to the newest.
+        text: The searched text.
+        is_prefix: Is input strings must start with the text, else contain it.
+
+    Returns:
+        Iterator of indices and input strings of matched notes.
+    """
+
+    for i in range(len(inputs) - 1, -1, -1):
+        input_str: str = inputs[i]
+        if input_str.startswith(text) if is_prefix else text in input_str:
+            yield i, input_str
+
+__all__ = ["HistoryBuffer", "HistoryColumn", "HistoryNote", "search_inputs"]
@@ -0,0 +1,585 @@
+"""history_log.py - Persistent append-only log of the command history."""
+
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union, overload
+from types import TracebackType
+
+import json
+import mmap
+import os
+import struct
+import threading
+import weakref
+
+from untils.parsed_input import ParsedInput
+from untils.history import HistoryNote, search_inputs
+
+_OFFSET: struct.Struct = struct.Struct("<Q")
+"""Format of offsets in the index file."""
+_CHUNK_SIZE: int = 1 << 20
+"""Size of log chunks, which are read by `HistoryLog.recover`."""
+_ENCODER: json.JSONEncoder = json.JSONEncoder(ensure_ascii=False, default=str)
+"""Shared JSON encoder of lines, `json.dumps` creates a new one for every call with arguments."""
+
+class HistoryLog(Sequence[HistoryNote]):
+    """Append-only history log on disk with an offset index.
+
+    Every note is a line of the log file: the JSON input string, a tab and the JSON parsed input. The index file keeps start offsets of lines as little-endian 64-bit integers. Appended notes are buffered in memory and written by a background thread, flushed notes are read via `mmap`, so the log is never loaded into memory entirely.
+
+    The background thread keeps only a weak reference to the log. Pending notes are written and files are closed, when the log is closed, garbage collected or the interpreter exits.
+    """
+
+    __slots__ = [
+        "path", "index_path", "flush_interval", "buffer_size",
+        "_pending", "_flushed", "_log_file", "_index_file", "_log_map", "_index_map",
+        "_lock", "_wakeup", "_closed", "_thread", "_finalizer", "__weakref__"
+    ]
+
+    path: str
+    """Path of the log file."""
+    index_path: str
+    """Path of the index file."""
+    flush_interval: float
+    """Interval of background flushes in seconds."""
+    buffer_size: int
+    """Count of pending notes, which wakes up the background flush earlier."""
+    _pending: List[HistoryNote]
+    """Notes, which are not written yet. The list is changed only in place, the finalizer holds it."""
+    _flushed: int
+    """Count of written notes."""
+    _log_file: Any
+    """Log file, which is opened for appending and reading."""
+    _index_file: Any
+    """Index file, which is opened for appending and reading."""
+    _log_map: Optional[mmap.mmap]
+    """Memory map of written log, which is `None` if it is outdated."""
+    _index_map: Optional[mmap.mmap]
+    """Memory map of written index, which is `None` if it is outdated."""
+    _lock: threading.RLock
+    """Lock of files and pending notes."""
+    _wakeup: threading.Event
+    """Event of the background flush wakeup."""
+    _closed: bool
+    """Is the log closed."""
+    _thread: Optional[threading.Thread]
+    """Thread of the background flush."""
+    _finalizer: weakref.finalize
+    """Writes pending notes and closes files on `close`, garbage collection or interpreter exit."""
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float=1.0,
+        buffer_size: int=256,
+        is_background_flush: bool=True
+    ) -> None:
+        """
+        Args:
+            path: Path of the log file. The index file has the same path with `.idx` suffix. Files are created if not exist.
+            flush_interval: Interval of background flushes in seconds.
+            buffer_size: Count of pending notes, which wakes up the background flush earlier.
+            is_background_flush: Is pending notes are written by a background thread, else only by `flush` and `close`.
+        """
+
+        self.path = path
+        self.index_path = path + ".idx"
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self._pending = []
+        self._log_map = None
+        self._index_map = None
+        self._lock = threading.RLock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._thread = None
+
+        self._flushed = HistoryLog.recover(self.path, self.index_path)
+        self._log_file = open(self.path, "a+b")    # pylint: disable=consider-using-with
+        self._index_file = open(self.index_path, "a+b")    # pylint: disable=consider-using-with
+        self._finalizer = weakref.finalize(
+            self, HistoryLog.finalize, self._lock, self._pending, self._log_file, self._index_file, self._wakeup
+        )
+
+        if is_background_flush:
+            self._thread = threading.Thread(
+                target=HistoryLog.run, args=(weakref.ref(self), self._wakeup), name="untils-history-log", daemon=True
+            )
+            self._thread.start()
+
+    @staticmethod
+    def recover(path: str, index_path: str) -> int:
+        """Makes the log and the index consistent after an interrupted write.
+
+        A partial last line of the log is removed, offsets out of the log are removed and missing offsets are restored. Valid offsets are found by binary search in the index, the log after the last of them is read in chunks and restored offsets are written chunk by chunk, so neither file is loaded into memory, even if the index is missing.
+
+        Args:
+            path: Path of the log file.
+            index_path: Path of the index file.
+
+        Returns:
+            Count of notes in the log.
+        """
+
+        with open(path, "a+b") as log_file, open(index_path, "a+b") as index_file:
+            size: int = log_file.seek(0, os.SEEK_END)
+            index_size: int = index_file.seek(0, os.SEEK_END)
+
+            # Offsets increase, so offsets in the log precede offsets out of it.
+            low: int = 0
+            high: int = index_size // _OFFSET.size
+            while low < high:
+                middle: int = (low + high) // 2
+                index_file.seek(middle * _OFFSET.size)
+                if _OFFSET.unpack(index_file.read(_OFFSET.size))[0] < size:
+                    low = middle + 1
+                else:
+                    high = middle
+
+            count: int = low
+            start: int = 0
+            if count > 0:
+                index_file.seek((count - 1) * _OFFSET.size)
+                start = _OFFSET.unpack(index_file.read(_OFFSET.size))[0]
+
+            if count * _OFFSET.size != index_size:
+                index_file.truncate(count * _OFFSET.size)
+
+            # Only the tail after the last indexed line start is read.
+            is_indexed: bool = count > 0
+            line_start: int = start
+            position: int = log_file.seek(start)
+            restored: int = 0
+
+            while chunk := log_file.read(_CHUNK_SIZE):
+                offsets: List[bytes] = []
+                end: int = chunk.find(b"\n")
+                while end >= 0:
+                    if is_indexed:
+                        is_indexed = False
+                    else:
+                        offsets.append(_OFFSET.pack(line_start))
+                    line_start = position + end + 1
+                    end = chunk.find(b"\n", end + 1)
+
+                if offsets:
+                    index_file.seek(0, os.SEEK_END)
+                    index_file.write(b"".join(offsets))
+                    restored += len(offsets)
+                position += len(chunk)
+
+            if is_indexed:
+                # The last indexed line is partial.
+                count -= 1
+                index_file.truncate(count * _OFFSET.size)
+            if line_start != size:
+                log_file.truncate(line_start)
+
+            return count + restored
+
+    @staticmethod
+    def encode(note: HistoryNote) -> bytes:
+        """Encodes a note to a line of the log.
+
+        Args:
+            note: The note.
+
+        Returns:
+            The line with the line break.
+        """
+
+        parsed_input: ParsedInput = note[1]
+        return (
+            _ENCODER.encode(note[0]) + "\t"
+            + _ENCODER.encode([parsed_input.path, parsed_input.flags.copy(), parsed_input.options.copy()]) + "\n"
+        ).encode("utf-8")
+
+    @staticmethod
+    def decode_input(line: bytes) -> str:
+        """Decodes only an input string from a line of the log.
+
+        Args:
+            line: The line without the line break.
+
+        Returns:
+            The input string.
+        """
+
+        return json.loads(line[:line.index(b"\t")])
+
+    @staticmethod
+    def decode(line: bytes) -> HistoryNote:
+        """Decodes a note from a line of the log.
+
+        Args:
+            line: The line without the line break.
+
+        Returns:
+            The note.
+        """
+
+        input_part, _, input_dict_part = line.partition(b"\t")
+        path, flags, options = json.loads(input_dict_part)
+        return json.loads(input_part), ParsedInput(path, flags, options)
+
+    def append(self, note: HistoryNote) -> None:
+        """Appends a note as the newest. The note is written by the next flush.
+
+        Args:
+            note: The note.
+
+        Raises:
+            ValueError: If the log is closed.
+        """
+
+        with self._lock:
+            if self._closed:
+                raise ValueError("history log is closed")
+
+            self._pending.append(note)
+            if len(self._pending) >= self.buffer_size:
+                self._wakeup.set()
+
+    def flush(self) -> None:
+        """Writes pending notes to the log and the index."""
+
+        with self._lock:
+            if not self._pending or self._closed:
+                return
+
+            HistoryLog.write(self._log_file, self._index_file, self._pending)
+            self._flushed += len(self._pending)
+            self._pending.clear()
+            self._unmap()
+
+    @staticmethod
+    def write(log_file: Any, index_file: Any, notes: List[HistoryNote]) -> None:
+        """Writes notes to the end of the log and the index.
+
+        Args:
+            log_file: The log file.
+            index_file: The index file.
+            notes: The notes.
+        """
+
+        offset: int = log_file.seek(0, os.SEEK_END)
+        lines: List[bytes] = []
+        offsets: List[bytes] = []
+        for note in notes:
+            line: bytes = HistoryLog.encode(note)
+            lines.append(line)
+            offsets.append(_OFFSET.pack(offset))
+            offset += len(line)
+
+        # The log is written first, so the index never points out of it.
+        log_file.write(b"".join(lines))
+        log_file.flush()
+        index_file.write(b"".join(offsets))
+        index_file.flush()
+
+    @staticmethod
+    def finalize(
+        lock: threading.RLock,
+        pending: List[HistoryNote],
+        log_file: Any,
+        index_file: Any,
+        wakeup: threading.Event
+    ) -> None:
+        """Writes pending notes, closes files and wakes up the background flush to stop it. Is called once by the finalizer of a log.
+
+        Args:
+            lock: Lock of the log.
+            pending: Pending notes of the log.
+            log_file: The log file.
+            index_file: The index file.
+            wakeup: Event of the background flush wakeup.
+        """
+
+        with lock:
+            try:
+                if pending:
+                    HistoryLog.write(log_file, index_file, pending)
+                    pending.clear()
+            finally:
+                log_file.close()
+                index_file.close()
+
+        wakeup.set()
+
+    def close(self) -> None:
+        """Flushes pending notes, stops the background flush and closes files."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._unmap()
+            self._finalizer()
+
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def get_input(self, index: int) -> str:
+        """Returns an input string by index from the oldest without decoding the parsed input.
+
+        Args:
+            index: Note index.
+
+        Returns:
+            The input string.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+
+        with self._lock:
+            index = self._check_index(index)
+            if index >= self._flushed:
+                return self._pending[index - self._flushed][0]
+
+            return HistoryLog.decode_input(HistoryLog.read_line(*self._get_maps(), index))
+
+    def get_inputs(self) -> "HistoryLogInputs":
+        """Returns a live view of input strings."""
+
+        return HistoryLogInputs(self)
+
+    def iter_latest(self) -> Iterator[HistoryNote]:
+        """Iterates notes from the newest to the oldest."""
+
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+    def search(self, text: str, is_prefix: bool=False) -> Iterator[Tuple[int, str]]:
+        """Searches input strings from the newest to the oldest.
+
+        Written notes are scanned backwards in own memory maps of the search for the JSON escaped text, so only lines with the text are decoded. The maps are closed, when the iterator is exhausted or dropped. The search sees notes, which were appended before the start.
+
+        Args:
+            text: The searched text.
+            is_prefix: Is input strings must start with the text, else contain it.
+
+        Returns:
+            Iterator of indices and input strings of matched notes.
+        """
+
+        with self._lock:
+            pending: List[HistoryNote] = list(self._pending)
+            count: int = self._flushed
+            maps: Optional[Tuple[mmap.mmap, mmap.mmap]] = self._map() if count > 0 else None
+
+        for i, input_str in search_inputs([note[0] for note in pending], text, is_prefix):
+            yield count + i, input_str
+
+        if maps is None:
+            return
+
+        log_map, index_map = maps
+        try:
+            if not text:
+                for i in range(count - 1, -1, -1):
+                    yield i, HistoryLog.decode_input(HistoryLog.read_line(log_map, index_map, count, i))
+                return
+
+            needle: bytes = _ENCODER.encode(text)[1:-1].encode("utf-8")
+            end: int = len(log_map)
+
+            while True:
+                position: int = log_map.rfind(needle, 0, end)
+                if position < 0:
+                    return
+
+                index: int = HistoryLog.find_line(index_map, count, position)
+                input_str: str = HistoryLog.decode_input(HistoryLog.read_line(log_map, index_map, count, index))
+                if input_str.startswith(text) if is_prefix else text in input_str:
+                    yield index, input_str
+
+                end = _OFFSET.unpack_from(index_map, index * _OFFSET.size)[0]
+        finally:
+            log_map.close()
+            index_map.close()
+
+    @staticmethod
+    def read_line(log_map: mmap.mmap, index_map: mmap.mmap, count: int, index: int) -> bytes:
+        """Reads a written line via memory maps.
+
+        Args:
+            log_map: Memory map of the log.
+            index_map: Memory map of the index.
+            count: Count of written notes in memory maps.
+            index: Note index.
+
+        Returns:
+            The line without the line break.
+        """
+
+        start: int = _OFFSET.unpack_from(index_map, index * _OFFSET.size)[0]
+        end: int = (
+            _OFFSET.unpack_from(index_map, (index + 1) * _OFFSET.size)[0]
+            if index + 1 < count else len(log_map)
+        )
+
+        return log_map[start:end - 1]
+
+    @staticmethod
+    def find_line(index_map: mmap.mmap, count: int, position: int) -> int:
+        """Finds a written line by a position in the log with binary search in the index.
+
+        Args:
+            index_map: Memory map of the index.
+            count: Count of written notes in the memory map.
+            position: Position in the log.
+
+        Returns:
+            Index of the note, which line contains the position.
+        """
+
+        low: int = 0
+        high: int = count - 1
+        while low < high:
+            middle: int = (low + high + 1) // 2
+            if _OFFSET.unpack_from(index_map, middle * _OFFSET.size)[0] <= position:
+                low = middle
+            else:
+                high = middle - 1
+
+        return low
+
+    @staticmethod
+    def run(log_ref: "weakref.ReferenceType[HistoryLog]", wakeup: threading.Event) -> None:
+        """Background flush loop. The log is referenced only during flushes, so it can be garbage collected.
+
+        Args:
+            log_ref: Weak reference to the log.
+            wakeup: Event of the background flush wakeup.
+        """
+
+        while True:
+            log: Optional[HistoryLog] = log_ref()
+            if log is None or log._closed:    # pylint: disable=protected-access
+                return
+            interval: float = log.flush_interval
+            del log
+
+            wakeup.wait(interval)
+            wakeup.clear()
+
+            log = log_ref()
+            if log is None:
+                return
+            log.flush()
+            del log
+
+    def _check_index(self, index: int) -> int:
+        """Returns a non-negative index.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+
+        count: int = self._flushed + len(self._pending)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("history index out of range")
+
+        return index
+
+    def _map(self) -> Tuple[mmap.mmap, mmap.mmap]:
+        """Returns new memory maps of the log and the index. There must be written notes and the lock must be held."""
+
+        return (
+            mmap.mmap(self._log_file.fileno(), 0, access=mmap.ACCESS_READ),
+            mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+
+    def _get_maps(self) -> Tuple[mmap.mmap, mmap.mmap, int]:
+        """Returns shared memory maps of the log and the index with count of written notes. There must be written notes and the lock must be held."""
+
+        if self._log_map is None or self._index_map is None:
+            self._log_map, self._index_map = self._map()
+
+        return self._log_map, self._index_map, self._flushed
+
+    def _unmap(self) -> None:
+        """Closes outdated shared memory maps. They are used only under the lock, searches have own maps."""
+
+        if self._log_map is not None:
+            self._log_map.close()
+            self._log_map = None
+        if self._index_map is not None:
+            self._index_map.close()
+            self._index_map = None
+
+    @overload
+    def __getitem__(self, index: int) -> HistoryNote: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[HistoryNote]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[HistoryNote, List[HistoryNote]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        with self._lock:
+            index = self._check_index(index)
+            if index >= self._flushed:
+                return self._pending[index - self._flushed]
+
+            return HistoryLog.decode(HistoryLog.read_line(*self._get_maps(), index))
+
+    def __len__(self) -> int:
+        return self._flushed + len(self._pending)
+
+    def __iter__(self) -> Iterator[HistoryNote]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reversed__(self) -> Iterator[HistoryNote]:
+        return self.iter_latest()
+
+    def __enter__(self) -> "HistoryLog":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType]
+    ) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"HistoryLog('{self.path}', {self._flushed} written, {len(self._pending)} pending)"
+
+class HistoryLogInputs(Sequence[str]):
+    """Live view of input strings in a history log, which are read from disk on access."""
+
+    __slots__ = ["log"]
+
+    log: HistoryLog
+    """The history log."""
+
+    def __init__(self, log: HistoryLog) -> None:
+        """
+        Args:
+            log: The history log.
+        """
+
+        self.log = log
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self.log.get_input(i) for i in range(*index.indices(len(self.log)))]
+        return self.log.get_input(index)
+
+    def __len__(self) -> int:
+        return len(self.log)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self.log)):
+            yield self.log.get_input(i)
+
+__all__ = ["HistoryLog", "HistoryLogInputs"]
@@ -0,0 +1,104 @@
+"""input_cache.py - LRU cache of processed inputs."""
+
+from typing import Optional
+
+from collections import OrderedDict
+
+from untils.commands_config import CommandsConfig
+from untils.parsed_input import ParsedInput
+
+class InputCache:
+    """Bounded LRU cache of processed inputs by input strings.
+
+    Entries belong to a single commands config: the cache is cleared when it is used with another config. Cached inputs are immutable, so they are returned as is.
+    """
+
+    __slots__ = ["max_size", "config", "entries", "hits", "misses", "evictions"]
+
+    max_size: int
+    """Max count of entries."""
+    config: Optional[CommandsConfig]
+    """The commands config of entries."""
+    entries: "OrderedDict[str, ParsedInput]"
+    """Processed inputs by input strings from the least to the most recently used."""
+    hits: int
+    """Count of found inputs."""
+    misses: int
+    """Count of not found inputs."""
+    evictions: int
+    """Count of removed least recently used entries."""
+
+    def __init__(self, max_size: int=256) -> None:
+        """
+        Args:
+            max_size: Max count of entries.
+        """
+
+        self.max_size = max_size
+        self.config = None
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, config: Optional[CommandsConfig], input_str: str) -> Optional[ParsedInput]:
+        """Returns a cached input.
+
+        Args:
+            config: The current commands config.
+            input_str: The input string.
+
+        Returns:
+            The processed input, else `None`.
+        """
+
+        if config is not self.config:
+            self.clear()
+            self.config = config
+
+        parsed_input: Optional[ParsedInput] = self.entries.get(input_str)
+
+        if parsed_input is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(input_str)
+        return parsed_input
+
+    def put(self, config: Optional[CommandsConfig], input_str: str, parsed_input: ParsedInput) -> None:
+        """Caches an input. The least recently used entry is removed on the size limit.
+
+        Args:
+            config: The commands config, which was used for processing.
+            input_str: The input string.
+            parsed_input: The processed input.
+        """
+
+        if config is not self.config:
+            self.clear()
+            self.config = config
+
+        if self.max_size <= 0:
+            return
+
+        self.entries[input_str] = parsed_input
+        self.entries.move_to_end(input_str)
+
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all entries. Counters are kept."""
+
+        self.entries.clear()
+        self.config = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __str__(self) -> str:
+        return f"InputCache({len(self.entries)}/{self.max_size}, hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+__all__ = ["InputCache"]
@@ -2,12 +2,24 @@
 
 # pylint: disable=too-few-public-methods
 
-from typing import Any, Literal
+from typing import Any, Literal, Match, Optional, Pattern, Sequence, Tuple, Union, List, overload
 
+from array import array
 from dataclasses import dataclass
 
+import re
+
 from untils.utils.enums import RawTokenType, FinalTokenType
 
+_ESCAPE_PATTERN: Pattern[str] = re.compile(r"\\(.)", re.DOTALL)
+"""An escape sequence in a `String` body."""
+
+def _unescape(match: Match[str]) -> str:
+    """Replaces an escape sequence by the `Tokenizer` rules: quotes and backslash are kept, other escaped characters are dropped."""
+
+    escaped: str = match.group(1)
+    return escaped if escaped in ('\'', '\"', '\\') else ""
+
 @dataclass(frozen=True)
 class RawInputToken:
     """The raw input token for `Tokenizer`."""
@@ -20,7 +32,324 @@ class RawInputToken:
     def __repr__(self) -> str:
         return f"RawInputToken[{self.type.name}](value='{self.value}')"
 
+class SpanSource:
+    """Input string, which is shared by span tokens, with an offset shift of their stored offsets.
+
+    `Tokenizer.retokenize` rebases all tokens of a source onto the edited input and shifts their offsets with single assignments.
+    """
+
+    __slots__ = ["text", "shift"]
+
+    text: str
+    """The input string."""
+    shift: int
+    """Shift, which is added to stored offsets of tokens."""
+
+    def __init__(self, text: str, shift: int=0) -> None:
+        """
+        Args:
+            text: The input string.
+            shift: Shift of stored offsets.
+        """
+
+        self.text = text
+        self.shift = shift
+
+    def __repr__(self) -> str:
+        return f"SpanSource(length={len(self.text)}, shift={self.shift})"
+
+class SpanInputToken:
+    """The raw input token for `Tokenizer`, which references a span of the input string.
+
+    The value is not stored and materializes only on access, so long inputs are scanned without intermediate strings.
+    """
+
+    __slots__ = ["type", "span_source", "_start", "_end", "is_escaped"]
+
+    type: RawTokenType
+    """The raw command type."""
+    span_source: SpanSource
+    """The shared input string and offset shift."""
+    _start: int
+    """Start offset of the value without the source shift."""
+    _end: int
+    """End offset of the value without the source shift."""
+    is_escaped: bool
+    """Has the value escape sequences, which must be processed."""
+
+    def __init__(
+        self,
+        token_type: RawTokenType,
+        source: Union[str, SpanSource],
+        start: int,
+        end: int,
+        is_escaped: bool=False
+    ) -> None:
+        """
+        Args:
+            token_type: The raw command type.
+            source: The original input string or a shared source of it.
+            start: Start offset of the value in the input string.
+            end: End offset of the value in the input string.
+            is_escaped: Has the value escape sequences.
+        """
+
+        if isinstance(source, str):
+            source = SpanSource(source)
+
+        self.type = token_type
+        self.span_source = source
+        self._start = start - source.shift
+        self._end = end - source.shift
+        self.is_escaped = is_escaped
+
+    @property
+    def source(self) -> str:
+        """The original input string."""
 
+        return self.span_source.text
+
+    @property
+    def start(self) -> int:
+        """Start offset of the value in the input string. For `String` type it is the first character after the opening quote."""
+
+        return self._start + self.span_source.shift
+
+    @property
+    def end(self) -> int:
+        """End offset of the value in the input string. For `String` type it is the closing quote offset or the input length."""
+
+        return self._end + self.span_source.shift
+
+    def rebase(self, source: SpanSource) -> None:
+        """Moves the token to another source with the same input string, keeping its offsets.
+
+        Args:
+            source: The new source.
+        """
+
+        shift: int = self.span_source.shift - source.shift
+        self.span_source = source
+        self._start += shift
+        self._end += shift
+
+    @property
+    def value(self) -> str:
+        """The raw value. Materializes on every access."""
+
+        source: SpanSource = self.span_source
+        value: str = source.text[self._start + source.shift:self._end + source.shift]
+        return SpanInputToken.unescape(value) if self.is_escaped else value
+
+    @staticmethod
+    def unescape(body: str) -> str:
+        """Processes escape sequences in a `String` body.
+        
+        Args:
+            body: The string body without quotes.
+
+        Returns:
+            The string value.
+        """
+
+        return _ESCAPE_PATTERN.sub(_unescape, body)
+
+    def materialize(self) -> RawInputToken:
+        """Returns the same token as `RawInputToken`."""
+
+        return RawInputToken(self.type, self.value)
+
+    def __repr__(self) -> str:
+        return f"SpanInputToken[{self.type.name}](start={self.start}, end={self.end}, value='{self.value}')"
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, (SpanInputToken, RawInputToken)):
+            return self.type == value.type and self.value == value.value
+        return False
+
+    def __ne__(self, value: object) -> bool:
+        if isinstance(value, (SpanInputToken, RawInputToken)):
+            return self.type != value.type or self.value != value.value
+        return True
+
+    def __hash__(self) -> int:
+        return hash((self.type, self.value))
+
+
+
+_RAW_TOKEN_TYPES: Tuple[RawTokenType, ...] = tuple(RawTokenType)
+"""Raw token types by their codes in `TokenBuffer`."""
+
+class TokenBuffer:
+    """Columnar buffer of raw tokens for many inputs from `Tokenizer.tokenize_many`.
+
+    All inputs are joined into a single string and tokens are stored as parallel arrays, so no objects are allocated per token.
+    """
+
+    __slots__ = ["text", "types", "starts", "ends", "line_tokens", "line_offsets"]
+
+    text: str
+    """All inputs joined by line breaks."""
+    types: array[int]
+    """Codes of `RawTokenType` by token."""
+    starts: array[int]
+    """Start offsets of token values in the text."""
+    ends: array[int]
+    """End offsets of token values in the text."""
+    line_tokens: array[int]
+    """Token index boundaries of inputs. Tokens of the input `i` are in `[line_tokens[i], line_tokens[i + 1])`."""
+    line_offsets: array[int]
+    """Start offsets of inputs in the text with a last extra offset."""
+
+    def __init__(
+        self,
+        text: str,
+        types: array[int],
+        starts: array[int],
+        ends: array[int],
+        line_tokens: array[int],
+        line_offsets: array[int]
+    ) -> None:
+        """
+        Args:
+            text: All inputs joined by line breaks.
+            types: Codes of `RawTokenType` by token.
+            starts: Start offsets of token values.
+            ends: End offsets of token values.
+            line_tokens: Token index boundaries of inputs.
+            line_offsets: Start offsets of inputs with a last extra offset.
+        """
+
+        self.text = text
+        self.types = types
+        self.starts = starts
+        self.ends = ends
+        self.line_tokens = line_tokens
+        self.line_offsets = line_offsets
+
+    def __len__(self) -> int:
+        return len(self.line_tokens) - 1
+
+    def __getitem__(self, index: int) -> "TokenBufferLine":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("line index out of range")
+        return TokenBufferLine(self, self.line_tokens[index], self.line_tokens[index + 1])
+
+    def get_input(self, index: int) -> str:
+        """Returns an original input string by its index.
+        
+        Args:
+            index: The input index.
+
+        Returns:
+            The input string.
+        """
+
+        return self.text[self.line_offsets[index]:self.line_offsets[index + 1] - 1]
+
+    def get_token(self, index: int) -> SpanInputToken:
+        """Returns a token by its index in the buffer.
+        
+        Args:
+            index: The token index.
+
+        Returns:
+            The new token, which references the buffer text.
+        """
+
+        start: int = self.starts[index]
+        end: int = self.ends[index]
+        token_type: RawTokenType = _RAW_TOKEN_TYPES[self.types[index]]
+
+        return SpanInputToken(
+            token_type,
+            self.text,
+            start,
+            end,
+            token_type == RawTokenType.STRING and self.text.find('\\', start, end) != -1
+        )
+
+    def __repr__(self) -> str:
+        return f"TokenBuffer(lines={len(self)}, tokens={len(self.types)})"
+
+class TokenBufferLine(Sequence[SpanInputToken]):
+    """Sequence view of tokens of a single input in `TokenBuffer`. `InputValidator` accepts it as raw tokens.
+
+    A token is materialized on the first access and cached by its index, so repeated lookups of the validator don't allocate.
+    """
+
+    __slots__ = ["buffer", "first", "last", "_tokens"]
+
+    buffer: TokenBuffer
+    """The token buffer."""
+    first: int
+    """Index of the first token in the buffer."""
+    last: int
+    """Index after the last token in the buffer."""
+    _tokens: List[Optional[SpanInputToken]]
+    """Materialized tokens by their indexes in the input."""
+
+    def __init__(self, buffer: TokenBuffer, first: int, last: int) -> None:
+        """
+        Args:
+            buffer: The token buffer.
+            first: Index of the first token in the buffer.
+            last: Index after the last token in the buffer.
+        """
+
+        self.buffer = buffer
+        self.first = first
+        self.last = last
+        self._tokens = [None] * (last - first)
+
+    def __len__(self) -> int:
+        return self.last - self.first
+
+    @overload
+    def __getitem__(self, index: int) -> SpanInputToken: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[SpanInputToken]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[SpanInputToken, List[SpanInputToken]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("token index out of range")
+
+        token: Optional[SpanInputToken] = self._tokens[index]
+        if token is None:
+            token = self.buffer.get_token(self.first + index)
+            self._tokens[index] = token
+        return token
+
+    def get_columns(self) -> Tuple[List[RawTokenType], List[str]]:
+        """Returns types and values of the tokens, which are read from the buffer arrays without token objects.
+
+        Returns:
+            Types and values of the tokens.
+        """
+
+        buffer: TokenBuffer = self.buffer
+        text: str = buffer.text
+        types: List[RawTokenType] = [_RAW_TOKEN_TYPES[code] for code in buffer.types[self.first:self.last]]
+        values: List[str] = [
+            text[start:end] for start, end in zip(buffer.starts[self.first:self.last], buffer.ends[self.first:self.last])
+        ]
+
+        for i, token_type in enumerate(types):
+            if token_type == RawTokenType.STRING and '\\' in values[i]:
+                values[i] = SpanInputToken.unescape(values[i])
+
+        return types, values
+
+    def __repr__(self) -> str:
+        return f"TokenBufferLine({list(self)})"
 
 class FinalInputTokenWord:
     """The word type of `FinalInputToken`."""
@@ -103,4 +432,7 @@ class FinalInputTokenOption:
             return self.name != value.name or self.value != value.value
         return True
 
-__all__ = ["RawInputToken", "FinalInputTokenWord", "FinalInputTokenFlag", "FinalInputTokenOption"]
+__all__ = [
+    "RawInputToken", "SpanSource", "SpanInputToken", "TokenBuffer", "TokenBufferLine", "FinalInputTokenWord",
+    "FinalInputTokenFlag", "FinalInputTokenOption"
+]
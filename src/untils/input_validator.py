@@ -1,36 +1,38 @@
 """input_validator.py - Input validations."""
 
-from typing import List, Literal, cast, Union, Dict, Optional
+from typing import List, Literal, cast, Union, Optional, Sequence, Set, Tuple
 
 from untils.utils.type_aliases import InputDict
-from untils.utils.enums import RawTokenType, FinalTokenType, InternalState
+from untils.utils.enums import RawTokenType, FinalTokenType
 from untils.utils.constants import Strings
-from untils.utils.protocols import FinalInputProtocol
+from untils.utils.protocols import FinalInputProtocol, RawInputProtocol
 
-from untils.input_token import (
-    RawInputToken, FinalInputTokenWord, FinalInputTokenFlag,
-    FinalInputTokenOption
-)
+from untils.input_token import FinalInputTokenWord, FinalInputTokenFlag, FinalInputTokenOption, TokenBufferLine
 from untils.settings import Settings
 from untils.utils.lib_warnings import (
     InputStructureWarning, InputValuesWarning, InputStructureError, InputValuesError
 )
 from untils.commands_config import CommandsConfig
-from untils.command import (
-    CommandNode, CommandWordNode, CommandFallbackNode, CommandFlagNode, CommandOptionNode
-)
+from untils.parsed_input import ParsedInput
+from untils.command import CommandFallbackNode
+from untils.command_trie import CommandTrieNode
+from untils.command_graph import CommandGraph
 
 class InputValidator:
     """Validator class for tokenized input."""
 
-    __slots__ = ["_settings", "_config", "_input_tokens", "_result", "_i"]
+    __slots__ = ["_settings", "_config", "_input_tokens", "_types", "_values", "_result", "_i"]
 
     _settings: Settings
     """The settings."""
     _config: Optional[CommandsConfig]
     """The commands config."""
-    _input_tokens: List[RawInputToken]
+    _input_tokens: Sequence[RawInputProtocol]
     """The raw input tokens."""
+    _types: Sequence[RawTokenType]
+    """Types of the raw input tokens."""
+    _values: Sequence[str]
+    """Values of the raw input tokens."""
     _result: List[FinalInputProtocol]
     """The result of final input tokens."""
     _i: int
@@ -40,7 +42,7 @@ class InputValidator:
         self,
         settings: Settings,
         config: Optional[CommandsConfig],
-        input_tokens: List[RawInputToken]
+        input_tokens: Sequence[RawInputProtocol]
     ) -> None:
         """
         Args:
@@ -52,6 +54,11 @@ class InputValidator:
         self._settings = settings
         self._config = config
         self._input_tokens = input_tokens
+        if isinstance(input_tokens, TokenBufferLine):
+            self._types, self._values = input_tokens.get_columns()
+        else:
+            self._types = [token.type for token in input_tokens]
+            self._values = [token.value for token in input_tokens]
         self._result = []
         self._i = 0
 
@@ -68,7 +75,8 @@ class InputValidator:
             Strings.END_OF_INPUT,
             Strings.AUTO_CORRECT_WITH_REMOVING,
             InputStructureWarning,
-            InputStructureError
+            InputStructureError,
+            position=self._i
         )
 
     def cast_token(
@@ -103,7 +111,8 @@ class InputValidator:
                 Strings.NON_POSITIVE_OFFSET,
                 Strings.AUTO_CORRECT_WITH_SKIPPING,
                 InputValuesWarning,
-                InputValuesError
+                InputValuesError,
+                position=self._i
             )
             return
 
@@ -112,62 +121,28 @@ class InputValidator:
                 Strings.END_OF_INPUT,
                 Strings.AUTO_CORRECT_WITH_ACCEPTING,
                 InputStructureWarning,
-                InputStructureError
+                InputStructureError,
+                position=self._i
             )
 
     def validate_token_word(self) -> None:
         """Validates a `Word` token."""
 
-        token: RawInputToken = self._input_tokens[self._i]
+        token: RawInputProtocol = self._input_tokens[self._i]
         self._result.append(self.cast_token(FinalInputTokenWord(token.value)))
         self._i += 1
 
     def validate_token_flag(self) -> None:
         """Validates a `Flag` token."""
 
-        value: bool = True
-
-        invert_token: RawInputToken = self._input_tokens[self._i]
-        if invert_token.type == RawTokenType.NOT:
-            # Invert mark.
-            self._settings.logger.debug("Process `Not` token.")
-
-            value = False
-            self.expect_end(offset=1)  # [...][CURRENT_TOKEN][!LOOKUP!][...]
-            self._i += 1
-        
-        if self._input_tokens[self._i].type != RawTokenType.WORD:
-            self._settings.warning(
-                Strings.EXPECTED_SYNTAX_FLAG,
-                Strings.AUTO_CORRECT_WITH_SKIPPING,
-                InputStructureWarning,
-                InputStructureError
-            )
-            while (
-                self._i <= len(self._input_tokens)
-                and self._input_tokens[self._i].type != RawTokenType.WORD
-            ):
-                self._i += 1
-
-        name_tokens: List[RawInputToken] = self.validate_name_tokens()
-        name: str = ""
-
-        for name_token in name_tokens:
-            name += name_token.value
+        name, value, self._i = InputValidator.scan_flag(self._settings, self._types, self._values, self._i)
 
         if name != "":
             # The flag's name.
             self._settings.logger.debug("Process `Word` token for the flag's name.")
             self._result.append(self.cast_token(FinalInputTokenFlag(name, value)))
-        else:
-            self._settings.warning(
-                Strings.EXPECTED_SYNTAX_FLAG,
-                Strings.AUTO_CORRECT_WITH_SKIPPING,
-                InputStructureWarning,
-                InputStructureError
-            )
 
-    def validate_name_tokens(self) -> List[RawInputToken]:
+    def validate_name_tokens(self) -> List[RawInputProtocol]:
         """Validates a row of tokens with type `Word` and `String` without spaces as name.
         
         Returns:
@@ -176,34 +151,9 @@ class InputValidator:
 
         self._settings.logger.debug("Process name tokens.")
 
-        current_token: RawInputToken = self._input_tokens[self._i]
-        name_tokens: List[RawInputToken] = [current_token]
-
-        if current_token.type == RawTokenType.STRING:
-            return name_tokens
-        if current_token.type not in (RawTokenType.WORD, RawTokenType.MINUS):
-            self._settings.warning(
-                Strings.COMMAND_UNKNOWN_NAME,
-                Strings.AUTO_CORRECT_WITH_SKIPPING,
-                InputStructureWarning,
-                InputStructureError
-            )
-            self._i += 1
-            return name_tokens
-
-        if self._i == len(self._input_tokens) - 1:
-            return name_tokens
-
-        self.expect_end(offset=1)  # [...][CURRENT_TOKEN][!LOOKUP!][...]
-        self._i += 1
-
-        while (
-            (self._i < len(self._input_tokens))
-            and (self._input_tokens[self._i].type in (RawTokenType.WORD, RawTokenType.MINUS))
-        ):
-            self._settings.logger.debug(f"Process name token: {self._input_tokens[self._i]}.")
-            name_tokens.append(self._input_tokens[self._i])
-            self._i += 1
+        start: int = self._i
+        end, self._i = InputValidator.scan_name(self._settings, self._types, self._i)
+        name_tokens: List[RawInputProtocol] = list(self._input_tokens[start:end])
 
         self._settings.logger.debug(f"Processed name tokens: {name_tokens}.")
 
@@ -212,46 +162,12 @@ class InputValidator:
     def validate_token_option(self) -> None:
         """Validates an `Option` token."""
 
-        name_tokens: List[RawInputToken] = self.validate_name_tokens()
-        name: str = ""
-
-        for name_token in name_tokens:
-            name += name_token.value
-
-        if name == "":
-            self._settings.warning(
-                Strings.OPTION_NAME_INVALID,
-                Strings.AUTO_CORRECT_WITH_SKIPPING,
-                InputStructureWarning,
-                InputStructureError
-            )
-
-        self.expect_end(offset=1)  # [...][CURRENT_TOKEN][!LOOKUP!][...]
-        self._i += 1
-
-        while (
-            self._i < len(self._input_tokens)
-            and self._input_tokens[self._i].type == RawTokenType.SPACE
-        ):
-            self._i += 1
-
-        value_tokens: List[RawInputToken] = self.validate_name_tokens()
-        value: str = ""
-
-        for value_token in value_tokens:
-            value += value_token.value
+        name, value, self._i = InputValidator.scan_option(self._settings, self._types, self._values, self._i)
 
         if value != "":
             # The option's value.
             self._settings.logger.debug("Process `Word` or `String` token for the option's value")
             self._result.append(self.cast_token(FinalInputTokenOption(name, value)))
-        else:
-            self._settings.warning(
-                Strings.OPTION_VALUE_INVALID,
-                Strings.AUTO_CORRECT_WITH_SKIPPING,
-                InputStructureWarning,
-                InputStructureError
-            )
 
     def validate_token_minus(self) -> None:
         """Validates a `Minus` token."""
@@ -275,55 +191,192 @@ class InputValidator:
             self._settings.logger.debug("Expected `Option` construction.")
             self.validate_token_option()
 
+    @staticmethod
+    def scan_name(settings: Settings, types: Sequence[RawTokenType], i: int) -> Tuple[int, int]:
+        """Validates a row of `Word` and `Minus` tokens or a single `String` token as name.
+
+        Name and flag rules are shared by `InputValidator` and `Processor.process_input_fused`, so both work on columns of token types and values.
+        
+        Args:
+            settings: The settings.
+            types: Types of the raw input tokens.
+            i: Index of the first name token.
+
+        Returns:
+            Index after the name tokens and index of the last processed token.
+        """
+
+        if types[i] == RawTokenType.STRING:
+            return i + 1, i
+        if types[i] not in (RawTokenType.WORD, RawTokenType.MINUS):
+            settings.warning(
+                Strings.COMMAND_UNKNOWN_NAME,
+                Strings.AUTO_CORRECT_WITH_SKIPPING,
+                InputStructureWarning,
+                InputStructureError,
+                position=i
+            )
+            return i + 1, i + 1
+        if i == len(types) - 1:
+            return i + 1, i
+
+        end: int = i + 1
+        while end < len(types) and types[end] in (RawTokenType.WORD, RawTokenType.MINUS):
+            end += 1
+
+        return end, end
+
+    @staticmethod
+    def scan_flag(
+        settings: Settings,
+        types: Sequence[RawTokenType],
+        values: Sequence[str],
+        i: int
+    ) -> Tuple[str, bool, int]:
+        """Validates a `Flag` construction after its `Minus` token.
+        
+        Args:
+            settings: The settings.
+            types: Types of the raw input tokens.
+            values: Values of the raw input tokens.
+            i: Index of the token after `Minus`.
+
+        Returns:
+            The flag name, empty if it is not valid, the flag value and index of the last processed token.
+        """
+
+        value: bool = True
+
+        if types[i] == RawTokenType.NOT:
+            # Invert mark.
+            settings.logger.debug("Process `Not` token.")
+
+            value = False
+            if i >= len(types) - 1:    # [...][CURRENT_TOKEN][!LOOKUP!][...]
+                settings.warning(
+                    Strings.END_OF_INPUT,
+                    Strings.AUTO_CORRECT_WITH_ACCEPTING,
+                    InputStructureWarning,
+                    InputStructureError,
+                    position=i
+                )
+            i += 1
+
+        if types[i] != RawTokenType.WORD:
+            settings.warning(
+                Strings.EXPECTED_SYNTAX_FLAG,
+                Strings.AUTO_CORRECT_WITH_SKIPPING,
+                InputStructureWarning,
+                InputStructureError,
+                position=i
+            )
+            while i <= len(types) and types[i] != RawTokenType.WORD:
+                i += 1
+
+        start: int = i
+        end, i = InputValidator.scan_name(settings, types, i)
+        name: str = "".join(values[start:end])
+
+        if name == "":
+            settings.warning(
+                Strings.EXPECTED_SYNTAX_FLAG,
+                Strings.AUTO_CORRECT_WITH_SKIPPING,
+                InputStructureWarning,
+                InputStructureError,
+                position=i
+            )
+
+        return name, value, i
+
+    @staticmethod
+    def scan_option(
+        settings: Settings,
+        types: Sequence[RawTokenType],
+        values: Sequence[str],
+        i: int
+    ) -> Tuple[str, str, int]:
+        """Validates an `Option` construction after its `Minus` tokens.
+        
+        Args:
+            settings: The settings.
+            types: Types of the raw input tokens.
+            values: Values of the raw input tokens.
+            i: Index of the token after `Minus` tokens.
+
+        Returns:
+            The option name, the option value, empty if it is not valid, and index of the last processed token.
+        """
+
+        start: int = i
+        end, i = InputValidator.scan_name(settings, types, i)
+        name: str = "".join(values[start:end])
+
+        if name == "":
+            settings.warning(
+                Strings.OPTION_NAME_INVALID,
+                Strings.AUTO_CORRECT_WITH_SKIPPING,
+                InputStructureWarning,
+                InputStructureError,
+                position=i
+            )
+
+        if i >= len(types) - 1:    # [...][CURRENT_TOKEN][!LOOKUP!][...]
+            settings.warning(
+                Strings.END_OF_INPUT,
+                Strings.AUTO_CORRECT_WITH_ACCEPTING,
+                InputStructureWarning,
+                InputStructureError,
+                position=i
+            )
+        i += 1
+
+        while i < len(types) and types[i] == RawTokenType.SPACE:
+            i += 1
+
+        start = i
+        end, i = InputValidator.scan_name(settings, types, i)
+        value: str = "".join(values[start:end])
+
+        if value == "":
+            settings.warning(
+                Strings.OPTION_VALUE_INVALID,
+                Strings.AUTO_CORRECT_WITH_SKIPPING,
+                InputStructureWarning,
+                InputStructureError,
+                position=i
+            )
+
+        return name, value, i
+
     def validate_fallback_defaults(self) -> None:
         """Validates `Fallback` commands with defaults in path if they not written."""
 
-        result: List[FinalInputProtocol] = []
-        commands: List[CommandNode] = self._config.commands if self._config is not None else []
+        if self._config is None:
+            return
+
+        node: CommandTrieNode = self._config.trie
 
-        found: bool = False
         for part in self._result:
-            # Copying.
-            found = False
-            for node in commands:
-                if node.type == "word":
-                    node = cast(CommandWordNode, node)
-
-                    if not (
-                        node.name == part.value
-                        or part.value in [alias.alias_name for alias in node.aliases]
-                    ):
-                        continue
-                elif node.type == "fallback":
-                    node = cast(CommandFallbackNode, node)
-                else:
-                    continue
-
-                result.append(part)
-                commands = node.children
-                found = True
-                break
+            child: Optional[CommandTrieNode] = node.get_child(part.value)
 
-            if not found:
+            if child is None:
                 # Invalid path.
                 return
 
-        while commands != []:
-            # Searching `Fallback`s.
-            found = False
+            node = child
 
-            for node in commands:
-                if node.type == "fallback":
-                    node = cast(CommandFallbackNode, node)
-                    result.append(self.cast_token(FinalInputTokenWord(str(node.default))))
-                    commands = node.children
-                    found = True
-                    break
+        result: List[FinalInputProtocol] = list(self._result)
 
-            if not found:
+        while node.children != []:
+            # Searching `Fallback`s.
+            if node.fallback is None:
                 # Invalid path.
                 return
 
+            node = node.fallback
+            fallback: CommandFallbackNode = cast(CommandFallbackNode, node.command)
+            result.append(self.cast_token(FinalInputTokenWord(str(fallback.default))))
+
         self._result = result
 
     def validate_input(self, settings: Settings) -> List[FinalInputProtocol]:
@@ -347,7 +400,7 @@ class InputValidator:
         while self._i < len(self._input_tokens):
             self._settings.logger.debug(f"New iteration: {self._i}.")
 
-            token: RawInputToken = self._input_tokens[self._i]
+            token: RawInputProtocol = self._input_tokens[self._i]
 
             if token.type == RawTokenType.WORD:
                 self._settings.logger.debug("Process `Word` token.")
@@ -370,7 +423,8 @@ class InputValidator:
                     Strings.UNKNOWN_TOKEN,
                     Strings.AUTO_CORRECT_WITH_SKIPPING,
                     InputStructureWarning,
-                    InputStructureError
+                    InputStructureError,
+                    position=self._i
                 )
 
             self._i += 1
@@ -385,7 +439,7 @@ class ParsedInputValidator:
     @staticmethod
     def validate_commands_path(
         settings: Settings,
-        input_dict: InputDict,
+        input_dict: Union[InputDict, ParsedInput],
         config: CommandsConfig
     ) -> bool:
         """Validates a commands path, flags and options.
@@ -404,142 +458,51 @@ class ParsedInputValidator:
             InputValuesError: If the first command is not written in current state in the settings or path cannot be accessed to the input path.
         """
 
-        flag_keys: List[str] = list(input_dict["flags"].keys())
-        option_keys: List[str] = list(input_dict["options"].keys())
-        validated_flags: Dict[str, bool] = {n: False for n in flag_keys}
-        validated_options: Dict[str, bool] = {n: False for n in option_keys}
-
-        def validate_flags(children: List[CommandNode]) -> None:
-            """Validates the flags.
-            
-            Args:
-                children: The commands.
-            """
-
-            for command in children:
-                if command.type == "flag":
-                    command = cast(CommandFlagNode, command)
-                    validated_flags[command.name] = True
-                    for alias in command.aliases:
-                        validated_flags[alias.alias_name] = True
-
-        def validate_options(children: List[CommandNode]) -> None:
-            """Validates the options.
-            
-            Args:
-                children: The commands.
-            """
-
-            for command in children:
-                if command.type == "option":
-                    command = cast(CommandOptionNode, command)
-                    validated_options[command.name] = True
-                    for alias in command.aliases:
-                        validated_options[alias.alias_name] = True
-
-        def validate_command(children: List[CommandNode], i: int) -> bool:
-            """Validates a command recursively.
-            
-            Args:
-                children: The commands.
-                i: Current path index.
-
-            Returns:
-                `False` if command not in current state (i == 0 -> First command) or has not children, else `True`.
-
-            Raises:
-                InputValuesWarning: If the first command is not written in current state in the settings or no commands in children in path.
-
-                InputValuesError: If the first command is not written in current state in the settings or no commands in children in path.
-            """
-
-            for command in children:
-                if command.type not in ("word", "fallback"):
-                    # Type filtration for positioned commands.
-                    continue
-
-                command = cast(Union[CommandWordNode, CommandFallbackNode], command)
-
-                if command.type == "word":
-                    # Conditions:
-                    # 1. `command.type == "word"`` -> Shall equals with original command key or with alias.
-                    # 2. `command.type == "fallback"` -> None (accepts any word).
-                    command = cast(CommandWordNode, command)
-
-                    if input_dict["path"][i] == command.name:
-                        # Continue current iteration.
-                        pass
-                    elif input_dict["path"][i] not in [
-                         alias.alias_name for alias in command.aliases
-                    ]:
-                        # Next iteration.
-                        continue
-
-                if i == 0:
-                    # First iteration must has root command.
-                    in_state: bool = False
-                    for state_node in config.states:
-                        if state_node.is_internal:
-                            if (
-                                state_node.name == InternalState.BASE.value
-                                and command.name in state_node.commands
-                            ):
-                                # First state in `__base__` state, which defines any current state.
-                                in_state = True
-                                break
-                        if settings.current_state == state_node.name:
-                            # Command defined in current state.
-                            in_state = command.name in state_node.commands
-                            break
-
-                    if not in_state:
-                        # First iteration not in states.
-                        settings.warning(
-                            Strings.COMMAND_NOT_IN_CURRENT_STATE.substitute(
-                                state=settings.current_state
-                            ),
-                            Strings.AUTO_CORRECT_WITH_SKIPPING,
-                            InputValuesWarning,
-                            InputValuesError
-                        )
-                        return False
-
-                validate_flags(command.children)
-                validate_options(command.children)
-
-                if i < len(input_dict["path"]) - 1:
-                    validate_command(command.children, i + 1)
-
-                return True
-
-            settings.warning(
-                Strings.INPUT_PATH_INVALID.substitute(name=input_dict["path"][i]),
-                Strings.AUTO_CORRECT_WITH_SKIPPING,
-                InputValuesWarning,
-                InputValuesError
-            )
+        graph: CommandGraph = config.graph
+        path: Sequence[str] = input_dict["path"]
+        # Flags and options, which are not legal in visited commands.
+        flags: Set[str] = input_dict["flags"].keys() - graph.root.flags
+        options: Set[str] = input_dict["options"].keys() - graph.root.options
 
-            return False
+        node: CommandTrieNode = graph.root
+        for i, name in enumerate(path):
+            child: Optional[CommandTrieNode] = node.get_child(name)
 
-        if input_dict["path"] == []:
-            # Current path is empty.
-            validate_flags(config.commands)
-            validate_options(config.commands)
+            if child is None:
+                settings.warning(
+                    Strings.INPUT_PATH_INVALID,
+                    Strings.AUTO_CORRECT_WITH_SKIPPING,
+                    InputValuesWarning,
+                    InputValuesError,
+                    name=name
+                )
 
-            return all(validated_flags.values()) and all(validated_options.values())
+                if i == 0:
+                    return False
+                # Legal names of visited commands are still checked.
+                break
 
-        if not validate_command(config.commands, 0):
-            return False
+            if i == 0 and child.name not in graph.get_roots(settings.current_state):
+                # First command not in current state.
+                settings.warning(
+                    Strings.COMMAND_NOT_IN_CURRENT_STATE,
+                    Strings.AUTO_CORRECT_WITH_SKIPPING,
+                    InputValuesWarning,
+                    InputValuesError,
+                    state=settings.current_state
+                )
+                return False
 
-        validate_flags(config.commands)
-        validate_options(config.commands)
+            flags -= child.flags
+            options -= child.options
+            node = child
 
-        return all(validated_flags.values()) and all(validated_options.values())
+        return not flags and not options
 
     @staticmethod
     def validate_input_dict(
         settings: Settings,
-        input_dict: InputDict,
+        input_dict: Union[InputDict, ParsedInput],
         config: CommandsConfig
     ) -> bool:
         """Validates input dict with current context in settings.
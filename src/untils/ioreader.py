@@ -2,7 +2,7 @@
 
 # pylint: disable=too-few-public-methods
 
-from typing import Dict, override
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union, override
 
 import json
 import os
@@ -23,6 +23,159 @@ class JSONMixin(IOReaderMixin):
             content: UnknownConfigType = json.loads(file.read())
         return content
 
+    @override
+    @staticmethod
+    def loads(settings: Settings, data: Union[bytes, str]) -> UnknownConfigType:
+        content: UnknownConfigType = json.loads(data)
+        return content
+
+class JSONObjectStream:
+    """Incremental reader of JSON objects from a text file.
+
+    The file is read by chunks and values are decoded one by one with `json.JSONDecoder.raw_decode`, so only the current value and a chunk are kept in memory. Objects are walked with `start_object` and `next_key`, other values are read with `read_value`.
+    """
+
+    __slots__ = ["file", "chunk_size", "buffer", "position", "is_eof", "_counts"]
+
+    _DECODER: json.JSONDecoder = json.JSONDecoder()
+    """The shared decoder."""
+    _WHITESPACES: str = " \t\n\r"
+    """JSON whitespaces."""
+    _DELIMITERS: str = " \t\n\r,:]}"
+    """Characters, which may follow a complete value."""
+
+    file: TextIO
+    """The text file."""
+    chunk_size: int
+    """Count of characters in a read chunk."""
+    buffer: str
+    """Read and not consumed text."""
+    position: int
+    """Position of the next character in `buffer`."""
+    is_eof: bool
+    """Is the file read to the end."""
+    _counts: List[int]
+    """Count of read keys in every started object."""
+
+    def __init__(self, file: TextIO, chunk_size: int=1 << 16) -> None:
+        """
+        Args:
+            file: The text file.
+            chunk_size: Count of characters in a read chunk.
+        """
+
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.position = 0
+        self.is_eof = False
+        self._counts = []
+
+    def read_more(self, size: int) -> bool:
+        """Reads at least `size` characters to the buffer, unless the file ends. Consumed text is dropped.
+
+        Returns:
+            `False` if the file is already read to the end, else `True`.
+        """
+
+        if self.is_eof:
+            return False
+
+        chunk: str = self.file.read(max(size, self.chunk_size))
+        if chunk == "":
+            self.is_eof = True
+            return False
+
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        """Returns the next not whitespace character without consuming it, empty at the end of the file."""
+
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in JSONObjectStream._WHITESPACES:
+                self.position += 1
+            if self.position < len(self.buffer) or not self.read_more(self.chunk_size):
+                return self.buffer[self.position:self.position + 1]
+
+    def expect(self, character: str) -> None:
+        """Consumes the next not whitespace character.
+
+        Raises:
+            json.JSONDecodeError: If the character is other.
+        """
+
+        if self.peek() != character:
+            raise json.JSONDecodeError(f"Expecting '{character}'", self.buffer, self.position)
+        self.position += 1
+
+    def read_value(self) -> Any:
+        """Reads and decodes the next value.
+
+        Returns:
+            The decoded value.
+
+        Raises:
+            json.JSONDecodeError: If the value is not valid.
+        """
+
+        self.peek()
+        while True:
+            try:
+                value, end = JSONObjectStream._DECODER.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                # The value may be not read to the end yet. The read size grows with the value, so it is decoded in linear time.
+                if not self.read_more(len(self.buffer) - self.position):
+                    raise
+                continue
+
+            if (
+                (end == len(self.buffer) or self.buffer[end] not in JSONObjectStream._DELIMITERS)
+                and self.read_more(self.chunk_size)
+            ):
+                # A complete value is followed by a delimiter, else it is a number, which is continued in the next chunk.
+                continue
+
+            self.position = end
+            return value
+
+    def start_object(self) -> None:
+        """Consumes the start of an object, which keys are read with `next_key`.
+
+        Raises:
+            json.JSONDecodeError: If the next value is not an object.
+        """
+
+        self.expect("{")
+        self._counts.append(0)
+
+    def next_key(self) -> Optional[str]:
+        """Reads the next key of the current object and the colon after it.
+
+        Returns:
+            The key, `None` at the end of the object.
+
+        Raises:
+            json.JSONDecodeError: If the object is not valid.
+        """
+
+        if self.peek() == "}":
+            self.position += 1
+            self._counts.pop()
+            return None
+
+        if self._counts[-1] > 0:
+            self.expect(",")
+        self._counts[-1] += 1
+
+        if self.peek() != "\"":
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", self.buffer, self.position)
+        key: str = self.read_value()
+        self.expect(":")
+
+        return key
+
 class IOReader():
     """Reader class for config loading by paths and settings."""
 
@@ -32,6 +185,9 @@ class IOReader():
     }
     """All supported mixins for `IOReader`."""
 
+    STREAMING_EXTENSIONS: Tuple[ConfigSupportedExtensions, ...] = (".json", ".json5")
+    """Extensions, which are read by `JSONObjectStream` in `Processor.load_config_streaming`."""
+
     @staticmethod
     def read_file(settings: Settings, file_path: str) -> UnknownConfigType:
         """Reads a config file by path.
@@ -54,4 +210,28 @@ class IOReader():
 
         return content
 
-__all__ = ["JSONMixin", "IOReader"]
+    @staticmethod
+    def read_bytes(
+        settings: Settings,
+        data: Union[bytes, str],
+        extension: ConfigSupportedExtensions=".json"
+    ) -> UnknownConfigType:
+        """Reads an encoded config without the file system.
+        
+        Args:
+            settings: The settings.
+            data: The encoded config.
+            extension: Format of the config, as an extension of a config file.
+
+        Returns:
+            The raw unvalidated config, empty if the format is not supported.
+        """
+
+        content: UnknownConfigType = {}
+
+        if IOValidator.validate_config_extension(settings, extension) and extension in IOReader._MIXINS:
+            content = IOReader._MIXINS[extension].loads(settings, data)
+
+        return content
+
+__all__ = ["JSONMixin", "JSONObjectStream", "IOReader"]
@@ -3,6 +3,7 @@
 # pylint: disable=too-few-public-methods
 
 import os
+import stat
 
 from untils.utils.enums import WarningsLevel
 from untils.utils.constants import Constants, Strings
@@ -30,27 +31,50 @@ class IOValidator:
             FileError: The config file is not exists.
         """
 
-        if os.path.exists(file_path) and os.path.isfile(file_path):
+        try:
+            is_file: bool = stat.S_ISREG(os.stat(file_path).st_mode)
+        except (OSError, ValueError):
+            is_file = False
+
+        if is_file:
             # Processing the config file path.
-            extension: str = os.path.splitext(file_path)[1]
-            if extension in Constants.SUPPORTED_CONFIG_FORMATS:
-                if extension not in Constants.STANDART_CONFIG_FORMATS:
-                    # The config format is not in standart.
-                    settings.warning(
-                        Strings.CONFIG_EXTENSION_NOT_SUPPORTS,
-                        Strings.AUTO_CORRECT_WITH_ACCEPTING,
-                        FileWarning,
-                        warning_levels=(WarningsLevel.BASIC, WarningsLevel.STRICT),
-                        exception_levels=()
-                    )
-                return True
-        else:
-            settings.warning(
-                Strings.CONFIG_FILE_NOT_EXISTS,
-                Strings.AUTO_CORRECT_WITH_SKIPPING,
-                FileWarning,
-                FileError
-            )
+            return IOValidator.validate_config_extension(settings, os.path.splitext(file_path)[1])
+
+        settings.warning(
+            Strings.CONFIG_FILE_NOT_EXISTS,
+            Strings.AUTO_CORRECT_WITH_SKIPPING,
+            FileWarning,
+            FileError
+        )
+
+        return False
+
+    @staticmethod
+    def validate_config_extension(settings: Settings, extension: str) -> bool:
+        """Validates a config extension.
+        
+        Args:
+            settings: The settings.
+            extension: The extension with a dot.
+
+        Returns:
+            `True` if the config extension is supported, else `False`.
+
+        Raises:
+            FileWarning: The config extension is not in standart.
+        """
+
+        if extension in Constants.SUPPORTED_CONFIG_FORMATS:
+            if extension not in Constants.STANDART_CONFIG_FORMATS:
+                # The config format is not in standart.
+                settings.warning(
+                    Strings.CONFIG_EXTENSION_NOT_SUPPORTS,
+                    Strings.AUTO_CORRECT_WITH_ACCEPTING,
+                    FileWarning,
+                    warning_levels=(WarningsLevel.BASIC, WarningsLevel.STRICT),
+                    exception_levels=()
+                )
+            return True
 
         return False
 
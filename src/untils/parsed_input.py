@@ -0,0 +1,219 @@
+"""parsed_input.py - Compact immutable representation of a parsed input."""
+
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from types import MappingProxyType
+
+import sys
+
+from untils.utils.type_aliases import InputDict
+
+_KEYS: Tuple[str, str, str] = ("path", "flags", "options")
+"""Keys of the `InputDict` style access."""
+
+class ParsedInput(Mapping[str, Any]):
+    """Immutable parsed input with `InputDict` style access by `"path"`, `"flags"` and `"options"` keys.
+
+    Flags and options are kept as flat tuples of names and values. Their read-only mappings are not stored and are built on every access, so inputs stay compact after validation and routing. Keep a reference to a mapping for repeated lookups.
+
+    Path parts and names are interned, so inputs share them with each other and with command names of the parsed config.
+    """
+
+    __slots__ = ["path", "_flag_items", "_option_items"]
+
+    path: Tuple[str, ...]
+    """The commands path."""
+    _flag_items: Tuple[Any, ...]
+    """Flag names and values in a row."""
+    _option_items: Tuple[Any, ...]
+    """Option names and values in a row."""
+
+    def __init__(
+        self,
+        path: Iterable[str]=(),
+        flags: Optional[Mapping[str, Optional[bool]]]=None,
+        options: Optional[Mapping[str, Any]]=None
+    ) -> None:
+        """
+        Args:
+            path: The commands path.
+            flags: Flags by names.
+            options: Option values by names.
+        """
+
+        object.__setattr__(self, "path", tuple(map(sys.intern, path)))
+        object.__setattr__(self, "_flag_items", ParsedInput.flatten(flags))
+        object.__setattr__(self, "_option_items", ParsedInput.flatten(options))
+
+    @staticmethod
+    def flatten(mapping: Optional[Mapping[str, Any]]) -> Tuple[Any, ...]:
+        """Flattens a mapping to interned names and values in a row.
+
+        Args:
+            mapping: The mapping.
+
+        Returns:
+            The flat tuple, which is shared for empty mappings.
+        """
+
+        if not mapping:
+            return ()
+
+        items: List[Any] = []
+        for name, value in mapping.items():
+            items.append(sys.intern(name))
+            items.append(value)
+
+        return tuple(items)
+
+    @staticmethod
+    def from_dict(input_dict: Mapping[str, Any]) -> "ParsedInput":
+        """Converts an input dictionary.
+
+        Args:
+            input_dict: The parsed input dictionary.
+
+        Returns:
+            The same input dictionary, if it is already `ParsedInput`, else the converted one.
+        """
+
+        if isinstance(input_dict, ParsedInput):
+            return input_dict
+
+        return ParsedInput(input_dict["path"], input_dict["flags"], input_dict["options"])
+
+    @property
+    def flags(self) -> Mapping[str, Optional[bool]]:
+        """Flags by names. A new read-only mapping on every access."""
+
+        items: Tuple[Any, ...] = self._flag_items
+        return MappingProxyType(dict(zip(items[::2], items[1::2])))
+
+    @property
+    def options(self) -> Mapping[str, Any]:
+        """Option values by names. A new read-only mapping on every access."""
+
+        items: Tuple[Any, ...] = self._option_items
+        return MappingProxyType(dict(zip(items[::2], items[1::2])))
+
+    def to_dict(self) -> InputDict:
+        """Returns a new mutable input dictionary.
+
+        Returns:
+            The input dictionary with a list path.
+        """
+
+        return {
+            "path": list(self.path),
+            "flags": dict(self.flags),
+            "options": dict(self.options)
+        }
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "path":
+            return self.path
+        if key == "flags":
+            return self.flags
+        if key == "options":
+            return self.options
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def __contains__(self, key: object) -> bool:
+        return key in _KEYS
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"'ParsedInput' object attribute '{name}' is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'ParsedInput' object attribute '{name}' is read-only")
+
+    @staticmethod
+    def match_items(items: Tuple[Any, ...], other: Tuple[Any, ...]) -> bool:
+        """Compares flat tuples of names and values regardless of the order of names.
+
+        Args:
+            items: The flat tuple.
+            other: Other flat tuple.
+
+        Returns:
+            Do the tuples have the same names with equal values.
+        """
+
+        if items == other:
+            return True
+        if len(items) != len(other):
+            return False
+        return frozenset(zip(items[::2], items[1::2])) == frozenset(zip(other[::2], other[1::2]))
+
+    @staticmethod
+    def match_mapping(items: Tuple[Any, ...], mapping: Any) -> bool:
+        """Compares a flat tuple of names and values with a mapping without building a mapping of the tuple.
+
+        Args:
+            items: The flat tuple.
+            mapping: The mapping.
+
+        Returns:
+            Does the mapping have the same names with equal values.
+        """
+
+        if not isinstance(mapping, Mapping) or len(items) != 2 * len(mapping):
+            return False
+
+        for i in range(0, len(items), 2):
+            if items[i] not in mapping or mapping[items[i]] != items[i + 1]:
+                return False
+        return True
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, ParsedInput):
+            return (
+                self.path == value.path
+                and ParsedInput.match_items(self._flag_items, value._flag_items)
+                and ParsedInput.match_items(self._option_items, value._option_items)
+            )
+        if isinstance(value, Mapping):
+            try:
+                return (
+                    self.path == tuple(value["path"])
+                    and ParsedInput.match_mapping(self._flag_items, value["flags"])
+                    and ParsedInput.match_mapping(self._option_items, value["options"])
+                )
+            except (KeyError, TypeError):
+                return False
+        return False
+
+    def __ne__(self, value: object) -> bool:
+        return not self == value
+
+    def __hash__(self) -> int:
+        flag_items: Tuple[Any, ...] = self._flag_items
+        option_items: Tuple[Any, ...] = self._option_items
+        return hash((
+            self.path,
+            frozenset(zip(flag_items[::2], flag_items[1::2])),
+            frozenset(zip(option_items[::2], option_items[1::2]))
+        ))
+
+    def __sizeof__(self) -> int:
+        return (
+            object.__sizeof__(self)
+            + sys.getsizeof(self.path)
+            + sum(sys.getsizeof(part) for part in self.path)
+            + sys.getsizeof(self._flag_items)
+            + sys.getsizeof(self._option_items)
+        )
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (ParsedInput, (self.path, dict(self.flags), dict(self.options)))
+
+    def __repr__(self) -> str:
+        return f"ParsedInput(path={self.path}, flags={dict(self.flags)}, options={dict(self.options)})"
+
+__all__ = ["ParsedInput"]
@@ -1,64 +1,134 @@
 """parser.py - Parses config and input."""
 
-from typing import Dict, List, Any, cast, get_args, Optional
+from typing import Dict, List, Any, cast, get_args, Optional, Tuple, Iterator
+
+from dataclasses import dataclass
+
+import sys
+import time
 
 from untils.utils.type_aliases import (
-    CommandClass, CommandType, ConfigType, InternalCommandStates, InputDict
+    CommandClass, CommandType, ConfigType, InternalCommandStates
 )
 from untils.utils.protocols import FinalInputProtocol
 from untils.utils.enums import FinalTokenType
 
 from untils.command import CommandNode, AliasNode, StateNode
+from untils.command_trie import CommandTrieNode
 from untils.factories import CommandNodeFactory
 from untils.commands_config import CommandsConfig
+from untils.parsed_input import ParsedInput
 from untils.input_token import FinalInputTokenWord, FinalInputTokenFlag, FinalInputTokenOption
 from untils.settings import Settings
 
+@dataclass
+class ParseStats:
+    """Statistics of the config parsing."""
+
+    commands_time: float = 0.0
+    """Time of `Parser.parse_commands` in seconds."""
+    config_time: float = 0.0
+    """Time of `Parser.parse_config` in seconds, including the compiled command tree."""
+    nodes: int = 0
+    """Count of all command nodes."""
+    words: int = 0
+    """Count of `Word` nodes."""
+    fallbacks: int = 0
+    """Count of `Fallback` nodes."""
+    flags: int = 0
+    """Count of `Flag` nodes."""
+    options: int = 0
+    """Count of `Option` nodes."""
+    aliases: int = 0
+    """Count of aliases in all nodes."""
+    alias_nodes: int = 0
+    """Count of distinct `AliasNode` objects."""
+    depth: int = 0
+    """Depth of the command tree."""
+
 class Parser:
     """This class parses raw data to intermediate reference."""
 
     @staticmethod
-    def parse_commands(commands: Dict[str, CommandClass]) -> List[CommandNode]:
+    def parse_commands(
+        commands: Dict[str, CommandClass],
+        stats: Optional[ParseStats]=None
+    ) -> List[CommandNode]:
         """Parses a command dictionary to the AST tree of command nodes.
+
+        The tree is walked iteratively, so its depth is not limited by the recursion limit. Names and aliases are interned, equal aliases share a single `AliasNode`.
         
         Args:
             commands: The commands dictionary.
+            stats: The statistics, which are filled if passed.
 
         Returns:
             Parsed AST tree of the command nodes.
         """
 
-        def parse_command(name: str, command_dict: CommandClass) -> CommandNode:
-            """Parses a single command.
-            
-            Args:
-                name: The command name.
-                command_dict: The command dictionary.
+        start: float = time.perf_counter()
+
+        result: List[CommandNode] = []
+        alias_nodes: Dict[Tuple[str, str], AliasNode] = {}
+        counts: Dict[str, int] = {"word": 0, "fallback": 0, "flag": 0, "option": 0}
+        aliases_count: int = 0
+        max_depth: int = 0
+
+        # Siblings list with the iterator of commands, which are parsed to it.
+        stack: List[Tuple[List[CommandNode], Iterator[Tuple[str, Any]]]] = [
+            (result, iter(commands.items()))
+        ]
+
+        while stack:
+            siblings, items = stack[-1]
+            item: Optional[Tuple[str, Any]] = next(items, None)
 
-            Returns:
-                The command node.
-            """
+            if item is None:
+                stack.pop()
+                continue
 
+            name: str = sys.intern(item[0])
+            command_dict: CommandClass = cast(CommandClass, item[1])
             command_type: CommandType = command_dict.get("type")
             aliases: List[AliasNode] = []
             default: Any = None
             children: List[CommandNode] = []
 
             if command_type in ("word", "flag", "option"):
-                aliases = [AliasNode(name, alias) for alias in command_dict.get("aliases", [])]
+                for alias in command_dict.get("aliases", []):
+                    key: Tuple[str, str] = (name, sys.intern(alias))
+                    alias_node: Optional[AliasNode] = alias_nodes.get(key)
+                    if alias_node is None:
+                        alias_node = AliasNode(*key)
+                        alias_nodes[key] = alias_node
+                    aliases.append(alias_node)
+                aliases_count += len(aliases)
 
             if command_type in ("flag", "option"):
-                default: Any = command_dict.get("default", None)
-
-            if command_type in ("word", "fallback"):
-                children: List[CommandNode] = []
-
-                for child_name, child_dict in command_dict.get("children", {}).items():
-                    children.append(parse_command(child_name, cast(CommandClass, child_dict)))
+                default = command_dict.get("default", None)
 
-            return CommandNodeFactory.create(name, command_type, aliases, default, children)
+            siblings.append(
+                CommandNodeFactory.create(name, command_type, aliases, default, children)
+            )
+            counts[command_type] += 1
+            max_depth = max(max_depth, len(stack))
 
-        return [parse_command(name, command_dict) for name, command_dict in commands.items()]
+            if command_type in ("word", "fallback"):
+                # Children are parsed into the list, which is already referenced by the node.
+                stack.append((children, iter(command_dict.get("children", {}).items())))
+
+        if stats is not None:
+            stats.commands_time = time.perf_counter() - start
+            stats.nodes = sum(counts.values())
+            stats.words = counts["word"]
+            stats.fallbacks = counts["fallback"]
+            stats.flags = counts["flag"]
+            stats.options = counts["option"]
+            stats.aliases = aliases_count
+            stats.alias_nodes = len(alias_nodes)
+            stats.depth = max_depth
+
+        return result
 
     @staticmethod
     def parse_states(states_dict: Dict[str, List[str]]) -> List[StateNode]:
@@ -77,32 +147,58 @@ class Parser:
         ]
 
     @staticmethod
-    def parse_config(config_dict: ConfigType) -> CommandsConfig:
+    def parse_trie(commands: List[CommandNode]) -> CommandTrieNode:
+        """Compiles parsed commands to the command tree with name and alias indexes.
+        
+        Args:
+            commands: The parsed commands.
+
+        Returns:
+            The root node of the command tree.
+        """
+
+        return CommandTrieNode.build(commands)
+
+    @staticmethod
+    def parse_config(
+        config_dict: ConfigType,
+        stats: Optional[ParseStats]=None
+    ) -> CommandsConfig:
         """Parses a validated config.
         
         Args:
             config_dict: The config dictionary.
+            stats: The statistics, which are filled if passed.
 
         Returns:
             The parsed config.
         """
 
-        return CommandsConfig(
+        start: float = time.perf_counter()
+        commands: List[CommandNode] = Parser.parse_commands(config_dict["commands"], stats)
+
+        config: CommandsConfig = CommandsConfig(
             config_dict["version"],
             Parser.parse_states(config_dict["states"]),
-            Parser.parse_commands(config_dict["commands"])
+            commands,
+            Parser.parse_trie(commands)
         )
 
+        if stats is not None:
+            stats.config_time = time.perf_counter() - start
+
+        return config
+
     @staticmethod
-    def parse_input(settings: Settings, tokens: List[FinalInputProtocol]) -> InputDict:
-        """Parses a user input to input dictionary.
+    def parse_input(settings: Settings, tokens: List[FinalInputProtocol]) -> ParsedInput:
+        """Parses a user input to the parsed input.
         
         Args:
             tokens: Final tokenized tokens.
             debug: Determines debug messages display.
 
         Returns:
-            The parsed input dictionary.
+            The parsed input.
         """
 
         settings.logger.debug(f"Parser.parse_input(tokens={tokens}).")
@@ -131,10 +227,6 @@ class Parser:
 
             i += 1
 
-        return {
-            "path": path,
-            "flags": flags,
-            "options": options
-        }
+        return ParsedInput(path, flags, options)
 
-__all__ = ["Parser"]
+__all__ = ["Parser", "ParseStats"]
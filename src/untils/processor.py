@@ -1,16 +1,31 @@
 """processor.py - `Processor` class for universal pipe-lines."""
 
-from typing import List, Optional
+from typing import List, Optional, Iterable, Iterator, Dict, Any, Tuple, Mapping, Union, BinaryIO, TextIO, cast
 
-from untils.utils.type_aliases import UnknownConfigType, ConfigType, InputDict
-from untils.utils.protocols import FinalInputProtocol
+import codecs
+import io
+import json
+import os
 
-from untils.ioreader import IOReader
+from untils.utils.type_aliases import (
+    UnknownConfigType, ConfigType, ConfigVersion, CommandClass, CommandStates, ConfigSupportedExtensions
+)
+from untils.utils.protocols import FinalInputProtocol, RawInputProtocol
+from untils.utils.enums import RawTokenType
+from untils.utils.constants import Strings
+from untils.utils.lib_warnings import InputStructureWarning, InputStructureError
+
+from untils.ioreader import IOReader, JSONObjectStream
+from untils.iovalidator import IOValidator
 from untils.config_validator import ConfigValidator
-from untils.parser import Parser
+from untils.parser import Parser, ParseStats
 from untils.commands_config import CommandsConfig
+from untils.parsed_input import ParsedInput
+from untils.command import CommandNode, CommandFallbackNode
+from untils.command_trie import CommandTrieNode
 from untils.settings import Settings
-from untils.input_token import RawInputToken
+from untils.diagnostics import Diagnostics
+from untils.input_token import TokenBuffer
 from untils.tokenizer import Tokenizer
 from untils.input_validator import InputValidator
 
@@ -37,6 +52,125 @@ class Processor:
         content: UnknownConfigType = IOReader.read_file(settings, file_path)
         settings.logger.debug(f"Content: {content}.")
 
+        return Processor.process_config(settings, content)
+
+    @staticmethod
+    def load_config_from_mapping(settings: Settings, config_dict: Mapping[str, Any]) -> CommandsConfig:
+        """Loads config from a raw config mapping, for example a decoded JSON object. The mapping is not changed.
+        
+        Args:
+            settings: The settings.
+            config_dict: The raw config.
+        
+        Returns:
+            Validated and parsed config.
+        """
+
+        settings.logger.debug("Load config from a mapping.")
+
+        # `ConfigValidator.validate_commands` replaces aliases of raw root commands.
+        content: Dict[str, Any] = dict(config_dict)
+        if isinstance(content.get("commands"), dict):
+            content["commands"] = {
+                key: dict(command_dict) if isinstance(command_dict, dict) else command_dict
+                for key, command_dict in content["commands"].items()
+            }
+
+        return Processor.process_config(settings, cast(UnknownConfigType, content))
+
+    @staticmethod
+    def load_config_from_bytes(
+        settings: Settings,
+        data: Union[bytes, str],
+        extension: ConfigSupportedExtensions=".json"
+    ) -> CommandsConfig:
+        """Loads config from an encoded config.
+        
+        Args:
+            settings: The settings.
+            data: The encoded config. Bytes may be in UTF-8, UTF-16 or UTF-32.
+            extension: Format of the config, as an extension of a config file.
+        
+        Returns:
+            Validated and parsed config.
+        """
+
+        settings.logger.debug(f"Load config from {len(data)} bytes of '{extension}'.")
+
+        ### 1. IOReader ###
+        content: UnknownConfigType = IOReader.read_bytes(settings, data, extension)
+        settings.logger.debug(f"Content: {content}.")
+
+        return Processor.process_config(settings, content)
+
+    @staticmethod
+    def load_config_from_stream(
+        settings: Settings,
+        stream: Union[BinaryIO, TextIO],
+        extension: ConfigSupportedExtensions=".json",
+        is_streaming: bool=False,
+        chunk_size: int=1 << 16
+    ) -> CommandsConfig:
+        """Loads config from a readable file object. The file object is not closed.
+        
+        Args:
+            settings: The settings.
+            stream: The binary or text file object. Binary objects are decoded from UTF-8.
+            extension: Format of the config, as an extension of a config file.
+            is_streaming: Is the config read incrementally, as `load_config_streaming` does.
+            chunk_size: Count of characters in a read chunk of the incremental reader.
+        
+        Returns:
+            Validated and parsed config.
+        """
+
+        if not is_streaming or extension not in IOReader.STREAMING_EXTENSIONS:
+            return Processor.load_config_from_bytes(settings, stream.read(), extension)
+
+        settings.logger.debug("Load config from a file object with streaming.")
+
+        IOValidator.validate_config_extension(settings, extension)
+        text: TextIO = stream if isinstance(stream, io.TextIOBase) else cast(TextIO, codecs.getreader("utf-8")(stream))
+        return Processor.process_config_stream(settings, JSONObjectStream(text, chunk_size))
+
+    @staticmethod
+    def load_config_streaming(settings: Settings, file_path: str, chunk_size: int=1 << 16) -> CommandsConfig:
+        """Loads a JSON config with the incremental reader.
+
+        Every root command is validated and parsed as soon as it is read, and its raw dictionary is dropped, so peak memory is the parsed config and a single raw root command instead of the whole file text and two raw trees. Results and warnings are the same as `load_config` returns and issues, but warnings of the version are issued after warnings of commands.
+        
+        Args:
+            settings: The settings.
+            file_path: The file path.
+            chunk_size: Count of characters in a read chunk.
+        
+        Returns:
+            Validated and parsed config.
+        """
+
+        settings.logger.debug(f"Load config by path with streaming: '{file_path}'.")
+
+        ### 1. IOReader ###
+        if os.path.splitext(file_path)[1] not in IOReader.STREAMING_EXTENSIONS or not os.path.isfile(file_path):
+            # Not supported and not found files are reported by `load_config`.
+            return Processor.load_config(settings, file_path)
+
+        IOValidator.validate_config_path(settings, file_path)
+        with open(file_path, "r", encoding="utf-8") as file:
+            return Processor.process_config_stream(settings, JSONObjectStream(file, chunk_size))
+
+    @staticmethod
+    def process_config(settings: Settings, content: UnknownConfigType) -> CommandsConfig:
+        """Validates and parses a raw config.
+        
+        Args:
+            settings: The settings.
+            content: The raw unvalidated config.
+        
+        Returns:
+            Validated and parsed config.
+        """
+
         ### 2. ConfigValidator ###
         settings.logger.debug("Validating the config.")
         raw_config: ConfigType = ConfigValidator.validate_config(settings, content)
@@ -44,17 +178,116 @@ class Processor:
 
         ### 3. Parser ###
         settings.logger.debug("Parsing.")
-        config: CommandsConfig = Parser.parse_config(raw_config)
+        stats: ParseStats = ParseStats()
+        config: CommandsConfig = Parser.parse_config(raw_config, stats)
         settings.logger.debug(f"Parsed config: {config}.")
+        settings.logger.debug(f"Parse stats: {stats}.")
 
         return config
 
+    @staticmethod
+    def process_config_stream(settings: Settings, stream: JSONObjectStream) -> CommandsConfig:
+        """Validates and parses a raw JSON config from the incremental reader, root command by root command. Configs, which are not JSON objects, are decoded at once and processed with `process_config`.
+        
+        Args:
+            settings: The settings.
+            stream: The incremental reader at the start of the config.
+        
+        Returns:
+            Validated and parsed config.
+
+        Raises:
+            json.JSONDecodeError: If the config is not valid JSON.
+        """
+
+        if stream.peek() != "{":
+            content: Any = stream.read_value()
+            if stream.peek() != "":
+                raise json.JSONDecodeError("Extra data", stream.buffer, stream.position)
+            return Processor.process_config(settings, content)
+
+        fields: Dict[str, Any] = {}
+        nodes: Dict[str, CommandNode] = {}
+        used_aliases: List[str] = []
+
+        stream.start_object()
+        while (key := stream.next_key()) is not None:
+            if key != "commands" or stream.peek() != "{":
+                fields[key] = stream.read_value()
+                continue
+
+            ### 2. ConfigValidator and Parser of root commands ###
+            fields[key] = {}
+            stream.start_object()
+            while (name := stream.next_key()) is not None:
+                command_dict: Any = stream.read_value()
+                name, node = Processor.load_command(settings, name, command_dict)
+                if node is not None:
+                    if "aliases" in command_dict:
+                        ConfigValidator.validate_used_aliases(settings, name, command_dict["aliases"], used_aliases)
+                    nodes[name] = node
+
+        if stream.peek() != "":
+            raise json.JSONDecodeError("Extra data", stream.buffer, stream.position)
+
+        ### 3. ConfigValidator of other fields ###
+        config_dict: UnknownConfigType = cast(UnknownConfigType, fields)
+        version: ConfigVersion = ConfigValidator.validate_version(settings, config_dict)
+        if not isinstance(fields.get("commands"), dict):
+            ConfigValidator.validate_commands(settings, config_dict)
+        states: CommandStates = ConfigValidator.validate_states(settings, config_dict, nodes)
+
+        ### 4. Parser ###
+        config: CommandsConfig = CommandsConfig(version, Parser.parse_states(states), list(nodes.values()))
+        settings.logger.debug(f"Parsed config: {config}.")
+
+        return config
+
+    @staticmethod
+    def load_command(settings: Settings, key: str, command_dict: Any) -> Tuple[str, Optional[CommandNode]]:
+        """Validates and parses a raw root command, as `ConfigValidator.validate_commands` and `Parser.parse_commands` do. Aliases are not checked against other root commands.
+        
+        Args:
+            settings: The settings.
+            key: The raw name.
+            command_dict: The raw command.
+
+        Returns:
+            The validated name and the parsed command, `None` if the command is not valid.
+        """
+
+        key = ConfigValidator.validate_name(settings, key, is_fallback=(command_dict.get("type") == "fallback"))
+        command: Optional[CommandClass] = ConfigValidator.validate_command(settings, command_dict)
+        if not command:
+            return key, None
+
+        key = ConfigValidator.validate_name(settings, key)
+        return key, Parser.parse_commands({key: command})[0]
+
+    @staticmethod
+    def load_config_with_diagnostics(
+        settings: Settings,
+        file_path: str
+    ) -> Tuple[CommandsConfig, Diagnostics]:
+        """Loads config in the diagnostics mode.
+        
+        Args:
+            settings: The settings.
+            file_path: The file path.
+        
+        Returns:
+            Validated and parsed config and collected warnings.
+        """
+
+        with settings.collect_diagnostics() as diagnostics:
+            return Processor.load_config(settings, file_path), diagnostics
+
     @staticmethod
     def process_input(
         settings: Settings,
         config: Optional[CommandsConfig],
         input_str: str
-    ) -> InputDict:
+    ) -> ParsedInput:
         """Validates a user input.
         
         Args:
@@ -63,15 +296,18 @@ class Processor:
             debug: Determines debug messages display.
 
         Returns:
-            Validated and parsed input dict.
+            Validated and parsed input.
         """
 
+        if settings.is_fused_input:
+            return Processor.process_input_fused(settings, config, input_str)
+
         settings.logger.debug(f"Processing input string: '{input_str}'.")
 
         ### 1. Tokenizer ###
         settings.logger.debug("Tokenizing the input.")
         tokenizer: Tokenizer = Tokenizer(settings, input_str)
-        tokens: List[RawInputToken] = tokenizer.tokenize_input()
+        tokens: List[RawInputProtocol] = tokenizer.tokenize_input()
         settings.logger.debug(f"Tokens: {tokens}.")
 
         ### 2. InputValidator ###
@@ -82,9 +318,148 @@ class Processor:
 
         ### 3. Parser ###
         settings.logger.debug("Parsing the input.")
-        parsed_representation: InputDict = Parser.parse_input(settings, validated_tokens)
+        parsed_representation: ParsedInput = Parser.parse_input(settings, validated_tokens)
         settings.logger.debug(f"Parsed input: {parsed_representation}.")
 
         return parsed_representation
 
+    @staticmethod
+    def process_input_with_diagnostics(
+        settings: Settings,
+        config: Optional[CommandsConfig],
+        input_str: str
+    ) -> Tuple[ParsedInput, Diagnostics]:
+        """Validates a user input in the diagnostics mode.
+        
+        Args:
+            settings: The settings.
+            config: The validated and parsed commands config.
+            input_str: The user input.
+
+        Returns:
+            Validated and parsed input and collected warnings.
+        """
+
+        with settings.collect_diagnostics() as diagnostics:
+            return Processor.process_input(settings, config, input_str), diagnostics
+
+    @staticmethod
+    def process_input_fused(
+        settings: Settings,
+        config: Optional[CommandsConfig],
+        input_str: str
+    ) -> ParsedInput:
+        """Validates a user input in a single fused pass.
+
+        The input is scanned to flat lists of token types and values. Then a single walk over them follows `InputValidator` rules with its shared name, flag and option helpers, fills the input dict as `Parser.parse_input` does and resolves the path in the command tree for `Fallback` defaults. No token objects and intermediate token lists are created. Results, warnings and exceptions are the same as in the staged pipeline.
+        
+        Args:
+            settings: The settings.
+            config: The validated and parsed commands config.
+            input_str: The user input.
+
+        Returns:
+            Validated and parsed input.
+        """
+
+        ### 1. Scanning ###
+        types, values = Tokenizer(settings, input_str).tokenize_columns()
+        length: int = len(types)
+
+        path: List[str] = []
+        flags: Dict[str, Optional[bool]] = {}
+        options: Dict[str, Any] = {}
+        node: Optional[CommandTrieNode] = config.trie if config is not None else None
+
+        ### 2. Validation, parsing and path resolution ###
+        i: int = 0
+        while i < length:
+            token_type: RawTokenType = types[i]
+            part: Any = None
+
+            if token_type == RawTokenType.WORD:
+                part = values[i]
+                path.append(part)
+                i += 1
+
+            elif token_type == RawTokenType.MINUS:
+                start: int = i
+                while i < length and types[i] == RawTokenType.MINUS:
+                    i += 1
+
+                if i - start == 1:
+                    # `Flag` construction.
+                    name, value, i = InputValidator.scan_flag(settings, types, values, i)
+
+                    if name != "":
+                        flags[name] = value
+                        part = value
+                else:
+                    # `Option` construction.
+                    name, option_value, i = InputValidator.scan_option(settings, types, values, i)
+
+                    if option_value != "":
+                        options[name] = option_value
+                        part = option_value
+
+            elif token_type == RawTokenType.STRING:
+                part = values[i]
+                path.append(part)
+
+            elif token_type != RawTokenType.SPACE:
+                settings.warning(
+                    Strings.UNKNOWN_TOKEN,
+                    Strings.AUTO_CORRECT_WITH_SKIPPING,
+                    InputStructureWarning,
+                    InputStructureError,
+                    position=i
+                )
+
+            if part is not None and node is not None:
+                # Every final token is a step in the command tree.
+                node = node.get_child(part)
+
+            i += 1
+
+        ### 3. `Fallback` defaults ###
+        defaults: List[str] = []
+        while node is not None and node.children != []:
+            node = node.fallback
+            if node is not None:
+                defaults.append(str(cast(CommandFallbackNode, node.command).default))
+
+        if node is not None:
+            path.extend(defaults)
+
+        return ParsedInput(path, flags, options)
+
+    @staticmethod
+    def process_many(
+        settings: Settings,
+        config: Optional[CommandsConfig],
+        lines: Iterable[str]
+    ) -> Iterator[ParsedInput]:
+        """Validates many user inputs, which are tokenized at once to a columnar buffer.
+        
+        Args:
+            settings: The settings.
+            config: The validated and parsed commands config.
+            lines: The user inputs without line breaks.
+
+        Returns:
+            Validated and parsed inputs in the inputs order.
+        """
+
+        ### 1. Tokenizer ###
+        settings.logger.debug("Tokenizing the inputs.")
+        buffer: TokenBuffer = Tokenizer.tokenize_many(settings, lines)
+
+        for i in range(len(buffer)):
+            ### 2. InputValidator ###
+            input_validator: InputValidator = InputValidator(settings, config, buffer[i])
+            validated_tokens: List[FinalInputProtocol] = input_validator.validate_input(settings)
+
+            ### 3. Parser ###
+            yield Parser.parse_input(settings, validated_tokens)
+
 __all__ = ["Processor"]
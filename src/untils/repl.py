@@ -0,0 +1,164 @@
+"""repl.py - Asyncio read-eval loop of user input."""
+
+from typing import Awaitable, Callable, List, Optional, TextIO, Tuple
+
+import asyncio
+import concurrent.futures
+import sys
+
+from untils.utils.constants import Strings
+from untils.utils.lib_warnings import InputError
+from untils.command_system import CommandSystem
+from untils.parsed_input import ParsedInput
+from untils.suggestions import Suggestion
+
+class AsyncRepl:
+    """Asyncio loop, which reads input lines without blocking the event loop and executes them with `CommandSystem.execute_async`.
+
+    Every line is passed through `process_input`, `is_input_valid` and `get_normalized_path`. Rejected inputs are logged with the settings logger, including suggestions for unknown commands. Exceptions of commands are logged and the loop goes on. The loop ends on end of input, on `stop` or on cancellation of the running task.
+    """
+
+    __slots__ = [
+        "command_system", "read_line", "output", "prompt", "timeout", "executor",
+        "exit_commands", "is_running", "_reader"
+    ]
+
+    command_system: CommandSystem
+    """The command system."""
+    read_line: Callable[[], Awaitable[str]]
+    """Reads an input line. Empty string means end of input."""
+    output: Optional[TextIO]
+    """Stream of the prompt. The prompt is not written if it is `None`."""
+    prompt: str
+    """Prompt before every input."""
+    timeout: Optional[float]
+    """Max time of every command in seconds."""
+    executor: Optional[concurrent.futures.Executor]
+    """Executor of sync command functions."""
+    exit_commands: Tuple[str, ...]
+    """Input strings, which stop the loop."""
+    is_running: bool
+    """Is the loop running."""
+    _reader: Optional[concurrent.futures.ThreadPoolExecutor]
+    """Single thread of blocking reads of the default input."""
+
+    def __init__(
+        self,
+        command_system: CommandSystem,
+        read_line: Optional[Callable[[], Awaitable[str]]]=None,
+        output: Optional[TextIO]=sys.stdout,
+        prompt: str="> ",
+        timeout: Optional[float]=None,
+        executor: Optional[concurrent.futures.Executor]=None,
+        exit_commands: Tuple[str, ...]=("exit",)
+    ) -> None:
+        """
+        Args:
+            command_system: The command system.
+            read_line: Reads an input line. Empty string means end of input. By default `sys.stdin` is read in a separate thread.
+            output: Stream of the prompt. The prompt is not written if it is `None`.
+            prompt: Prompt before every input.
+            timeout: Max time of every command in seconds. Not limited by default.
+            executor: Executor of sync command functions. The default executor of the event loop by default.
+            exit_commands: Input strings, which stop the loop.
+        """
+
+        self.command_system = command_system
+        self.read_line = self.read_stdin if read_line is None else read_line
+        self.output = output
+        self.prompt = prompt
+        self.timeout = timeout
+        self.executor = executor
+        self.exit_commands = exit_commands
+        self.is_running = False
+        self._reader = None
+
+    async def read_stdin(self) -> str:
+        """Reads a line of `sys.stdin` in a separate thread.
+
+        Returns:
+            The line, empty string on end of input.
+        """
+
+        if self._reader is None:
+            self._reader = concurrent.futures.ThreadPoolExecutor(1, "untils-repl-reader")
+
+        return await asyncio.get_running_loop().run_in_executor(self._reader, sys.stdin.readline)
+
+    async def process(self, input_str: str) -> bool:
+        """Processes, validates and executes an input string.
+
+        Args:
+            input_str: The input string.
+
+        Returns:
+            `True` if a command was completed, else `False`. `False` if the command raised an exception.
+        """
+
+        input_dict: Optional[ParsedInput] = None
+        try:
+            input_dict = self.command_system.process_input(input_str)
+            if not self.command_system.is_input_valid(input_dict):
+                self.suggest(input_dict)
+                return False
+            normalized_path: List[str] = self.command_system.get_normalized_path(input_dict)
+        except InputError as e:
+            self.command_system.settings.logger.warning(Strings.INPUT_REJECTED.substitute(error=e))
+            if input_dict is not None:
+                self.suggest(input_dict)
+            return False
+
+        try:
+            return await self.command_system.execute_async(
+                input_str, input_dict, normalized_path, timeout=self.timeout, executor=self.executor
+            )
+        except Exception as e:    # pylint: disable=broad-exception-caught
+            self.command_system.settings.logger.error(Strings.COMMAND_RAISED.substitute(error=e), exc_info=e)
+            return False
+
+    def suggest(self, input_dict: ParsedInput) -> None:
+        """Logs "did you mean" suggestions for an unknown command of a rejected input.
+
+        Args:
+            input_dict: The rejected input.
+        """
+
+        suggestions: List[Suggestion] = self.command_system.suggest(input_dict)
+        if suggestions:
+            self.command_system.settings.logger.info(Strings.DID_YOU_MEAN.substitute(
+                suggestions=", ".join(f"'{suggestion.text}'" for suggestion in suggestions)
+            ))
+
+    async def run(self) -> None:
+        """Runs the loop until end of input, `stop` or cancellation."""
+
+        self.is_running = True
+
+        try:
+            while self.is_running:
+                if self.output is not None:
+                    self.output.write(self.prompt)
+                    self.output.flush()
+
+                line: str = await self.read_line()
+                if line == "":
+                    break
+
+                input_str: str = line.rstrip("\r\n")
+                if input_str in self.exit_commands:
+                    break
+
+                await self.process(input_str)
+        finally:
+            self.is_running = False
+            if self._reader is not None:
+                # A blocked read can't be interrupted, so the thread is not waited.
+                self._reader.shutdown(wait=False)
+                self._reader = None
+
+    def stop(self) -> None:
+        """Stops the loop after the current input."""
+
+        self.is_running = False
+
+__all__ = ["AsyncRepl"]
@@ -0,0 +1,331 @@
+"""route_index.py - Compiled index of the command routing."""
+
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple
+
+import itertools
+
+from untils.utils.type_aliases import CommandPath, CallableCommand
+
+_NEVER: FrozenSet[str] = frozenset()
+"""Alternatives of path parts, which match nothing."""
+
+_LITERAL: int = 0
+"""Rank of a literal part match."""
+_ALTERNATIVE: int = 1
+"""Rank of an alternatives part match."""
+_ANY: int = 2
+"""Rank of a `"-any"` part match."""
+
+_VERSIONS: Iterator[int] = itertools.count()
+"""Versions of route tables, which are unique between tables."""
+
+class RouteNode:
+    """A node of the route index for a single part of command paths."""
+
+    __slots__ = ["literals", "alternatives", "any", "routes"]
+
+    literals: Dict[str, "RouteNode"]
+    """Children by literal parts."""
+    alternatives: Dict[FrozenSet[str], "RouteNode"]
+    """Children by alternatives parts."""
+    any: Optional["RouteNode"]
+    """Child by the `"-any"` part."""
+    routes: Dict[CommandPath, int]
+    """Registration orders of command paths, which end in this node."""
+
+    def __init__(self) -> None:
+        self.literals = {}
+        self.alternatives = {}
+        self.any = None
+        self.routes = {}
+
+    def is_empty(self) -> bool:
+        """Returns `True` if the node has no routes and children."""
+
+        return not (self.routes or self.literals or self.alternatives or self.any)
+
+    def get_child(self, part: object) -> Optional["RouteNode"]:
+        """Returns a child by a command path part.
+
+        Args:
+            part: The command path part.
+
+        Returns:
+            The child, else `None`.
+        """
+
+        if isinstance(part, str):
+            return self.any if part == "-any" else self.literals.get(part)
+        return self.alternatives.get(RouteNode.get_alternatives(part))
+
+    def add_child(self, part: object) -> "RouteNode":
+        """Returns a child by a command path part, which is created if not exists.
+
+        Args:
+            part: The command path part.
+
+        Returns:
+            The child.
+        """
+
+        child: Optional[RouteNode] = self.get_child(part)
+        if child is not None:
+            return child
+
+        child = RouteNode()
+        if isinstance(part, str):
+            if part == "-any":
+                self.any = child
+            else:
+                self.literals[part] = child
+        else:
+            self.alternatives[RouteNode.get_alternatives(part)] = child
+
+        return child
+
+    def remove_child(self, part: object) -> None:
+        """Removes a child by a command path part.
+
+        Args:
+            part: The command path part.
+        """
+
+        if isinstance(part, str):
+            if part == "-any":
+                self.any = None
+            else:
+                self.literals.pop(part, None)
+        else:
+            self.alternatives.pop(RouteNode.get_alternatives(part), None)
+
+    @staticmethod
+    def get_alternatives(part: object) -> FrozenSet[str]:
+        """Returns alternatives of a command path part, which is not a string.
+
+        Args:
+            part: The command path part.
+
+        Returns:
+            The alternatives of lists and tuples, else empty alternatives, which match nothing.
+        """
+
+        if isinstance(part, (list, tuple)):
+            return frozenset(part)    # pyright: ignore[reportUnknownArgumentType]
+        return _NEVER
+
+class RouteIndex:
+    """Index of command paths for dispatch of normalized paths.
+
+    A command path matches a normalized path, if their common parts match, as in `CommandSystem.access_path` with `is_inclusive=False`. The most specific command path wins: the one with more matched parts, then with literal parts before alternatives and alternatives before `"-any"` from the first part, then the shorter one, then the earlier registered one.
+    """
+
+    __slots__ = ["root", "exact", "size", "_order"]
+
+    root: RouteNode
+    """The root node."""
+    exact: Dict[Tuple[str, ...], CommandPath]
+    """Command paths of only literal parts by their parts."""
+    size: int
+    """Count of indexed command paths."""
+    _order: int
+    """Next registration order."""
+
+    def __init__(self, paths: Sequence[CommandPath]=()) -> None:
+        """
+        Args:
+            paths: Command paths in registration order.
+        """
+
+        self.root = RouteNode()
+        self.exact = {}
+        self.size = 0
+        self._order = 0
+
+        for path in paths:
+            self.add(path)
+
+    def add(self, path: CommandPath) -> None:
+        """Indexes a command path.
+
+        Args:
+            path: The command path.
+        """
+
+        node: RouteNode = self.root
+        for part in path:
+            node = node.add_child(part)
+
+        if path in node.routes:
+            return
+
+        node.routes[path] = self._order
+        self._order += 1
+        self.size += 1
+
+        if all(isinstance(part, str) and part != "-any" for part in path):
+            self.exact[tuple(path)] = path    # pyright: ignore[reportArgumentType]
+
+    def remove(self, path: CommandPath) -> None:
+        """Removes a command path from the index. Empty nodes are removed too.
+
+        Args:
+            path: The command path.
+        """
+
+        nodes: List[RouteNode] = [self.root]
+        for part in path:
+            child: Optional[RouteNode] = nodes[-1].get_child(part)
+            if child is None:
+                return
+            nodes.append(child)
+
+        if nodes[-1].routes.pop(path, None) is None:
+            return
+
+        self.size -= 1
+        if self.exact.get(tuple(path)) == path:    # pyright: ignore[reportArgumentType]
+            del self.exact[tuple(path)]    # pyright: ignore[reportArgumentType]
+
+        for i in range(len(path), 0, -1):
+            if not nodes[i].is_empty():
+                break
+            nodes[i - 1].remove_child(path[i - 1])
+
+    def resolve(self, path: Sequence[str]) -> Optional[CommandPath]:
+        """Finds the most specific command path for a normalized path.
+
+        Args:
+            path: The normalized path.
+
+        Returns:
+            The command path, else `None`.
+        """
+
+        exact: Optional[CommandPath] = self.exact.get(tuple(path))
+        if exact is not None:
+            # No other command path is more specific.
+            return exact
+
+        length: int = len(path)
+        best_key: Optional[Tuple[int, Tuple[int, ...], int, int]] = None
+        best: Optional[CommandPath] = None
+        stack: List[Tuple[RouteNode, int, Tuple[int, ...]]] = [(self.root, 0, ())]
+
+        while stack:
+            node, depth, ranks = stack.pop()
+
+            if depth == length:
+                found: Optional[Tuple[int, int, CommandPath]] = RouteIndex.find_shortest(node)
+                if found is not None:
+                    key: Tuple[int, Tuple[int, ...], int, int] = (-depth, ranks, depth + found[0], found[1])
+                    if best_key is None or key < best_key:
+                        best_key, best = key, found[2]
+                continue
+
+            if node.routes:
+                route, order = min(node.routes.items(), key=lambda item: item[1])
+                key = (-depth, ranks, depth, order)
+                if best_key is None or key < best_key:
+                    best_key, best = key, route
+
+            part: str = path[depth]
+            if node.any is not None:
+                stack.append((node.any, depth + 1, ranks + (_ANY,)))
+            for alternatives, child in node.alternatives.items():
+                if part in alternatives:
+                    stack.append((child, depth + 1, ranks + (_ALTERNATIVE,)))
+            literal: Optional[RouteNode] = node.literals.get(part)
+            if literal is not None:
+                stack.append((literal, depth + 1, ranks + (_LITERAL,)))
+
+        return best
+
+    @staticmethod
+    def find_shortest(node: RouteNode) -> Optional[Tuple[int, int, CommandPath]]:
+        """Finds the shortest and the earliest registered command path in a subtree.
+
+        Args:
+            node: The subtree root.
+
+        Returns:
+            The depth below the node, the registration order and the command path, else `None`.
+        """
+
+        level: List[RouteNode] = [node]
+        depth: int = 0
+
+        while level:
+            found: Optional[Tuple[int, int, CommandPath]] = None
+            for current in level:
+                for route, order in current.routes.items():
+                    if found is None or order < found[1]:
+                        found = (depth, order, route)
+            if found is not None:
+                return found
+
+            level = [
+                child
+                for current in level
+                for child in (
+                    *current.literals.values(),
+                    *current.alternatives.values(),
+                    *((current.any,) if current.any is not None else ())
+                )
+            ]
+            depth += 1
+
+        return None
+
+    def __len__(self) -> int:
+        return self.size
+
+class RouteTable(Dict[CommandPath, CallableCommand]):
+    """Command routing dictionary, which takes a new version, when its command paths may be changed.
+
+    Versions are unique between tables, so a `RouteIndex` built for one table and version is stale for any other. Changing a command of a registered path keeps the version.
+    """
+
+    __slots__ = ["version"]
+
+    version: int
+    """Version of command paths."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.version = next(_VERSIONS)
+
+    def __setitem__(self, key: CommandPath, value: CallableCommand) -> None:
+        if key not in self:
+            self.version = next(_VERSIONS)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: CommandPath) -> None:
+        super().__delitem__(key)
+        self.version = next(_VERSIONS)
+
+    def __ior__(self, other: Any) -> "RouteTable":
+        self.update(other)
+        return self
+
+    def setdefault(self, key: CommandPath, default: CallableCommand) -> CallableCommand:    # pyright: ignore[reportIncompatibleMethodOverride]
+        if key not in self:
+            self.version = next(_VERSIONS)
+        return super().setdefault(key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self.version = next(_VERSIONS)
+
+    def pop(self, key: CommandPath, *default: Any) -> Any:    # pyright: ignore[reportIncompatibleMethodOverride]
+        self.version = next(_VERSIONS)
+        return super().pop(key, *default)
+
+    def popitem(self) -> Tuple[CommandPath, CallableCommand]:
+        self.version = next(_VERSIONS)
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        self.version = next(_VERSIONS)
+
+__all__ = ["RouteIndex", "RouteNode", "RouteTable"]
@@ -0,0 +1,337 @@
+"""script_runner.py - Batch runner of command scripts."""
+
+from typing import Deque, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+from dataclasses import dataclass, field
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import contextvars
+import copy
+import os
+import sys
+import threading
+import time
+
+from untils.utils.enums import WarningsLevel
+from untils.utils.constants import Strings
+from untils.utils.lib_warnings import InputError
+from untils.commands_config import CommandsConfig
+from untils.command_system import CommandSystem
+from untils.parsed_input import ParsedInput
+from untils.settings import Settings
+
+ScriptLine = Tuple[int, str, Optional[ParsedInput], Optional[List[str]], Optional[str]]
+"""Line number, input string, parsed input, normalized path and error of a processed line. Parsed input and normalized path are `None` on errors."""
+
+_ParsedLine = Tuple[int, str, Optional[ParsedInput], Optional[str]]
+"""Line number, input string, parsed input and error of a line, which is processed by a worker. Parsed input is `None` on errors."""
+
+_worker: threading.local = threading.local()
+"""Command system of the current worker."""
+
+def _init_worker(settings: Settings, config: Optional[CommandsConfig], warnings_level: WarningsLevel) -> None:
+    """Initializes the command system of a worker thread or process.
+
+    Args:
+        settings: Settings of the command system, which are copied for the worker.
+        config: Commands config of the command system.
+        warnings_level: Warnings level of the command system for workers, which don't run in its context.
+    """
+
+    worker_settings: Settings = copy.copy(settings)
+    # A worker starts without the active session, so the level is set to the copy.
+    worker_settings.warnings_level = warnings_level
+    _worker.command_system = CommandSystem(worker_settings, config)
+
+def _process_chunk(chunk: List[Tuple[int, str]]) -> List[_ParsedLine]:
+    """Tokenizes and parses lines with the command system of the worker. Validation depends on the current state, so it is not done here.
+
+    Args:
+        chunk: Line numbers and input strings.
+
+    Returns:
+        Parsed lines.
+    """
+
+    command_system: CommandSystem = _worker.command_system
+    lines: List[_ParsedLine] = []
+
+    for number, input_str in chunk:
+        try:
+            lines.append((number, input_str, command_system.process_input(input_str), None))
+        except InputError as e:
+            lines.append((number, input_str, None, str(e)))
+        except Exception as e:    # pylint: disable=broad-exception-caught
+            lines.append((number, input_str, None, f"{type(e).__name__}: {e}"))
+
+    return lines
+
+@dataclass
+class ScriptSummary:
+    """Results of `ScriptRunner.run`."""
+
+    lines: int = 0
+    """Count of read lines."""
+    skipped: int = 0
+    """Count of blank and comment lines."""
+    executed: int = 0
+    """Count of lines with completed commands."""
+    input_errors: int = 0
+    """Count of lines, which were not processed or not valid."""
+    not_implemented: int = 0
+    """Count of lines without commands in the command routing."""
+    command_errors: int = 0
+    """Count of lines, which commands raised exceptions."""
+    time: float = 0.0
+    """Total time in seconds."""
+    failures: List[Tuple[int, str, str]] = field(default_factory=list)
+    """Line numbers, input strings and errors of failed lines."""
+
+    @property
+    def failed(self) -> int:
+        """Count of failed lines."""
+
+        return self.input_errors + self.not_implemented + self.command_errors
+
+    def __str__(self) -> str:
+        return Strings.SCRIPT_SUMMARY.substitute(
+            lines=self.lines,
+            time=f"{self.time:.2f}",
+            speed=f"{self.lines / self.time if self.time else 0.0:,.0f}",
+            executed=self.executed,
+            skipped=self.skipped,
+            failed=self.failed,
+            input_errors=self.input_errors,
+            not_implemented=self.not_implemented,
+            command_errors=self.command_errors
+        )
+
+class ScriptRunner:
+    """Runner of command scripts.
+
+    Lines are tokenized and parsed in chunks on a thread or process pool, where every worker has a copy of the command system settings and config. Thread workers run every chunk in a copy of the calling context, so they see the active `Session`. Parsed lines are streamed back in line order, then every line is validated, normalized and executed in the calling thread before the next one, so commands, which change the current state, affect the following lines. Lines are parsed again in the calling thread, if the config is changed during the run. Blank lines and lines, which start with `#`, are skipped.
+    """
+
+    __slots__ = ["command_system", "chunk_size", "max_workers", "is_processes", "window", "tracking", "output"]
+
+    command_system: CommandSystem
+    """The command system, which executes commands."""
+    chunk_size: int
+    """Count of lines in a chunk."""
+    max_workers: Optional[int]
+    """Count of workers. By default is chosen by the pool."""
+    is_processes: bool
+    """Is a process pool used, else a thread pool."""
+    window: int
+    """Max count of chunks in processing ahead of execution."""
+    tracking: bool
+    """Is save executed lines in history."""
+    output: Optional[TextIO]
+    """Stream of the summary. The summary is not written if it is `None`."""
+
+    def __init__(
+        self,
+        command_system: CommandSystem,
+        chunk_size: int=1000,
+        max_workers: Optional[int]=None,
+        is_processes: bool=False,
+        window: int=16,
+        tracking: bool=False,
+        output: Optional[TextIO]=sys.stdout
+    ) -> None:
+        """
+        Args:
+            command_system: The command system, which executes commands.
+            chunk_size: Count of lines in a chunk.
+            max_workers: Count of workers. By default is chosen by the pool.
+            is_processes: Is a process pool used, else a thread pool. Settings and config must be picklable for processes.
+            window: Max count of chunks in processing ahead of execution.
+            tracking: Is save executed lines in history.
+            output: Stream of the summary. The summary is not written if it is `None`.
+        """
+
+        self.command_system = command_system
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.is_processes = is_processes
+        self.window = window
+        self.tracking = tracking
+        self.output = output
+
+    @staticmethod
+    def read_lines(script: Union[str, "os.PathLike[str]", Iterable[str]]) -> Iterator[str]:
+        """Reads lines of a script lazily.
+
+        Args:
+            script: Path of a UTF-8 script file or lines.
+
+        Returns:
+            Iterator of lines without line breaks.
+        """
+
+        if isinstance(script, (str, os.PathLike)):
+            with open(script, "r", encoding="utf-8") as file:
+                for line in file:
+                    yield line.rstrip("\r\n")
+        else:
+            for line in script:
+                yield line.rstrip("\r\n")
+
+    def create_pool(self) -> Executor:
+        """Creates a pool of workers with the command system settings and config."""
+
+        settings: Settings = self.command_system.settings
+        initargs: Tuple[Settings, Optional[CommandsConfig], WarningsLevel] = (
+            settings, self.command_system.config, settings.warnings_level
+        )
+        if self.is_processes:
+            return ProcessPoolExecutor(self.max_workers, initializer=_init_worker, initargs=initargs)
+        return ThreadPoolExecutor(self.max_workers, "untils-script", initializer=_init_worker, initargs=initargs)
+
+    def iter_lines(
+        self,
+        script: Union[str, "os.PathLike[str]", Iterable[str]],
+        summary: Optional[ScriptSummary]=None
+    ) -> Iterator[ScriptLine]:
+        """Parses lines of a script on the pool, then validates and normalizes every line in the calling thread, when it is requested.
+
+        Args:
+            script: Path of a UTF-8 script file or lines.
+            summary: Summary, which counts read and skipped lines.
+
+        Returns:
+            Iterator of processed lines in line order.
+        """
+
+        def chunks() -> Iterator[List[Tuple[int, str]]]:
+            lines: Iterator[Tuple[int, str]] = enumerate(ScriptRunner.read_lines(script), 1)
+            chunk: List[Tuple[int, str]] = []
+
+            for number, line in lines:
+                if summary is not None:
+                    summary.lines += 1
+                if line.strip() == "" or line.lstrip().startswith("#"):
+                    if summary is not None:
+                        summary.skipped += 1
+                    continue
+
+                chunk.append((number, line))
+                if len(chunk) == self.chunk_size:
+                    yield chunk
+                    chunk = []
+
+            if chunk:
+                yield chunk
+
+        config: Optional[CommandsConfig] = self.command_system.config
+
+        with self.create_pool() as pool:
+            pending: Deque["Future[List[_ParsedLine]]"] = deque()
+
+            def submit(chunk: List[Tuple[int, str]]) -> None:
+                if self.is_processes:
+                    pending.append(pool.submit(_process_chunk, chunk))
+                else:
+                    # A context can't be entered by two threads, so every chunk gets its copy.
+                    pending.append(pool.submit(contextvars.copy_context().run, _process_chunk, chunk))
+
+            def validate() -> Iterator[ScriptLine]:
+                for number, input_str, input_dict, error in pending.popleft().result():
+                    yield self.validate_line(number, input_str, input_dict, error, config)
+
+            try:
+                for chunk in chunks():
+                    submit(chunk)
+                    if len(pending) >= self.window:
+                        yield from validate()
+                while pending:
+                    yield from validate()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def validate_line(
+        self,
+        number: int,
+        input_str: str,
+        input_dict: Optional[ParsedInput],
+        error: Optional[str],
+        config: Optional[CommandsConfig]
+    ) -> ScriptLine:
+        """Validates and normalizes a parsed line with the command system in its current state.
+
+        Args:
+            number: Line number.
+            input_str: Input string.
+            input_dict: Parsed input, `None` on errors.
+            error: Error of parsing.
+            config: Config, which the line was parsed with. The line is parsed again, if the command system has another config.
+
+        Returns:
+            The processed line.
+        """
+
+        try:
+            if self.command_system.config is not config:
+                input_dict = self.command_system.process_input(input_str)
+            elif input_dict is None:
+                return number, input_str, None, None, error
+
+            if not self.command_system.is_input_valid(input_dict):
+                return number, input_str, None, None, Strings.SCRIPT_LINE_INVALID
+            return number, input_str, input_dict, self.command_system.get_normalized_path(input_dict), None
+        except InputError as e:
+            return number, input_str, None, None, str(e)
+        except Exception as e:    # pylint: disable=broad-exception-caught
+            return number, input_str, None, None, f"{type(e).__name__}: {e}"
+
+    def run(self, script: Union[str, "os.PathLike[str]", Iterable[str]]) -> ScriptSummary:
+        """Runs a script. Failed lines are logged and don't stop the script.
+
+        Args:
+            script: Path of a UTF-8 script file or lines.
+
+        Returns:
+            Summary of the run, which is also written to `output`.
+        """
+
+        summary: ScriptSummary = ScriptSummary()
+        start: float = time.perf_counter()
+
+        for number, input_str, input_dict, normalized_path, error in self.iter_lines(script, summary):
+            if input_dict is None or normalized_path is None:
+                summary.input_errors += 1
+                self.fail(summary, number, input_str, error or Strings.SCRIPT_LINE_INVALID)
+                continue
+
+            try:
+                if self.command_system.execute(input_str, input_dict, normalized_path, self.tracking):
+                    summary.executed += 1
+                else:
+                    summary.not_implemented += 1
+                    self.fail(summary, number, input_str, Strings.COMMAND_NOT_IMPLEMENTED.substitute(input_str=input_str))
+            except Exception as e:    # pylint: disable=broad-exception-caught
+                summary.command_errors += 1
+                self.fail(summary, number, input_str, f"{type(e).__name__}: {e}")
+
+        summary.time = time.perf_counter() - start
+        if self.output is not None:
+            self.output.write(str(summary) + "\n")
+
+        return summary
+
+    def fail(self, summary: ScriptSummary, number: int, input_str: str, error: str) -> None:
+        """Records and logs a failed line.
+
+        Args:
+            summary: The summary.
+            number: Line number.
+            input_str: Input string.
+            error: The error.
+        """
+
+        summary.failures.append((number, input_str, error))
+        self.command_system.settings.logger.warning(Strings.SCRIPT_LINE_FAILED.substitute(line=number, error=error))
+
+__all__ = ["ScriptLine", "ScriptRunner", "ScriptSummary"]
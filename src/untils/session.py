@@ -0,0 +1,115 @@
+"""session.py - Lightweight per-user sessions of a shared command system."""
+
+from typing import FrozenSet, Iterator, Optional, Union
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from untils.utils.enums import WarningsLevel, InternalState
+from untils.utils.constants import Strings
+from untils.history import HistoryBuffer
+
+_INTERNAL_STATES: FrozenSet[str] = frozenset(state.value for state in InternalState)
+"""Names of internal states. Only `__init__` of them can be the current state."""
+
+_current_session: ContextVar[Optional["Session"]] = ContextVar("untils_session", default=None)
+"""The active session of the current context."""
+
+class Session:
+    """Per-user state for a shared `CommandSystem`: the current state, the warnings level and the command history.
+
+    A session is active in a context, so threads and `asyncio` tasks of different users never share it. While it is active, `Settings.current_state`, `Settings.warnings_level` and command history of any command system refer to the session, and the config, routes and caches stay shared. Session history is kept only in memory and is never written to `CommandSystem.history_log`. Diagnostics collectors are context-bound too, so a collector sees only warnings of its own session.
+    """
+
+    __slots__ = ["_current_state", "warnings_level", "history"]
+
+    _current_state: str
+    """Current commands state of the session."""
+    warnings_level: Optional[WarningsLevel]
+    """Warnings level of the session. The settings warnings level is used if it is `None`."""
+    history: HistoryBuffer
+    """Command history of the session."""
+
+    def __init__(
+        self,
+        current_state: Union[str, InternalState]=InternalState.INIT,
+        warnings_level: Optional[WarningsLevel]=None,
+        history: Optional[HistoryBuffer]=None
+    ) -> None:
+        """
+        Args:
+            current_state: Initial commands state.
+            warnings_level: Warnings level of the session. The settings warnings level is used by default.
+            history: Command history. A new history with default limits by default.
+
+        Raises:
+            ValueError: If the state is internal and not `__init__`.
+        """
+
+        self.current_state = current_state
+        self.warnings_level = warnings_level
+        self.history = HistoryBuffer() if history is None else history
+
+    @property
+    def current_state(self) -> str:
+        """Current commands state of the session. Internal states except `__init__` are rejected, as by `Settings.current_state`, but always with `ValueError`, because a session has no settings."""
+
+        return self._current_state
+
+    @current_state.setter
+    def current_state(self, value: Union[str, InternalState]) -> None:
+        state: str = Session.get_state_name(value)
+        if not Session.is_state_allowed(state):
+            raise ValueError(Strings.INVALID_INTERNAL_STATE_CHANGE.substitute(state=state))
+        self._current_state = state
+
+    @staticmethod
+    def get_state_name(state: Union[str, InternalState]) -> str:
+        """Returns the name of a commands state.
+
+        Args:
+            state: The state or the internal state.
+
+        Returns:
+            The state name.
+        """
+
+        return state.value if isinstance(state, InternalState) else state
+
+    @staticmethod
+    def is_state_allowed(state: str) -> bool:
+        """Checks, that a state can be the current state: internal states except `__init__` can't.
+
+        Args:
+            state: The state name.
+
+        Returns:
+            `True` if the state can be the current state.
+        """
+
+        return state == InternalState.INIT.value or state not in _INTERNAL_STATES
+
+    @staticmethod
+    def get_current() -> Optional["Session"]:
+        """Returns the active session of the current context, else `None`."""
+
+        return _current_session.get()
+
+    @contextmanager
+    def activate(self) -> Iterator["Session"]:
+        """Activates the session in the current context. Nested activations restore the previous session.
+
+        Yields:
+            The session.
+        """
+
+        token = _current_session.set(self)
+        try:
+            yield self
+        finally:
+            _current_session.reset(token)
+
+    def __str__(self) -> str:
+        return f"Session(state='{self.current_state}', warnings_level={self.warnings_level}, history={len(self.history)})"
+
+__all__ = ["Session"]
@@ -2,61 +2,105 @@
 
 # pyright: reportUnnecessaryIsInstance=false
 
-from typing import Optional, Tuple, Type, Union
+from typing import Optional, Tuple, Type, Union, Any, Iterator
+
+from string import Template
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 import warnings
 import logging
 
-from untils.utils.enums import WarningsLevel, InternalState
+from untils.utils.enums import WarningsLevel, InternalState, TokenizerBackend
 from untils.utils.decorators import alternative
 from untils.utils.constants import Strings
 from untils.utils.lib_warnings import ConfigError, ConfigWarning
 
+from untils.diagnostics import Diagnostic, Diagnostics
+from untils.session import Session
+
+_diagnostics: ContextVar[Tuple[Diagnostics, ...]] = ContextVar("untils_diagnostics", default=())
+"""Active collectors of warnings in the current context from outer to inner."""
+
 class Settings:
     """The global context settings."""
 
-    __slots__ = ["__warnings_level", "__current_state", "__logger"]
+    __slots__ = [
+        "__warnings_level", "__current_state", "__logger", "__tokenizer_backend", "__is_fused_input"
+    ]
 
     __warnings_level: WarningsLevel
     __current_state: str
     __logger: logging.Logger
+    __tokenizer_backend: TokenizerBackend
+    __is_fused_input: bool
 
     @property
     def warnings_level(self) -> WarningsLevel:
-        """Warnings level, which defines strictness of code flow."""
+        """Warnings level, which defines strictness of code flow. The warnings level of the active `Session` is used, if it is set."""
+        session: Optional[Session] = Session.get_current()
+        if session is not None and session.warnings_level is not None:
+            return session.warnings_level
         return self.__warnings_level
 
     @warnings_level.setter
     def warnings_level(self, value: WarningsLevel) -> None:
-        self.__warnings_level = value
+        session: Optional[Session] = Session.get_current()
+        if session is not None:
+            session.warnings_level = value
+        else:
+            self.__warnings_level = value
 
     @property
     def current_state(self) -> str:
-        """Current commands state."""
+        """Current commands state. The state of the active `Session` is used, if it is. Internal states except `__init__` are rejected in and out of sessions."""
+        session: Optional[Session] = Session.get_current()
+        if session is not None:
+            return session.current_state
         return self.__current_state
 
     @current_state.setter
     def current_state(self, value: Union[str, InternalState]) -> None:
-        if isinstance(value, str):
-            if value != InternalState.INIT.value:
-                self.warning(
-                    Strings.INVALID_INTERNAL_STATE_CHANGE.substitute(state=value),
-                    Strings.AUTO_CORRECT_TO_LATEST,
-                    RuntimeWarning,
-                    ValueError
-                )
-            else:
-                self.__current_state = value
-        elif isinstance(value, InternalState):
-            if value != InternalState.INIT:
-                self.warning(
-                    Strings.INVALID_INTERNAL_STATE_CHANGE.substitute(state=value),
-                    Strings.AUTO_CORRECT_TO_LATEST,
-                    RuntimeWarning,
-                    ValueError
-                )
-            else:
-                self.__current_state = value.value
+        state: str = Session.get_state_name(value)
+        if not Session.is_state_allowed(state):
+            self.warning(
+                Strings.INVALID_INTERNAL_STATE_CHANGE,
+                Strings.AUTO_CORRECT_TO_LATEST,
+                RuntimeWarning,
+                ValueError,
+                state=state
+            )
+            return
+
+        session: Optional[Session] = Session.get_current()
+        if session is not None:
+            session.current_state = state
+        else:
+            self.__current_state = state
+
+    @property
+    def tokenizer_backend(self) -> TokenizerBackend:
+        """Scanner engine, which used by `Tokenizer`."""
+        return self.__tokenizer_backend
+
+    @tokenizer_backend.setter
+    def tokenizer_backend(self, value: TokenizerBackend) -> None:
+        self.__tokenizer_backend = value
+
+    @property
+    def is_fused_input(self) -> bool:
+        """Is `Processor.process_input` goes from an input string to the input dict in a single fused pass."""
+        return self.__is_fused_input
+
+    @is_fused_input.setter
+    def is_fused_input(self, value: bool) -> None:
+        self.__is_fused_input = value
+
+    @property
+    def diagnostics(self) -> Optional[Diagnostics]:
+        """The inner active collector of warnings in the current context, if the diagnostics mode is on."""
+        collectors: Tuple[Diagnostics, ...] = _diagnostics.get()
+        return collectors[-1] if collectors else None
 
     @property
     def logger(self) -> logging.Logger:
@@ -67,6 +111,8 @@ class Settings:
         self.__warnings_level = WarningsLevel.STRICT
         self.__current_state = InternalState.INIT.value
         self.__logger = logging.getLogger(__name__)
+        self.__tokenizer_backend = TokenizerBackend.CHARACTER
+        self.__is_fused_input = False
         self.__logger.debug(Strings.LOG_SETTINGS_INIT)
 
     @alternative(version=Strings.ANY_VERSION)
@@ -78,7 +124,7 @@ class Settings:
             The current warnings level.
         """
 
-        return self.__warnings_level
+        return self.warnings_level
 
     @alternative(version=Strings.ANY_VERSION)
     def set_warnings_level(self, warnings_level: WarningsLevel=WarningsLevel.STRICT) -> None:
@@ -89,28 +135,74 @@ class Settings:
             warnings_level: The warnings level.
         """
 
-        self.__warnings_level = warnings_level
+        self.warnings_level = warnings_level
+
+    @contextmanager
+    def collect_diagnostics(self, is_silent: bool=True) -> Iterator[Diagnostics]:
+        """Turns on the diagnostics mode, where warnings are collected instead of logging and `warnings.warn`.\n
+        Exceptions are raised by the warnings level as usual. The collector is active only in the current context, so threads and `asyncio` tasks don't share it. Nested collectors get warnings of the inner collection too.
+
+        Args:
+            is_silent: Are collected warnings not logged and issued. Not silent collectors only observe warnings.
+
+        Yields:
+            The collector of warnings.
+        """
+
+        diagnostics: Diagnostics = Diagnostics(is_silent)
+        token = _diagnostics.set(_diagnostics.get() + (diagnostics,))
+
+        try:
+            yield diagnostics
+        finally:
+            _diagnostics.reset(token)
 
     def warning(
         self,
-        message: str,
+        message: Union[str, Template],
         auto_correct: str,
         warning_type: Type[Warning]=ConfigWarning,
         exception_type: Type[Exception]=ConfigError,
         warning_levels: Optional[Union[Tuple[WarningsLevel, ...], Tuple[None]]]=None,
-        exception_levels: Optional[Union[Tuple[WarningsLevel, ...], Tuple[None]]]=None
+        exception_levels: Optional[Union[Tuple[WarningsLevel, ...], Tuple[None]]]=None,
+        position: Optional[int]=None,
+        **fields: Any
     ) -> None:
-        """Warning or exception in validators."""
+        """Warning or exception in validators.
+        
+        Args:
+            message: The message or the message template, which is substituted with `fields`.
+            auto_correct: The auto-correction message.
+            warning_type: The warning type.
+            exception_type: The exception type.
+            warning_levels: Warnings levels with a warning, `(WarningsLevel.BASIC,)` by default.
+            exception_levels: Warnings levels with an exception, `(WarningsLevel.STRICT,)` by default.
+            position: Index of the input token.
+            **fields: Substitutions of the message template.
+        """
+
+        collectors: Tuple[Diagnostics, ...] = _diagnostics.get()
+        for diagnostics in collectors:
+            diagnostics.warnings_count += 1
 
         if self.warnings_level in (warning_levels or (WarningsLevel.BASIC,)):
-            self.logger.warning(message + ' ' + auto_correct, stacklevel=3)
+            if collectors:
+                record: Diagnostic = Diagnostic(message, fields, auto_correct, warning_type, position)
+                for diagnostics in collectors:
+                    diagnostics.add(record)
+                if any(diagnostics.is_silent for diagnostics in collectors):
+                    return
+
+            text: str = Diagnostic.format(message, fields)
+            self.logger.warning(text + ' ' + auto_correct, stacklevel=3)
             warnings.warn(
-                message + ' ' + auto_correct,
+                text + ' ' + auto_correct,
                 warning_type,
                 stacklevel=3
             )
         elif self.warnings_level in (exception_levels or (WarningsLevel.STRICT,)):
-            self.logger.error(message, stacklevel=3)
-            raise exception_type(message)
+            text: str = Diagnostic.format(message, fields)
+            self.logger.error(text, stacklevel=3)
+            raise exception_type(text)
 
 __all__ = ["Settings"]
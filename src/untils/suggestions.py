@@ -0,0 +1,225 @@
+"""suggestions.py - "Did you mean" suggestions for unknown command names."""
+
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from dataclasses import dataclass
+
+from untils.utils.constants import Strings
+from untils.command_trie import CommandTrieNode
+from untils.commands_config import CommandsConfig
+
+def get_edit_distance(first: str, second: str) -> int:
+    """Returns the Levenshtein distance of two strings.
+
+    Args:
+        first: The first string.
+        second: The second string.
+
+    Returns:
+        Minimal count of inserted, deleted and replaced characters.
+    """
+
+    if len(first) < len(second):
+        first, second = second, first
+    if not second:
+        return len(first)
+
+    previous: List[int] = list(range(len(second) + 1))
+    for i, first_char in enumerate(first, 1):
+        current: List[int] = [i]
+        for j, second_char in enumerate(second, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (first_char != second_char)
+            ))
+        previous = current
+
+    return previous[-1]
+
+@dataclass(frozen=True)
+class Suggestion:
+    """A suggested command name."""
+
+    text: str
+    """Suggested name or alias."""
+    name: str
+    """Original name of the command."""
+    distance: int
+    """Edit distance to the unknown name."""
+
+    def get_rank(self) -> Tuple[int, bool, str]:
+        """Returns the sort key: closer names first, names before aliases, then alphabetically."""
+
+        return self.distance, self.text != self.name, self.text
+
+class DeletionIndex:
+    """Symmetric deletion index of words.
+
+    Every word is indexed by all its variants with up to `max_distance` deleted characters. Words within an edit distance of a searched word share a variant with it, so a search looks up only variants of the searched word and checks distances of found candidates.
+    """
+
+    __slots__ = ["max_distance", "words", "variants"]
+
+    max_distance: int
+    """Max edit distance of searches."""
+    words: Dict[str, str]
+    """Original command names by words."""
+    variants: Dict[str, List[str]]
+    """Words by variants with deleted characters."""
+
+    def __init__(self, words: Sequence[Tuple[str, str]], max_distance: int) -> None:
+        """
+        Args:
+            words: Words and original command names.
+            max_distance: Max edit distance of searches.
+        """
+
+        self.max_distance = max_distance
+        self.words = {}
+        self.variants = {}
+
+        for word, name in words:
+            if word in self.words:
+                continue
+            self.words[word] = name
+            for variant in DeletionIndex.get_variants(word, max_distance):
+                self.variants.setdefault(variant, []).append(word)
+
+    @staticmethod
+    def get_variants(word: str, max_distance: int) -> Set[str]:
+        """Returns variants of a word with up to `max_distance` deleted characters, including the word."""
+
+        variants: Set[str] = {word}
+        level: Set[str] = {word}
+        for _ in range(max_distance):
+            level = {variant[:i] + variant[i + 1:] for variant in level for i in range(len(variant))}
+            variants |= level
+
+        return variants
+
+    def search(self, word: str, max_distance: Optional[int]=None) -> List[Suggestion]:
+        """Finds words within a distance.
+
+        Args:
+            word: The searched word.
+            max_distance: Max edit distance, not greater than the index one. The index one by default.
+
+        Returns:
+            Not ranked suggestions.
+
+        Raises:
+            ValueError: If the distance is greater than the index one.
+        """
+
+        if max_distance is None:
+            max_distance = self.max_distance
+        if max_distance > self.max_distance:
+            raise ValueError(Strings.SUGGESTION_DISTANCE_INVALID.substitute(
+                max_distance=max_distance,
+                index_distance=self.max_distance
+            ))
+
+        found: List[Suggestion] = []
+        checked: Set[str] = set()
+        for variant in DeletionIndex.get_variants(word, max_distance):
+            for candidate in self.variants.get(variant, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if abs(len(candidate) - len(word)) > max_distance:
+                    continue
+                distance: int = get_edit_distance(word, candidate)
+                if distance <= max_distance:
+                    found.append(Suggestion(candidate, self.words[candidate], distance))
+
+        return found
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+class SuggestionIndex:
+    """Suggestions of command names and aliases for unknown path parts with deletion indexes of every command tree level.
+
+    Indexes are built lazily for visited levels and max distances, and root commands are filtered by states.
+    """
+
+    __slots__ = ["config", "_levels", "_roots"]
+
+    config: CommandsConfig
+    """The commands config."""
+    _levels: Dict[Tuple[CommandTrieNode, int], DeletionIndex]
+    """Positioned children of nodes by nodes and max distances."""
+    _roots: Dict[Tuple[str, int], DeletionIndex]
+    """Root commands by state names and max distances."""
+
+    def __init__(self, config: CommandsConfig) -> None:
+        """
+        Args:
+            config: The commands config.
+        """
+
+        self.config = config
+        self._levels = {}
+        self._roots = {}
+
+    def get_level(self, node: CommandTrieNode, state: str, max_distance: int) -> DeletionIndex:
+        """Returns the index of positioned children of a node. Root commands are filtered by a state."""
+
+        is_root: bool = node is self.config.trie
+        index: Optional[DeletionIndex] = (
+            self._roots.get((state, max_distance)) if is_root else self._levels.get((node, max_distance))
+        )
+        if index is not None:
+            return index
+
+        roots: FrozenSet[str] = self.config.graph.get_roots(state)
+        index = DeletionIndex([
+            (word, child.name)
+            for word, child in node.words.items()
+            if not is_root or child.name in roots
+        ], max_distance)
+
+        if is_root:
+            self._roots[(state, max_distance)] = index
+        else:
+            self._levels[(node, max_distance)] = index
+        return index
+
+    def suggest(
+        self,
+        path: Sequence[str],
+        state: str,
+        limit: int=3,
+        max_distance: int=2
+    ) -> List[Suggestion]:
+        """Suggests commands for the first unknown part of a path.
+
+        Args:
+            path: The commands path.
+            state: The current state.
+            limit: Max count of suggestions.
+            max_distance: Max edit distance.
+
+        Returns:
+            Ranked suggestions, empty if all parts are known.
+        """
+
+        roots: FrozenSet[str] = self.config.graph.get_roots(state)
+        node: CommandTrieNode = self.config.trie
+        for i, part in enumerate(path):
+            child: Optional[CommandTrieNode] = node.get_child(part)
+            if child is not None and (i > 0 or child.name in roots):
+                node = child
+                continue
+
+            found: List[Suggestion] = self.get_level(node, state, max_distance).search(part)
+            found.sort(key=Suggestion.get_rank)
+            return found[:limit]
+
+        return []
+
+    def __str__(self) -> str:
+        return f"SuggestionIndex(levels={len(self._levels)}, roots={len(self._roots)})"
+
+__all__ = ["DeletionIndex", "Suggestion", "SuggestionIndex", "get_edit_distance"]
@@ -1,12 +1,41 @@
 """tokenizer.py - Tokenize raw user input string to raw tokens."""
 
-from typing import List, Literal, cast
+from typing import List, Literal, cast, Dict, Pattern, Tuple, Optional, Iterable
 
-from untils.utils.enums import RawTokenType
-from untils.input_token import RawInputToken
+from array import array
+from bisect import bisect_left
+
+import re
+
+from untils.utils.enums import RawTokenType, TokenizerBackend
+from untils.utils.constants import Strings
+from untils.utils.protocols import RawInputProtocol
+from untils.input_token import RawInputToken, SpanSource, SpanInputToken, TokenBuffer
 
 from untils.settings import Settings
 
+_SCAN_PATTERN: Pattern[str] = re.compile(r"[^\W_]+|[ \-!'\"]")
+"""Master pattern of the table-driven scanner: a `Word` run or a single significant character.
+
+`[^\\W_]` matches exactly the characters, for which `str.isalnum()` is `True`. All other characters are skipped.
+"""
+
+_SINGLE_TOKENS: Dict[str, RawInputToken] = {
+    ' ': RawInputToken(RawTokenType.SPACE, ' '),
+    '-': RawInputToken(RawTokenType.MINUS, '-'),
+    '!': RawInputToken(RawTokenType.NOT, '!')
+}
+"""Lookup table of single-character tokens. Raw tokens are immutable, so they are shared."""
+
+_STRING_BODIES: Dict[str, Pattern[str]] = {
+    '\'': re.compile(r"[^'\\]*"),
+    '\"': re.compile(r'[^"\\]*')
+}
+"""Patterns of unescaped `String` parts by an opening quote."""
+
+_OFFSET_LIMIT: int = 2 ** (8 * array('I').itemsize) - 1
+"""Max offset in offset arrays of `TokenBuffer`."""
+
 class Tokenizer:
     """Tokenizer class, which tokenizes user input."""
 
@@ -16,7 +45,7 @@ class Tokenizer:
     """The settings."""
     _input_str: str
     """The user input string."""
-    _result: List[RawInputToken]
+    _result: List[RawInputProtocol]
     """The processed raw tokens."""
     _i: int
     """Tokenize index."""
@@ -38,21 +67,22 @@ class Tokenizer:
 
         string_char: Literal['\'', '\"'] = cast(Literal['\'', '\"'], self._input_str[self._i])
         self._i += 1
-        string: str = ""
+        parts: List[str] = []
 
         while self._i < len(self._input_str) and self._input_str[self._i] != string_char:
             if self._input_str[self._i] == '\\':
                 if self._input_str[self._i + 1] in ('\'', '\"'):
-                    string += self._input_str[self._i + 1]
+                    parts.append(self._input_str[self._i + 1])
                 elif self._input_str[self._i + 1] == '\\':
-                    string += self._input_str[self._i]
+                    parts.append(self._input_str[self._i])
 
                 self._i += 1
             else:
-                string += self._input_str[self._i]
+                parts.append(self._input_str[self._i])
 
             self._i += 1
 
+        string: str = "".join(parts)
         self._result.append(RawInputToken(RawTokenType.STRING, string))
         self._settings.logger.debug(f"String: '{string}'")
 
@@ -68,13 +98,354 @@ class Tokenizer:
         self._result.append(RawInputToken(RawTokenType.WORD, word))
         self._settings.logger.debug(f"Word: '{word}'")
 
-    def tokenize_input(self) -> List[RawInputToken]:
-        """Tokenizes the input.
+    def scan_string(self, start: int, length: Optional[int]=None) -> Tuple[int, bool]:
+        """Scans the `String` type by whole unescaped parts without building the value.
+        
+        Args:
+            start: Index of the opening quote.
+            length: Index, where the input ends. By default is the input string length.
+
+        Returns:
+            End offset of the string body (the closing quote or the input length) and is the body has escape sequences.
+
+        Raises:
+            IndexError: A backslash is the last character of the input, same as in the character scanner.
+        """
+
+        input_str: str = self._input_str
+        if length is None:
+            length = len(input_str)
+        string_char: str = input_str[start]
+        match_body = _STRING_BODIES[string_char].match
+        is_escaped: bool = False
+        i: int = start + 1
+
+        while True:
+            i = match_body(input_str, i, length).end()    # pyright: ignore[reportOptionalMemberAccess]
+
+            if i >= length or input_str[i] == string_char:
+                return i, is_escaped
+
+            # Escape sequence.
+            if i + 1 >= length:
+                raise IndexError("string index out of range")
+            is_escaped = True
+            i += 2
+
+    def tokenize_input_table(self) -> List[RawInputProtocol]:
+        """Tokenizes the input with the table-driven scanner.
+
+        Produces the same raw tokens as the character scanner, but matches whole runs with a single compiled pattern and takes single-character tokens from a lookup table.
         
         Returns:
             Unvalidated raw tokens.
         """
 
+        input_str: str = self._input_str
+        search = _SCAN_PATTERN.search
+        result: List[RawInputProtocol] = []
+        i: int = 0
+
+        while True:
+            match = search(input_str, i)
+            if match is None:
+                break
+
+            start: int = match.start()
+            char: str = input_str[start]
+            token = _SINGLE_TOKENS.get(char)
+
+            if token is not None:
+                result.append(token)
+                i = start + 1
+            elif char in _STRING_BODIES:
+                end, is_escaped = self.scan_string(start)
+                string: str = input_str[start + 1:end]
+                if is_escaped:
+                    string = SpanInputToken.unescape(string)
+                result.append(RawInputToken(RawTokenType.STRING, string))
+                i = end + 1
+            else:
+                result.append(RawInputToken(RawTokenType.WORD, match.group()))
+                i = match.end()
+
+        self._result = result
+        self._i = i
+
+        return result
+
+    def tokenize_columns(self) -> Tuple[List[RawTokenType], List[str]]:
+        """Tokenizes the input with the table-driven scanner to flat lists without token objects.
+        
+        Returns:
+            Types and values of unvalidated raw tokens.
+        """
+
+        input_str: str = self._input_str
+        search = _SCAN_PATTERN.search
+        types: List[RawTokenType] = []
+        values: List[str] = []
+        i: int = 0
+
+        while True:
+            match = search(input_str, i)
+            if match is None:
+                break
+
+            start: int = match.start()
+            char: str = input_str[start]
+            token = _SINGLE_TOKENS.get(char)
+
+            if token is not None:
+                types.append(token.type)
+                values.append(char)
+                i = start + 1
+            elif char in _STRING_BODIES:
+                end, is_escaped = self.scan_string(start)
+                string: str = input_str[start + 1:end]
+                types.append(RawTokenType.STRING)
+                values.append(SpanInputToken.unescape(string) if is_escaped else string)
+                i = end + 1
+            else:
+                i = match.end()
+                types.append(RawTokenType.WORD)
+                values.append(match.group())
+
+        self._i = i
+
+        return types, values
+
+    def scan_span(self, i: int, source: SpanSource) -> Tuple[Optional[SpanInputToken], int]:
+        """Scans the next `SpanInputToken` with the table-driven scanner.
+        
+        Args:
+            i: Index, from which the next token is searched.
+            source: Source of the input string for the token.
+
+        Returns:
+            The next token or `None` on the input end, and the index after the token.
+        """
+
+        input_str: str = self._input_str
+        match = _SCAN_PATTERN.search(input_str, i)
+        if match is None:
+            return None, len(input_str)
+
+        start: int = match.start()
+        char: str = input_str[start]
+        token = _SINGLE_TOKENS.get(char)
+
+        if token is not None:
+            return SpanInputToken(token.type, source, start, start + 1), start + 1
+        if char in _STRING_BODIES:
+            end, is_escaped = self.scan_string(start)
+            return SpanInputToken(RawTokenType.STRING, source, start + 1, end, is_escaped), end + 1
+        return SpanInputToken(RawTokenType.WORD, source, start, match.end()), match.end()
+
+    def tokenize_input_spans(self) -> List[RawInputProtocol]:
+        """Tokenizes the input with the table-driven scanner to `SpanInputToken`s.
+
+        Tokens keep offsets into the input string and their values are materialized only on access, so quoted strings cost O(n) without intermediate strings. All tokens share a single `SpanSource`.
+        
+        Returns:
+            Unvalidated raw tokens.
+        """
+
+        source: SpanSource = SpanSource(self._input_str)
+        result: List[RawInputProtocol] = []
+        token, i = self.scan_span(0, source)
+
+        while token is not None:
+            result.append(token)
+            token, i = self.scan_span(i, source)
+
+        self._result = result
+        self._i = i
+
+        return result
+
+    def retokenize(
+        self,
+        tokens: List[RawInputProtocol],
+        position: int,
+        deleted: int,
+        inserted: str
+    ) -> List[RawInputProtocol]:
+        """Updates span tokens of the previous input after an edit, which turned it into the current input.
+
+        Tokens, which end before the edit, are reused. Scanning restarts from the last of them and stops as soon as it meets the start of an unchanged previous token after the edit, tokens after the edit are reused too.
+
+        Reused tokens are not rebased one by one. Tokens before the edit share a head `SpanSource`, tokens after it share a tail `SpanSource`, so the current input and the offset shift of the tail are single assignments. Only tokens between the previous edit and the current one are moved from one source to the other, as in a gap buffer. So typing at the same place costs as much as scanning the edited tokens however long the line is, and a jump of the edit costs one move per token it crosses.
+        
+        Args:
+            tokens: Tokens of the previous input from `tokenize_input_spans` or `retokenize`. The list is updated in place.
+            position: Edit offset in the previous input.
+            deleted: Count of deleted characters from the position.
+            inserted: Inserted text at the position.
+
+        Returns:
+            Unvalidated raw tokens of the current input.
+        """
+
+        if not tokens or not isinstance(tokens[0], SpanInputToken):
+            return self.tokenize_input_spans()
+
+        spans: List[SpanInputToken] = cast(List[SpanInputToken], tokens)
+
+        # 1. Stable tokens, which end strictly before the edit.
+        stable: int = bisect_left(spans, position, key=Tokenizer.span_end)
+        i: int = Tokenizer.span_end(spans[stable - 1]) if stable > 0 else 0
+
+        # 2. Head and tail sources with the gap index between them.
+        head: SpanSource = spans[0].span_source
+        tail_source: SpanSource = spans[-1].span_source
+        gap: int
+        if head is tail_source:
+            # All tokens share a source, the shorter side of the edit is moved to a new one.
+            if stable < len(spans) - stable:
+                head = SpanSource(head.text)
+                gap = 0
+            else:
+                tail_source = SpanSource(head.text, head.shift)
+                gap = len(spans)
+        else:
+            gap = bisect_left(spans, True, key=lambda span: span.span_source is not head)
+
+        # 3. Rescanning until the previous tokens are reached again.
+        edit_end: int = position + deleted
+        delta: int = len(inserted) - deleted
+        rescanned: List[SpanInputToken] = []
+        j: int = stable
+        tail: int = len(spans)
+        token, i = self.scan_span(i, head)
+
+        while token is not None:
+            token_start: int = Tokenizer.span_start(token)
+
+            while j < len(spans) and (
+                Tokenizer.span_start(spans[j]) < edit_end
+                or Tokenizer.span_start(spans[j]) + delta < token_start
+            ):
+                j += 1
+
+            if j < len(spans) and Tokenizer.span_start(spans[j]) + delta == token_start:
+                # The rest of the input is unchanged.
+                tail = j
+                break
+
+            rescanned.append(token)
+            token, i = self.scan_span(i, head)
+
+        # 4. Moving of the gap to the edit and rebasing of reused tokens onto the current input.
+        for k in range(gap, stable):
+            spans[k].rebase(head)
+        for k in range(tail, gap):
+            spans[k].rebase(tail_source)
+
+        tail_source.shift += delta
+        head.text = tail_source.text = self._input_str
+
+        spans[stable:tail] = rescanned
+        self._result = tokens
+        self._i = i
+
+        return tokens
+
+    @staticmethod
+    def tokenize_many(settings: Settings, lines: Iterable[str]) -> TokenBuffer:
+        """Tokenizes many inputs to a single columnar buffer with the table-driven scanner.
+
+        Inputs are joined once and every token takes a type code and two offsets in flat arrays, so the count of allocations doesn't depend on the count of tokens.
+        
+        Args:
+            settings: The settings.
+            lines: The user inputs without line breaks.
+
+        Returns:
+            The token buffer. Indexing it returns raw tokens of an input for `InputValidator`.
+
+        Raises:
+            OverflowError: If the joined inputs are too long for offset arrays.
+        """
+
+        inputs: List[str] = lines if isinstance(lines, list) else list(lines)
+        text: str = "\n".join(inputs)
+        if len(text) >= _OFFSET_LIMIT:
+            raise OverflowError(Strings.TOKEN_BUFFER_OVERFLOW.substitute(length=len(text), limit=_OFFSET_LIMIT - 1))
+
+        tokenizer: Tokenizer = Tokenizer(settings, text)
+        search = _SCAN_PATTERN.search
+        types: array[int] = array('B')
+        starts: array[int] = array('I')
+        ends: array[int] = array('I')
+        line_tokens: array[int] = array('I', (0,))
+        line_offsets: array[int] = array('I', (0,))
+        offset: int = 0
+
+        for input_str in inputs:
+            line_end: int = offset + len(input_str)
+            i: int = offset
+
+            while True:
+                match = search(text, i, line_end)
+                if match is None:
+                    break
+
+                start: int = match.start()
+                char: str = text[start]
+                token = _SINGLE_TOKENS.get(char)
+
+                if token is not None:
+                    types.append(token.type)
+                    starts.append(start)
+                    ends.append(start + 1)
+                    i = start + 1
+                elif char in _STRING_BODIES:
+                    end, _ = tokenizer.scan_string(start, line_end)
+                    types.append(RawTokenType.STRING)
+                    starts.append(start + 1)
+                    ends.append(end)
+                    i = end + 1
+                else:
+                    i = match.end()
+                    types.append(RawTokenType.WORD)
+                    starts.append(start)
+                    ends.append(i)
+
+            offset = line_end + 1
+            line_tokens.append(len(types))
+            line_offsets.append(offset)
+
+        settings.logger.debug(f"Tokenized {len(inputs)} inputs to {len(types)} tokens.")
+
+        return TokenBuffer(text, types, starts, ends, line_tokens, line_offsets)
+
+    @staticmethod
+    def span_start(token: SpanInputToken) -> int:
+        """Returns the start offset of a span token, including the opening quote."""
+
+        return token.start - 1 if token.type == RawTokenType.STRING else token.start
+
+    @staticmethod
+    def span_end(token: SpanInputToken) -> int:
+        """Returns the end offset of a span token, including the closing quote."""
+
+        if token.type == RawTokenType.STRING and token.end < len(token.source):
+            return token.end + 1
+        return token.end
+
+    def tokenize_input(self) -> List[RawInputProtocol]:
+        """Tokenizes the input with the scanner from `Settings.tokenizer_backend`.
+        
+        Returns:
+            Unvalidated raw tokens.
+        """
+
+        if self._settings.tokenizer_backend == TokenizerBackend.TABLE:
+            return self.tokenize_input_table()
+        if self._settings.tokenizer_backend == TokenizerBackend.SPAN:
+            return self.tokenize_input_spans()
+
         self._settings.logger.debug(f"Tokenizer.tokenize_input(input_str='{self._input_str}')")
 
         self._result = []
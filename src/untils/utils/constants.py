@@ -233,6 +233,148 @@ class Strings:
         $input_str - Input string.
     """
 
+    COMMAND_TIMED_OUT: Template = Template("Timed out after $timeout s: '$input_str'.")
+    """String: \"Timed out after $timeout s: '$input_str'.\"
+    
+    Command was cancelled by `CommandSystem.execute_async` timeout.
+
+    Placeholders:
+        $timeout - Timeout in seconds.
+        $input_str - Input string.
+    """
+
+    COMMAND_EXECUTOR_NOT_SET: str = "Expected a `CommandExecutor` in `CommandSystem.command_executor`, got None."
+    """Expected a `CommandExecutor` in `CommandSystem.command_executor`, got None."""
+
+    INPUT_REJECTED: Template = Template("Incorrect input: $error")
+    """String: \"Incorrect input: $error\"
+    
+    Input was rejected by `AsyncRepl` with an input exception.
+
+    Placeholders:
+        $error - The input exception.
+    """
+
+    COMMAND_RAISED: Template = Template("Unexpected exception: $error")
+    """String: \"Unexpected exception: $error\"
+    
+    Command of `AsyncRepl` raised an exception.
+
+    Placeholders:
+        $error - The exception.
+    """
+
+    DID_YOU_MEAN: Template = Template("Did you mean $suggestions?")
+    """String: \"Did you mean $suggestions?\"
+    
+    Suggestions for an unknown command of a rejected input.
+
+    Placeholders:
+        $suggestions - Suggested command names.
+    """
+
+    SUGGESTION_DISTANCE_INVALID: Template = Template("Max distance $max_distance is greater than the index max distance $index_distance.")
+    """String: \"Max distance $max_distance is greater than the index max distance $index_distance.\"
+    
+    A search distance of a deletion index is too large.
+
+    Placeholders:
+        $max_distance - The search distance.
+        $index_distance - The index distance.
+    """
+
+    TOKEN_BUFFER_OVERFLOW: Template = Template("Inputs of $length characters cannot be tokenized to a token buffer, the limit is $limit characters.")
+    """String: \"Inputs of $length characters cannot be tokenized to a token buffer, the limit is $limit characters.\"
+    
+    Offsets of the joined inputs don't fit into offset arrays of `TokenBuffer`.
+
+    Placeholders:
+        $length - Length of the joined inputs.
+        $limit - Max length of the joined inputs.
+    """
+
+    CONFIG_CACHE_STALE: Template = Template("Config cache '$cache_path' is stale, loading the config.")
+    """String: \"Config cache '$cache_path' is stale, loading the config.\"
+    
+    The config file or the library was changed after the cache was written.
+
+    Placeholders:
+        $cache_path - Path of the cache file.
+    """
+
+    CONFIG_CACHE_INVALID: Template = Template("Config cache '$cache_path' is not readable, loading the config: $error")
+    """String: \"Config cache '$cache_path' is not readable, loading the config: $error\"
+    
+    The cache file is corrupted or truncated.
+
+    Placeholders:
+        $cache_path - Path of the cache file.
+        $error - The read error.
+    """
+
+    CONFIG_CACHE_NOT_WRITTEN: Template = Template("Config cache '$cache_path' is not written: $error")
+    """String: \"Config cache '$cache_path' is not written: $error\"
+    
+    The cache file can't be written, the config is loaded without it.
+
+    Placeholders:
+        $cache_path - Path of the cache file.
+        $error - The write error.
+    """
+
+    CONFIG_RELOADED: Template = Template("Config '$path' is reloaded in $time s: $changed of $commands root commands are changed, $removed are removed.")
+    """String: \"Config '$path' is reloaded in $time s: $changed of $commands root commands are changed, $removed are removed.\"
+    
+    Report of `ConfigWatcher` reload.
+
+    Placeholders:
+        $path - Path of the config file.
+        $time - Reload time in seconds.
+        $changed - Count of new and changed root commands.
+        $commands - Count of root commands.
+        $removed - Count of removed root commands.
+    """
+
+    CONFIG_RELOAD_FAILED: Template = Template("Config '$path' is not reloaded, the previous config is kept: $error")
+    """String: \"Config '$path' is not reloaded, the previous config is kept: $error\"
+    
+    A `ConfigWatcher` reload raised an exception.
+
+    Placeholders:
+        $path - Path of the config file.
+        $error - The exception.
+    """
+
+    SCRIPT_LINE_INVALID: str = "Input is not valid."
+    """Input is not valid."""
+
+    SCRIPT_LINE_FAILED: Template = Template("Script line $line: $error")
+    """String: \"Script line $line: $error\"
+    
+    A line of a script was failed by `ScriptRunner`.
+
+    Placeholders:
+        $line - Line number.
+        $error - The error.
+    """
+
+    SCRIPT_SUMMARY: Template = Template("Script: $lines lines in $time s ($speed lines/s), executed $executed, skipped $skipped, failed $failed (input errors $input_errors, not implemented $not_implemented, command errors $command_errors).")
+    """String: \"Script: $lines lines in $time s ($speed lines/s), executed $executed, skipped $skipped, failed $failed (input errors $input_errors, not implemented $not_implemented, command errors $command_errors).\"
+    
+    Summary of `ScriptRunner.run`.
+
+    Placeholders:
+        $lines - Count of lines.
+        $time - Total time in seconds.
+        $speed - Lines per second.
+        $executed - Count of executed lines.
+        $skipped - Count of blank and comment lines.
+        $failed - Count of failed lines.
+        $input_errors - Count of not processed or not valid lines.
+        $not_implemented - Count of lines without commands.
+        $command_errors - Count of lines, which commands raised exceptions.
+    """
+
     LOG_SETTINGS_INIT = "`untils` was initialized with settings."
     """The library was started with settings."""
 
@@ -248,7 +390,7 @@ class Strings:
     INVALID_INTERNAL_STATE_CHANGE: Template = Template("Expected '__init__' internal state, got '$state'.")
     """String: \"Expected '__init__' internal state, got $state.\".
     
-    `Settings` can accept only `__init__` state.
+    `Settings` and `Session` can accept only `__init__` internal state.
 
     Placeholders:
         $state - State name.
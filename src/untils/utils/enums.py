@@ -39,6 +39,16 @@ class FinalTokenType(IntEnum):
     def __repr__(self) -> str:
         return self.name
 
+class TokenizerBackend(IntEnum):
+    """The scanner engine, which used by `Tokenizer`."""
+
+    CHARACTER = 0
+    """Character-by-character scanner with debug messages for every character."""
+    TABLE = 1
+    """Table-driven single-pass scanner. Produces the same raw tokens, but much faster."""
+    SPAN = 2
+    """Table-driven single-pass scanner, which produces `SpanInputToken`s with lazy values."""
+
 class InternalState(Enum):
     """The all internal states in config."""
 
@@ -47,4 +57,7 @@ class InternalState(Enum):
     INIT = "__init__"
     """Initial state."""
 
-__all__ = ["WarningsLevel", "ConfigVersions", "RawTokenType", "FinalTokenType", "InternalState"]
+__all__ = [
+    "WarningsLevel", "ConfigVersions", "RawTokenType", "FinalTokenType", "TokenizerBackend",
+    "InternalState"
+]
@@ -4,11 +4,11 @@
 
 # pylint: disable=too-few-public-methods
 
-from typing import Protocol, Any, runtime_checkable
+from typing import Protocol, Any, Union, runtime_checkable
 from abc import ABC, abstractmethod
 
 from untils.utils.type_aliases import UnknownConfigType
-from untils.utils.enums import FinalTokenType
+from untils.utils.enums import FinalTokenType, RawTokenType
 
 from untils.settings import Settings
 
@@ -20,6 +20,11 @@ class IOReaderMixin(ABC):
     def read(settings: Settings, file_path: str) -> UnknownConfigType:
         """Reads a config file."""
 
+    @staticmethod
+    @abstractmethod
+    def loads(settings: Settings, data: Union[bytes, str]) -> UnknownConfigType:
+        """Reads an encoded config."""
+
 @runtime_checkable
 class IOReaderProtocol(Protocol):
     """The protocol for all IOReader mixins."""
@@ -28,6 +33,10 @@ class IOReaderProtocol(Protocol):
     def read(settings: Settings, file_path: str) -> UnknownConfigType:
         """Mixin for `IOReader`."""
 
+    @staticmethod
+    def loads(settings: Settings, data: Union[bytes, str]) -> UnknownConfigType:
+        """Mixin for `IOReader`."""
+
 class Factoric(Protocol):
     """The protocol for all factories."""
 
@@ -35,10 +44,21 @@ class Factoric(Protocol):
     def create(cls, settings: Settings, *args: Any, **kwargs: Any) -> Any:
         """Creates an object."""
 
+class RawInputProtocol(Protocol):
+    """The protocol for all raw input tokens."""
+
+    @property
+    def type(self) -> RawTokenType:
+        """The raw command type."""
+
+    @property
+    def value(self) -> str:
+        """The raw value."""
+
 class FinalInputProtocol(Protocol):
     """The protocol for all final input tokens."""
 
     type: FinalTokenType
     value: Any
 
-__all__ = ["IOReaderMixin", "Factoric", "FinalInputProtocol"]
+__all__ = ["IOReaderMixin", "Factoric", "RawInputProtocol", "FinalInputProtocol"]
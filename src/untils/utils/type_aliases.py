@@ -1,9 +1,13 @@
 """type_aliases.py - Type aliases."""
 
 from typing import (
-    TypeAlias, Dict, Literal, TypedDict, List, Union, Any, Optional, NotRequired, Tuple, Callable
+    TypeAlias, Dict, Literal, TypedDict, List, Union, Any, Optional, NotRequired, Tuple, Callable,
+    Sequence, Awaitable, TYPE_CHECKING
 )
 
+if TYPE_CHECKING:
+    from untils.parsed_input import ParsedInput
+
 ConfigVersion: TypeAlias = Literal[1]
 CommandClass: TypeAlias = Union[
     'WordCommandConfig', 'FallbackCommandConfig', 'FlagCommandConfig', 'OptionCommandConfig'
@@ -18,7 +22,7 @@ CommandPathLevel: TypeAlias = Union[
     CommandPathSection, List[CommandPathSection], Tuple[CommandPathSection, ...]
 ]
 CommandPath: TypeAlias = Union[List[CommandPathLevel], Tuple[CommandPathLevel, ...]]
-CallableCommand: TypeAlias = Callable[[str, 'InputDict'], None]
+CallableCommand: TypeAlias = Callable[[str, Union['InputDict', 'ParsedInput']], Optional[Awaitable[None]]]
 
 class UnknownCommandConfig(TypedDict):
     """`CommandConfig` unknown variation for dynamic validations."""
@@ -84,8 +88,10 @@ class CommandHistory(TypedDict):
     """Max notes count. By default is `100`."""
     is_write_overflow: bool
     """Is delete the oldest notes from history and save the newest on max size limit. If disabled, new notes won't catched in history. By default is `True`."""
-    notes: List[Tuple[str, InputDict]]
-    """Catched inputs with tracking."""
+    max_bytes: NotRequired[Optional[int]]
+    """Max size of notes in bytes. By default is not limited."""
+    notes: Sequence[Tuple[str, Union[InputDict, 'ParsedInput']]]
+    """Catched inputs with tracking. `CommandSystem` replaces a list with `HistoryBuffer`, where inputs are stored as `ParsedInput`."""
 
 __all__ = [
     "ConfigVersion", "CommandClass", "UnknownCommandClass", "CommandType",
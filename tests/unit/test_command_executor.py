@@ -0,0 +1,105 @@
+"""`src/command_executor.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import List, Union
+
+import queue
+import threading
+import time
+
+import pytest
+
+import untils
+
+def test_serialization() -> None:
+    """Tests serialization of commands with the same key."""
+
+    active: List[int] = [0, 0]
+    order: List[str] = []
+    lock: threading.Lock = threading.Lock()
+
+    def command(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        with lock:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+            order.append(input_str)
+
+    with untils.CommandExecutor(4) as executor:
+        futures = [executor.submit(command, str(i), untils.ParsedInput(), "key") for i in range(5)]
+        for future in futures:
+            future.result()
+
+    assert order == ["0", "1", "2", "3", "4"] and active[1] == 1
+    assert (executor.stats.submitted, executor.stats.completed, executor.stats.queue_depth) == (5, 5, 0)
+    assert executor.stats.max_wait_time >= 0.03
+
+def test_backpressure() -> None:
+    """Tests the bounded queue and failed commands."""
+
+    release: threading.Event = threading.Event()
+
+    def block(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        release.wait()
+        raise RuntimeError(input_str)
+
+    executor: untils.CommandExecutor = untils.CommandExecutor(2, max_queue=2)
+    first = executor.submit(block, "a", untils.ParsedInput())
+    executor.submit(block, "b", untils.ParsedInput())
+
+    pytest.raises(queue.Full, executor.submit, block, "c", untils.ParsedInput(), block=False)
+    pytest.raises(queue.Full, executor.submit, block, "c", untils.ParsedInput(), timeout=0.01)
+    assert (executor.stats.queue_depth, executor.stats.rejected) == (2, 2)
+
+    release.set()
+    with pytest.raises(RuntimeError):
+        first.result()
+    executor.shutdown()
+    assert (executor.stats.failed, executor.stats.max_queue_depth) == (2, 2)
+
+def test_shutdown() -> None:
+    """Tests submission after shutdown of the executor and of its pool."""
+
+    def command(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        pass
+
+    executor: untils.CommandExecutor = untils.CommandExecutor(1, max_queue=1)
+    executor.shutdown()
+    pytest.raises(RuntimeError, executor.submit, command, "a", untils.ParsedInput(), "key", block=False)
+
+    executor = untils.CommandExecutor(1, max_queue=1)
+    executor.pool.shutdown()
+    pytest.raises(RuntimeError, executor.submit, command, "a", untils.ParsedInput(), "key", block=False)
+    pytest.raises(RuntimeError, executor.submit, command, "a", untils.ParsedInput(), "key", block=False)
+
+    assert executor._chains == {}    # pyright: ignore[reportPrivateUsage]
+    assert (executor.stats.submitted, executor.stats.queue_depth, executor.stats.rejected) == (0, 0, 0)
+
+def test_command_system() -> None:
+    """Tests `CommandSystem.submit` method."""
+
+    threads: List[str] = []
+
+    def command(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        threads.append(threading.current_thread().name)
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+    pytest.raises(ValueError, command_system.submit, "go", untils.ParsedInput(["go"]), ["go"])
+
+    command_system.command_executor = untils.CommandExecutor(key_func=untils.CommandExecutor.root_key)
+    command_system.register_command(("go", "-any"), command)
+
+    future = command_system.submit("go north", untils.ParsedInput(["go", "north"]), ["go", "north"])
+    assert future is not None
+    future.result()
+    assert threads[0].startswith("untils-command")
+    assert command_system.submit("run", untils.ParsedInput(["run"]), ["run"]) is None
+    command_system.command_executor.shutdown()
@@ -0,0 +1,108 @@
+"""`src/command_graph.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def config() -> untils.CommandsConfig:
+    """Fixture for `pytest`."""
+
+    return untils.Parser.parse_config({
+        "version": 1,
+        "states": {
+            "__init__": ["start"],
+            "__base__": ["go"],
+            "fight": ["hit"]
+        },
+        "commands": {
+            "start": {"aliases": [], "type": "word"},
+            "hit": {"aliases": ["h"], "type": "word"},
+            "go": {
+                "aliases": ["g"],
+                "type": "word",
+                "children": {
+                    "north": {
+                        "aliases": ["n"],
+                        "type": "word",
+                        "children": {
+                            "fast": {"aliases": ["f"], "type": "flag", "default": None}
+                        }
+                    },
+                    "quiet": {"aliases": ["q"], "type": "flag", "default": None},
+                    "speed": {"aliases": ["s"], "type": "option", "default": "1"}
+                }
+            },
+            "verbose": {"aliases": ["v"], "type": "flag", "default": None}
+        }
+    })
+
+def test_build(config: untils.CommandsConfig) -> None:
+    """Tests `CommandGraph.build` method."""
+
+    graph: untils.CommandGraph = config.graph
+    assert graph.root is config.trie
+
+    # `__base__` commands are allowed only in states after `__base__`.
+    assert graph.get_roots("__init__") == {"start"}
+    assert graph.get_roots("__base__") == {"go"}
+    assert graph.get_roots("fight") == {"go", "hit"}
+    assert graph.get_roots("unknown") == {"go"}
+
+    go: untils.CommandTrieNode = graph.root.words["go"]
+    assert graph.root.flags == {"verbose", "v"}
+    assert go.flags == {"quiet", "q"}
+    assert go.options == {"speed", "s"}
+    assert go.words["north"].flags == {"fast", "f"}
+
+def test_validate_commands_path(config: untils.CommandsConfig) -> None:
+    """Tests `ParsedInputValidator.validate_commands_path` method with the graph."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.IGNORE
+
+    def validate(path: list, flags: list, options: list) -> bool:    # pyright: ignore[reportMissingTypeArgument]
+        return untils.ParsedInputValidator.validate_commands_path(settings, {
+            "path": path,
+            "flags": {name: None for name in flags},
+            "options": {name: "1" for name in options}
+        }, config)
+
+    assert validate([], ["v"], [])
+    assert not validate([], ["q"], [])
+    assert validate(["start"], [], [])
+    assert not validate(["go"], [], [])
+
+    # `__base__` is written before `__init__`.
+    config = untils.CommandsConfig(config.version, config.states[1::-1], config.commands)
+    assert validate(["g", "n"], ["v", "q", "f"], ["speed"])
+    assert not validate(["g"], ["f"], [])
+    assert not validate(["g"], [], ["x"])
+
+    # Legal names of visited commands are checked after an invalid path part.
+    assert validate(["g", "west", "n"], ["q"], [])
+    assert not validate(["g", "west", "n"], ["f"], [])
+
+def test_available_commands(config: untils.CommandsConfig) -> None:
+    """Tests precomputed available commands by states."""
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings(), config)
+
+    assert command_system.get_all_commands_str() == ["start", "hit", "go"]
+    assert config.graph.get_available_names("fight") == ("hit", "go")
+    assert command_system.get_available_commands_str() == ["start"]
+    assert command_system.get_available_commands() == [config.commands[0]]
+
+    with command_system.create_session("fight").activate():
+        assert command_system.get_available_commands_str() == ["hit", "go"]
+        assert command_system.get_available_commands() is not command_system.get_available_commands()
+
+    with command_system.create_session("unknown").activate():
+        assert command_system.get_available_commands_str() == ["go"]
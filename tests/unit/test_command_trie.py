@@ -0,0 +1,88 @@
+"""`src/command_trie.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def config() -> untils.CommandsConfig:
+    """Fixture for `pytest`."""
+
+    return untils.Parser.parse_config({
+        "version": 1,
+        "states": {
+            "__base__": ["go"]
+        },
+        "commands": {
+            "go": {
+                "aliases": ["g"],
+                "type": "word",
+                "children": {
+                    "north": {"aliases": ["n"], "type": "word"},
+                    "$where": {
+                        "type": "fallback",
+                        "default": "home",
+                        "children": {
+                            "$speed": {"type": "fallback", "default": 5}
+                        }
+                    },
+                    "south": {"aliases": ["s"], "type": "word"},
+                    "quiet": {"aliases": ["q"], "type": "flag", "default": None}
+                }
+            }
+        }
+    })
+
+def test_build(config: untils.CommandsConfig) -> None:
+    """Tests `CommandTrieNode.build` method."""
+
+    root: untils.CommandTrieNode = config.trie
+    assert root.command is None
+    assert root.children is config.commands
+    assert set(root.words) == {"go", "g"}
+    assert root.fallback is None
+
+    go: untils.CommandTrieNode = root.words["go"]
+    assert root.words["g"] is go
+    assert go.command is config.commands[0]
+
+    # Children after the first `Fallback` are unreachable.
+    assert set(go.words) == {"north", "n"}
+    assert go.fallback is not None and go.fallback.name == "$where"
+
+    # The trie is built for configs, which are created directly.
+    assert untils.CommandsConfig(1, [], config.commands).trie.words.keys() == root.words.keys()
+
+def test_get_child(config: untils.CommandsConfig) -> None:
+    """Tests `CommandTrieNode.get_child` method."""
+
+    go: untils.CommandTrieNode = config.trie.words["go"]
+
+    assert config.trie.get_child("unknown") is None
+    assert go.get_child("n") is go.words["north"]
+    assert go.get_child("south") is go.fallback
+    assert go.get_child("quiet") is go.fallback
+
+def test_walkers(config: untils.CommandsConfig) -> None:
+    """Tests path resolution in `CommandSystem`, `InputValidator` and `ParsedInputValidator`."""
+
+    settings: untils.Settings = untils.Settings()
+    command_system: untils.CommandSystem = untils.CommandSystem(settings, config)
+
+    input_dict: untils.utils.InputDict = command_system.process_input("g n")
+    assert input_dict["path"] == ("g", "n")
+    assert command_system.get_normalized_path(input_dict) == ["go", "north"]
+    assert command_system.is_input_valid(input_dict)
+
+    input_dict = command_system.process_input("g")
+    assert len(input_dict["path"]) == 3
+    assert command_system.get_normalized_path(input_dict) == ["go", "$where", "$speed"]
+
+    pytest.raises(untils.utils.InputValuesError, command_system.is_input_valid, {"path": ["went"], "flags": {}, "options": {}})
@@ -0,0 +1,74 @@
+"""`src/completion.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import List
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def command_system() -> untils.CommandSystem:
+    """Fixture for `pytest`."""
+
+    return untils.CommandSystem(untils.Settings(), untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__base__": ["go", "give"], "__init__": ["greet"], "fight": ["guard"]},
+        "commands": {
+            "go": {
+                "aliases": ["g"],
+                "type": "word",
+                "children": {
+                    "north": {"aliases": ["n"], "type": "word", "children": {"fast": {"aliases": ["f"], "type": "flag", "default": None}}},
+                    "nowhere": {"aliases": [], "type": "word"},
+                    "quiet": {"aliases": ["q"], "type": "flag", "default": None},
+                    "speed": {"aliases": ["s"], "type": "option", "default": "1"}
+                }
+            },
+            "give": {"aliases": ["gv"], "type": "word", "children": {"$item": {"type": "fallback"}}},
+            "greet": {"aliases": [], "type": "word"},
+            "guard": {"aliases": [], "type": "word"},
+            "verbose": {"aliases": ["v"], "type": "flag", "default": None}
+        }
+    }))
+
+def texts(completions: List[untils.Completion]) -> List[str]:
+    """Returns texts of completions."""
+
+    return [completion.text for completion in completions]
+
+def test_prefix_trie() -> None:
+    """Tests `PrefixTrie` ranking and limits."""
+
+    trie: untils.PrefixTrie = untils.PrefixTrie()
+    for key in ["beta", "be", "alpha", "bet", "b"]:
+        trie.insert(key, untils.Completion(key, "word", key), 3)
+
+    assert texts(trie.find("b")) == ["b", "be", "bet"]
+    assert texts(trie.find("bet")) == ["bet", "beta"]
+    assert trie.find("x") == []
+
+def test_complete(command_system: untils.CommandSystem) -> None:
+    """Tests `CommandSystem.complete` method."""
+
+    # `__base__` is written before `__init__`.
+    assert texts(command_system.complete("g")) == ["go", "give", "greet", "g", "gv"]
+    assert command_system.complete("gv")[0] == untils.Completion("gv", "word", "give", True)
+    assert texts(command_system.complete("go ")) == ["north", "nowhere", "n"]
+    assert texts(command_system.complete("g no")) == ["north", "nowhere"]
+    assert texts(command_system.complete("go -")) == ["-quiet", "-verbose", "-q", "-v", "--speed", "--s"]
+    assert texts(command_system.complete("go n -!f")) == ["-!fast", "-!f"]
+    assert texts(command_system.complete("go --s")) == ["--speed", "--s"]
+    assert command_system.complete("go --speed ") == []
+    assert texts(command_system.complete("go --speed 2 n")) == ["north", "nowhere", "n"]
+    assert command_system.complete("give sword ") == [] and command_system.complete("jump ") == []
+    assert texts(command_system.complete("g", limit=2)) == ["go", "give"]
+
+    with command_system.create_session("fight").activate():
+        assert texts(command_system.complete("g")) == ["go", "give", "guard", "g", "gv"]
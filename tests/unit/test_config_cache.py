@@ -0,0 +1,117 @@
+"""`src/config_cache.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import Any, Dict
+
+import dataclasses
+import json
+import os
+import pathlib
+
+import pytest
+
+import untils
+
+CONFIG: Dict[str, Any] = {
+    "version": 1,
+    "states": {"__base__": ["go"]},
+    "commands": {
+        "go": {
+            "aliases": ["g"],
+            "type": "word",
+            "children": {
+                "north": {"aliases": ["n"], "type": "word"},
+                "quiet": {"aliases": ["q"], "type": "flag", "default": None}
+            }
+        }
+    }
+}
+"""The test config."""
+
+@pytest.fixture
+def config_path(tmp_path: pathlib.Path) -> str:
+    """Fixture for `pytest`."""
+
+    path: pathlib.Path = tmp_path / "config.json"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    return str(path)
+
+def fail_load(settings: untils.Settings, file_path: str) -> untils.CommandsConfig:
+    """Replaces `Processor.load_config` on warm starts."""
+
+    raise AssertionError("The config is loaded from the config file.")
+
+def test_config_cache(config_path: str, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests cold and warm loads of `ConfigCache`."""
+
+    settings: untils.Settings = untils.Settings()
+    cache: untils.ConfigCache = untils.ConfigCache(str(tmp_path / "cache"))
+
+    config: untils.CommandsConfig = cache.load_config(settings, config_path)
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert os.listdir(cache.cache_dir) == [os.path.basename(cache.get_cache_path(config_path))]
+
+    with monkeypatch.context() as patch:
+        patch.setattr(untils.Processor, "load_config", staticmethod(fail_load))
+        cached: untils.CommandsConfig = untils.ConfigCache(cache.cache_dir).load_config(settings, config_path)
+
+    assert cached == config
+    assert cached.trie.get_child("g") is not None
+    assert cached.graph.get_roots("__init__") == config.graph.get_roots("__init__")
+
+    # `CommandSystem` uses the cache.
+    command_system: untils.CommandSystem = untils.CommandSystem(settings, config_cache=cache)
+    command_system.load_config(config_path)
+    assert cache.hits == 1
+    assert command_system.get_normalized_path(command_system.process_input("g n -q")) == ["go", "north"]
+
+def test_config_cache_stale(config_path: str, tmp_path: pathlib.Path) -> None:
+    """Tests fallbacks on stale and corrupted cache files."""
+
+    settings: untils.Settings = untils.Settings()
+    cache: untils.ConfigCache = untils.ConfigCache(str(tmp_path / "cache"))
+    cache.load_config(settings, config_path)
+
+    # Changed content.
+    changed: Dict[str, Any] = json.loads(json.dumps(CONFIG))
+    changed["commands"]["go"]["aliases"] = ["walk"]
+    pathlib.Path(config_path).write_text(json.dumps(changed), encoding="utf-8")
+    config: untils.CommandsConfig = cache.load_config(settings, config_path)
+    assert config.trie.get_child("walk") is not None
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert cache.load_config(settings, config_path) == config
+    assert cache.hits == 1
+
+    # Other library version.
+    key: untils.ConfigCacheKey = untils.ConfigCacheKey.from_file(config_path)
+    assert key.library_version == untils.__version__
+    assert cache.write(settings, dataclasses.replace(key, library_version="0.0.0"), config)
+    assert cache.read(settings, key) is None
+    assert cache.load_config(settings, config_path) == config
+
+    # Corrupted and truncated files.
+    cache_path: str = cache.get_cache_path(config_path)
+    data: bytes = pathlib.Path(cache_path).read_bytes()
+    for corrupted in (b"garbage", data[:len(data) // 2], data[:8] + b"\x00" * (len(data) - 8)):
+        pathlib.Path(cache_path).write_bytes(corrupted)
+        assert cache.load_config(settings, config_path) == config
+        assert pathlib.Path(cache_path).read_bytes() == data
+
+    assert [name for name in os.listdir(cache.cache_dir) if name.endswith(".tmp")] == []
+
+def test_config_cache_warnings(tmp_path: pathlib.Path) -> None:
+    """Tests, that configs with warnings are not cached."""
+
+    path: pathlib.Path = tmp_path / "config.json5"
+    path.write_text(json.dumps(CONFIG), encoding="utf-8")
+    cache: untils.ConfigCache = untils.ConfigCache(str(tmp_path / "cache"))
+
+    with pytest.warns(untils.utils.FileWarning):
+        cache.load_config(untils.Settings(), str(path))
+    assert not os.path.exists(cache.get_cache_path(str(path)))
@@ -0,0 +1,124 @@
+"""`src/config_watcher.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import Any, Dict, List
+
+import json
+import os
+import pathlib
+import threading
+
+import pytest
+
+import untils
+
+def make_config(roots: int) -> Dict[str, Any]:
+    """Returns a config with `roots` root commands."""
+
+    commands: Dict[str, Any] = {
+        f"entity{i}": {
+            "aliases": [f"e{i}"],
+            "type": "word",
+            "children": {
+                "look": {"aliases": ["l"], "type": "word"},
+                "quiet": {"aliases": ["q"], "type": "flag", "default": None}
+            }
+        }
+        for i in range(roots)
+    }
+    return {"version": 1, "states": {"__base__": list(commands)}, "commands": commands}
+
+def write(path: pathlib.Path, config_dict: Dict[str, Any], mtime: int) -> None:
+    """Writes a config file with a distinct modification time."""
+
+    path.write_text(json.dumps(config_dict), encoding="utf-8")
+    os.utime(path, ns=(mtime, mtime))
+
+@pytest.fixture
+def config_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    """Fixture for `pytest`."""
+
+    path: pathlib.Path = tmp_path / "config.json"
+    write(path, make_config(5), 1_000_000_000)
+    return path
+
+def test_config_watcher(config_path: pathlib.Path) -> None:
+    """Tests incremental reloads of `ConfigWatcher`."""
+
+    settings: untils.Settings = untils.Settings()
+    command_system: untils.CommandSystem = untils.CommandSystem(settings)
+    watcher: untils.ConfigWatcher = untils.ConfigWatcher(command_system, str(config_path))
+
+    report = watcher.check()
+    assert report is not None and (report.commands, report.changed, report.removed, report.is_swapped) == (5, 5, 0, True)
+    assert command_system.config == untils.Processor.load_config(settings, str(config_path))
+    assert watcher.check() is None
+
+    # A changed and a removed command.
+    old: untils.CommandsConfig = command_system.config
+    config_dict: Dict[str, Any] = make_config(5)
+    config_dict["commands"]["entity1"]["aliases"] = ["first"]
+    del config_dict["commands"]["entity4"]
+    config_dict["states"]["__base__"].remove("entity4")
+    write(config_path, config_dict, 2_000_000_000)
+
+    report = watcher.check()
+    assert report is not None and (report.commands, report.changed, report.removed, report.is_swapped) == (4, 1, 1, True)
+    assert command_system.config == untils.Processor.load_config(settings, str(config_path))
+    assert command_system.config.commands[0] is old.commands[0]
+    assert command_system.config.commands[1] is not old.commands[1]
+    assert command_system.get_normalized_path(command_system.process_input("first l")) == ["entity1", "look"]
+
+    # The old config is not changed for inputs in processing.
+    assert old.trie.get_child("e1") is not None and old.trie.get_child("entity4") is not None
+
+    # Same content with a new modification time.
+    config: untils.CommandsConfig = command_system.config
+    os.utime(config_path, ns=(3_000_000_000, 3_000_000_000))
+    report = watcher.check()
+    assert report is not None and (report.changed, report.removed, report.is_swapped) == (0, 0, False)
+    assert command_system.config is config
+
+def test_config_watcher_failed(config_path: pathlib.Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Tests, that failed reloads keep the config."""
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+    watcher: untils.ConfigWatcher = untils.ConfigWatcher(command_system, str(config_path))
+    watcher.check()
+    config = command_system.config
+
+    config_path.write_text('{"version": 1, "commands": {', encoding="utf-8")
+    os.utime(config_path, ns=(2_000_000_000, 2_000_000_000))
+    assert watcher.check() is None
+    assert command_system.config is config
+    assert "is not reloaded" in caplog.text
+
+    write(config_path, make_config(2), 3_000_000_000)
+    report = watcher.check()
+    assert report is not None and report.removed == 3
+
+def test_config_watcher_thread(config_path: pathlib.Path) -> None:
+    """Tests the watcher thread."""
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+    reloads: List[untils.ConfigReload] = []
+    reloaded: threading.Event = threading.Event()
+
+    def on_reload(report: untils.ConfigReload) -> None:
+        reloads.append(report)
+        reloaded.set()
+
+    with untils.ConfigWatcher(command_system, str(config_path), 0.01, on_reload):
+        assert command_system.config is not None and len(reloads) == 1
+        reloaded.clear()
+        write(config_path, make_config(6), 2_000_000_000)
+        assert reloaded.wait(5)
+
+    assert reloads[-1].changed == 1
+    assert len(command_system.config.commands) == 6
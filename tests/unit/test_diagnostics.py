@@ -0,0 +1,141 @@
+"""`src/diagnostics.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import threading
+import warnings
+
+from typing import List, Tuple
+
+import pytest
+
+import untils
+
+INPUTS: Tuple[str, ...] = ("go -! x", "go --'' y", "go --n ''", "a -!'b' c", "unknown ! words")
+"""Inputs with recoverable problems."""
+
+@pytest.fixture
+def settings() -> untils.Settings:
+    """Fixture for `pytest`."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+
+    return settings
+
+def test_collect(settings: untils.Settings) -> None:
+    """Tests `Settings.collect_diagnostics` method against issued warnings."""
+
+    config: untils.CommandsConfig = untils.CommandsConfig(1, [], [])
+
+    for input_str in INPUTS:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            expected: untils.utils.InputDict = untils.Processor.process_input(settings, config, input_str)
+
+        positions: List[List[object]] = []
+        for is_fused_input in (False, True):
+            settings.is_fused_input = is_fused_input
+
+            with warnings.catch_warnings(record=True) as silent:
+                warnings.simplefilter("always")
+                result, diagnostics = untils.Processor.process_input_with_diagnostics(settings, config, input_str)
+
+            assert silent == []
+            assert result == expected
+            assert diagnostics.get_messages() == [str(warning.message) for warning in caught], input_str
+            positions.append([record.position for record in diagnostics])
+
+        settings.is_fused_input = False
+        assert positions[0] == positions[1]
+        assert settings.diagnostics is None
+
+def test_records(settings: untils.Settings) -> None:
+    """Tests `Diagnostic` records."""
+
+    with settings.collect_diagnostics() as diagnostics:
+        settings.warning(
+            untils.utils.Strings.INPUT_PATH_INVALID,
+            untils.utils.Strings.AUTO_CORRECT_WITH_SKIPPING,
+            untils.utils.InputValuesWarning,
+            untils.utils.InputValuesError,
+            position=3,
+            name="x"
+        )
+        settings.warning(
+            untils.utils.Strings.END_OF_INPUT,
+            untils.utils.Strings.AUTO_CORRECT_WITH_ACCEPTING,
+            untils.utils.InputStructureWarning,
+            untils.utils.InputStructureError
+        )
+
+    record: untils.Diagnostic = diagnostics.records[0]
+    assert record.template is untils.utils.Strings.INPUT_PATH_INVALID
+    assert record.fields == {"name": "x"}
+    assert record.code == "INPUT_PATH_INVALID"
+    assert record.position == 3
+    assert record.message == untils.utils.Strings.INPUT_PATH_INVALID.substitute(name="x")
+    assert diagnostics.records[1].code == "END_OF_INPUT"
+    assert len(diagnostics) == 2
+
+def test_levels(settings: untils.Settings) -> None:
+    """Tests `WarningsLevel` semantics in the diagnostics mode."""
+
+    config_dict: untils.utils.UnknownConfigType = {"version": 1, "states": {}, "commands": {"a_b": {"aliases": [], "type": "word"}}}
+
+    settings.warnings_level = untils.utils.WarningsLevel.IGNORE
+    with settings.collect_diagnostics() as diagnostics:
+        untils.ConfigValidator.validate_config(settings, config_dict)
+    assert len(diagnostics) == 0
+
+    settings.warnings_level = untils.utils.WarningsLevel.STRICT
+    with settings.collect_diagnostics() as diagnostics:
+        pytest.raises(untils.utils.ConfigValuesError, untils.ConfigValidator.validate_config, settings, config_dict)
+    assert len(diagnostics) == 0
+
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+    with settings.collect_diagnostics() as diagnostics:
+        untils.ConfigValidator.validate_config(settings, config_dict)
+    assert [record.code for record in diagnostics] == ["COMMAND_NAME_SPECIAL"]
+    assert diagnostics.records[0].fields == {"character": '_'}
+
+def test_context(settings: untils.Settings) -> None:
+    """Tests collectors in nested collections and other threads."""
+
+    def warn() -> None:
+        settings.warning(
+            untils.utils.Strings.END_OF_INPUT,
+            untils.utils.Strings.AUTO_CORRECT_WITH_ACCEPTING,
+            untils.utils.InputStructureWarning,
+            untils.utils.InputStructureError
+        )
+
+    with settings.collect_diagnostics() as outer:
+        with settings.collect_diagnostics(is_silent=False) as inner:
+            assert settings.diagnostics is inner
+
+            settings.warnings_level = untils.utils.WarningsLevel.IGNORE
+            thread: threading.Thread = threading.Thread(target=warn)
+            thread.start()
+            thread.join()
+            assert outer.warnings_count == inner.warnings_count == 0
+
+            settings.warnings_level = untils.utils.WarningsLevel.BASIC
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                warn()
+
+        assert caught == []
+        assert settings.diagnostics is outer
+
+    assert [record.code for record in outer] == [record.code for record in inner] == ["END_OF_INPUT"]
+    assert outer.warnings_count == inner.warnings_count == 1
+
+    with settings.collect_diagnostics(is_silent=False) as observer:
+        pytest.warns(untils.utils.InputStructureWarning, warn)
+    assert len(observer) == 1
@@ -59,3 +59,6 @@ def test_command_node_factory() -> None:
     assert untils.CommandNodeFactory.create(
         name, node_type, aliases, default, children
     ) is not None
+
+    # Unknown type.
+    pytest.raises(KeyError, untils.CommandNodeFactory.create, name, "unknown", aliases, default, children)
@@ -0,0 +1,79 @@
+"""`src/history.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import List
+
+import pytest
+
+import untils
+
+def note(i: int) -> untils.HistoryNote:
+    """Returns a history note."""
+
+    return (f"go {i}", untils.ParsedInput(["go", str(i)]))
+
+def test_ring() -> None:
+    """Tests `HistoryBuffer` eviction and indexing."""
+
+    buffer: untils.HistoryBuffer = untils.HistoryBuffer(3)
+
+    for i in range(5):
+        assert buffer.append(note(i))
+
+    assert [entry[0] for entry in buffer] == ["go 2", "go 3", "go 4"]
+    assert buffer[-1] == note(4) and buffer[0:2] == [note(2), note(3)]
+    assert [entry[0] for entry in reversed(buffer)] == ["go 4", "go 3", "go 2"]
+    assert buffer.get_latest(0) == note(4)
+    assert buffer.get_latest(10) == note(2)
+    assert buffer.get_latest(-1) == note(4)
+    pytest.raises(IndexError, buffer.__getitem__, 3)
+
+    assert not buffer.append(note(5), is_write_overflow=False)
+    assert buffer.size_bytes == sum(untils.HistoryBuffer.get_note_size(entry) for entry in buffer)
+
+    buffer.resize(2)
+    assert list(buffer) == [note(3), note(4)]
+
+def test_bytes_limit() -> None:
+    """Tests `HistoryBuffer` byte size limit."""
+
+    size: int = untils.HistoryBuffer.get_note_size(note(0))
+    buffer: untils.HistoryBuffer = untils.HistoryBuffer(100, max_bytes=size * 2)
+
+    for i in range(4):
+        assert buffer.append(note(i))
+
+    assert list(buffer) == [note(2), note(3)]
+    assert buffer.size_bytes <= size * 2
+    assert not buffer.append(("x" * size * 2, untils.ParsedInput()))
+
+def test_command_system() -> None:
+    """Tests history of `CommandSystem`."""
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings(), history={
+        "max_size": 2,
+        "is_write_overflow": True,
+        "notes": [("look", {"path": ["look"], "flags": {}, "options": {}})]
+    })
+    inputs: untils.HistoryColumn = command_system.get_history_input()
+
+    command_system.write_history("go", {"path": ["go"], "flags": {}, "options": {}})
+    command_system.write_history("run", untils.ParsedInput(["run"]))
+
+    assert list(inputs) == ["go", "run"]
+    assert command_system.read_history(0)[0] == "run"
+    assert command_system.read_history(5)[0] == "go"
+    assert list(command_system.get_history_dict()) == [untils.ParsedInput(["go"]), untils.ParsedInput(["run"])]
+
+    command_system.history["is_write_overflow"] = False
+    assert not command_system.write_history("hit", untils.ParsedInput(["hit"]))
+
+    command_system.history["max_size"] = 3
+    assert command_system.write_history("hit", untils.ParsedInput(["hit"]))
+    assert list(command_system.get_history_input()) == ["go", "run", "hit"]
@@ -0,0 +1,218 @@
+"""`src/history_log.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+import gc
+import os
+import pathlib
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+import untils
+
+def note(input_str: str) -> untils.HistoryNote:
+    """Returns a history note."""
+
+    return (input_str, untils.ParsedInput(input_str.split(), {"f": True}, {"o": "1"}))
+
+def test_log(tmp_path: pathlib.Path) -> None:
+    """Tests writing and reading of `HistoryLog`."""
+
+    path: str = str(tmp_path / "history.log")
+
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        log.append(note("go north"))
+        log.append(note("look\t\"tab\"\nline"))
+
+        assert len(log) == 2 and log[1][0] == "look\t\"tab\"\nline"
+        log.flush()
+        log.append(note("говорить"))
+
+        assert list(log) == [note("go north"), note("look\t\"tab\"\nline"), note("говорить")]
+        assert list(log.get_inputs()) == ["go north", "look\t\"tab\"\nline", "говорить"]
+        assert log[-2] == note("look\t\"tab\"\nline")
+        pytest.raises(IndexError, log.__getitem__, 3)
+
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        assert len(log) == 3
+        assert list(log.search("ить")) == [(2, "говорить")]
+        assert list(log.search("o")) == [(1, "look\t\"tab\"\nline"), (0, "go north")]
+        assert list(log.search("o", is_prefix=True)) == []
+        assert [entry[0] for entry in reversed(log)] == ["говорить", "look\t\"tab\"\nline", "go north"]
+
+    pytest.raises(ValueError, log.append, note("late"))
+
+def test_background_flush(tmp_path: pathlib.Path) -> None:
+    """Tests the background flush of `HistoryLog`."""
+
+    path: str = str(tmp_path / "history.log")
+    log: untils.HistoryLog = untils.HistoryLog(path, flush_interval=60.0, buffer_size=2)
+
+    log.append(note("a"))
+    log.append(note("b"))
+    for _ in range(100):
+        if os.path.getsize(path + ".idx") == 16:
+            break
+        time.sleep(0.01)
+
+    assert os.path.getsize(path + ".idx") == 16
+    log.close()
+
+def test_recover(tmp_path: pathlib.Path) -> None:
+    """Tests recovery of `HistoryLog` after an interrupted write."""
+
+    path: str = str(tmp_path / "history.log")
+
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        for i in range(3):
+            log.append(note(f"go {i}"))
+
+    with open(path, "ab") as file:
+        file.write(untils.HistoryLog.encode(note("lost index")) + b'"partial')
+    with open(path + ".idx", "r+b") as file:
+        file.truncate(12)
+
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        assert list(log.get_inputs()) == ["go 0", "go 1", "go 2", "lost index"]
+        assert os.path.getsize(path + ".idx") == 32
+
+def test_recover_index(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests recovery of `HistoryLog` with a missing, empty or invalid index by chunks, which split lines."""
+
+    path: str = str(tmp_path / "history.log")
+    inputs: List[str] = [f"go {'x' * i}" for i in range(20)]
+
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        for input_str in inputs:
+            log.append(note(input_str))
+    with open(path + ".idx", "rb") as file:
+        index: bytes = file.read()
+
+    monkeypatch.setattr(untils.history_log, "_CHUNK_SIZE", 7)
+
+    damaged: Dict[str, bytes] = {
+        "empty": b"",
+        "invalid": b"\xff" * len(index),
+        "partly invalid": index[:40] + b"\xff" * 8 * 15,
+        "partial": index
+    }
+
+    for damage in ("missing", *damaged):
+        if damage == "missing":
+            os.remove(path + ".idx")
+        else:
+            with open(path + ".idx", "wb") as file:
+                file.write(damaged[damage])
+        if damage == "partial":
+            with open(path, "ab") as file:
+                file.write(b'"partial')
+
+        assert untils.HistoryLog.recover(path, path + ".idx") == len(inputs), damage
+        with open(path + ".idx", "rb") as file:
+            assert file.read() == index, damage
+        with untils.HistoryLog(path, is_background_flush=False) as log:
+            assert list(log.get_inputs()) == inputs, damage
+
+def test_command_system(tmp_path: pathlib.Path) -> None:
+    """Tests `HistoryLog` in `CommandSystem`."""
+
+    path: str = str(tmp_path / "history.log")
+
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings(), history_log=log)
+        for i in range(5):
+            command_system.write_history(f"go {i}", untils.ParsedInput(["go", str(i)]))
+
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        command_system = untils.CommandSystem(untils.Settings(), history={
+            "max_size": 2, "is_write_overflow": True, "notes": []
+        }, history_log=log)
+
+        assert list(command_system.get_history_input()) == [f"go {i}" for i in range(5)]
+        assert [entry[0] for entry in command_system.get_history()] == ["go 3", "go 4"]
+        assert command_system.read_history(0)[0] == "go 4"
+        assert next(command_system.search_history("go 1")) == (1, "go 1")
+
+def test_close(tmp_path: pathlib.Path) -> None:
+    """Tests writing of pending notes, when `HistoryLog.close` is not called."""
+
+    path: str = str(tmp_path / "history.log")
+    script: str = textwrap.dedent(f"""
+        import untils
+
+        command_system = untils.CommandSystem(untils.Settings(), history_log=untils.HistoryLog({path!r}, flush_interval=60.0))
+        for i in range(10):
+            command_system.write_history(f"go {{i}}", untils.ParsedInput(["go", str(i)]))
+        assert len(command_system.history_log) == 10
+    """)
+    environment: Dict[str, str] = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+    subprocess.run([sys.executable, "-c", script], check=True, env=environment, timeout=60)
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        assert [entry[0] for entry in log] == [f"go {i}" for i in range(10)]
+
+    # Garbage collection of a log with the background flush.
+    log = untils.HistoryLog(path, flush_interval=60.0)
+    thread: Any = log._thread    # pyright: ignore[reportPrivateUsage]
+    log.append(note("look"))
+    del log
+    gc.collect()
+    thread.join(5)
+    assert not thread.is_alive()
+
+    with untils.CommandSystem(untils.Settings(), history_log=untils.HistoryLog(path, flush_interval=60.0)) as command_system:
+        command_system.write_history("help", untils.ParsedInput(["help"]))
+
+    with untils.HistoryLog(path, is_background_flush=False) as log:
+        assert [entry[0] for entry in log][-2:] == ["look", "help"]
+
+def test_search_history(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests, that `CommandSystem.search_history` method delegates to `HistoryLog.search`."""
+
+    calls: List[Tuple[str, bool]] = []
+    search = untils.HistoryLog.search
+
+    def spy(log: untils.HistoryLog, text: str, is_prefix: bool=False) -> Iterator[Tuple[int, str]]:
+        calls.append((text, is_prefix))
+        return search(log, text, is_prefix)
+
+    monkeypatch.setattr(untils.HistoryLog, "search", spy)
+
+    with untils.HistoryLog(str(tmp_path / "history.log"), is_background_flush=False) as log:
+        command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings(), history_log=log)
+        for i in range(3):
+            command_system.write_history(f"go {i}", untils.ParsedInput(["go", str(i)]))
+        log.flush()
+
+        assert list(command_system.search_history("go", is_prefix=True)) == [(2, "go 2"), (1, "go 1"), (0, "go 0")]
+        assert calls == [("go", True)]
+
+def test_maps(tmp_path: pathlib.Path) -> None:
+    """Tests closing of outdated memory maps and own memory maps of searches."""
+
+    with untils.HistoryLog(str(tmp_path / "history.log"), is_background_flush=False) as log:
+        log.append(note("go 0"))
+        log.append(note("go 1"))
+        log.flush()
+
+        assert log[0] == note("go 0")
+        shared = log._log_map    # pyright: ignore[reportPrivateUsage]
+        found: Iterator[Tuple[int, str]] = log.search("go")
+        assert next(found) == (1, "go 1")
+
+        log.append(note("go 2"))
+        log.flush()
+
+        assert shared is not None and shared.closed
+        assert list(found) == [(0, "go 0")]
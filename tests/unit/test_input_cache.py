@@ -0,0 +1,62 @@
+"""`src/input_cache.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import warnings
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def command_system() -> untils.CommandSystem:
+    """Fixture for `pytest`."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+
+    return untils.CommandSystem(settings, untils.CommandsConfig(1, [], []), input_cache=untils.InputCache(2))
+
+def test_lru(command_system: untils.CommandSystem) -> None:
+    """Tests `InputCache` hits, misses and evictions."""
+
+    cache: untils.InputCache = command_system.input_cache    # pyright: ignore[reportAssignmentType]
+
+    first: untils.ParsedInput = command_system.process_input("go north")
+    assert command_system.process_input("go north") is first
+    command_system.process_input("look")
+    command_system.process_input("go north")
+    command_system.process_input("run")
+
+    assert list(cache.entries) == ["go north", "run"]
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 3, 1)
+
+def test_invalidation(command_system: untils.CommandSystem) -> None:
+    """Tests `InputCache` invalidation by config."""
+
+    cache: untils.InputCache = command_system.input_cache    # pyright: ignore[reportAssignmentType]
+
+    command_system.process_input("go")
+    command_system.set_config(untils.CommandsConfig(1, [], []))
+    assert len(cache) == 0
+
+    command_system.process_input("go")
+    command_system.config = untils.CommandsConfig(1, [], [])
+    command_system.process_input("go")
+    assert cache.hits == 0
+
+def test_warnings(command_system: untils.CommandSystem) -> None:
+    """Tests that inputs with warnings are not cached."""
+
+    for _ in range(2):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            command_system.process_input("go -! x")
+        assert len(caught) == 1
+
+    assert len(command_system.input_cache) == 0    # pyright: ignore[reportArgumentType]
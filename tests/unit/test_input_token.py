@@ -41,3 +41,18 @@ def test_option_input_token() -> None:
     assert word_input_token.type == untils.utils.FinalTokenType.OPTION
     assert word_input_token.name == "option_token"
     assert word_input_token.value == "42"
+
+def test_span_input_token() -> None:
+    """Tests `SpanInputToken`."""
+
+    source: str = "say 'it\\'s'"
+
+    span_input_token: untils.SpanInputToken = untils.SpanInputToken(untils.utils.RawTokenType.WORD, source, 0, 3)
+    assert span_input_token.value == "say"
+    assert span_input_token == untils.RawInputToken(untils.utils.RawTokenType.WORD, "say")
+    assert span_input_token.materialize() == untils.RawInputToken(untils.utils.RawTokenType.WORD, "say")
+
+    span_input_token = untils.SpanInputToken(untils.utils.RawTokenType.STRING, source, 5, 10, True)
+    assert span_input_token.value == "it's"
+    assert span_input_token != untils.RawInputToken(untils.utils.RawTokenType.WORD, "it's")
+    assert hash(span_input_token) == hash(untils.RawInputToken(untils.utils.RawTokenType.STRING, "it's"))
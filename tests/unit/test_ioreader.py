@@ -0,0 +1,57 @@
+"""`src/ioreader.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import Any, Dict
+
+import io
+import json
+import random
+
+import pytest
+
+import untils
+
+def read_object(stream: untils.JSONObjectStream) -> Dict[str, Any]:
+    """Reads an object with nested objects by keys."""
+
+    result: Dict[str, Any] = {}
+    stream.start_object()
+    while (key := stream.next_key()) is not None:
+        result[key] = read_object(stream) if stream.peek() == "{" else stream.read_value()
+    return result
+
+def make_value(rng: random.Random, depth: int=0) -> Any:
+    """Returns a random JSON value."""
+
+    chance: float = rng.random()
+    if depth > 3 or chance < 0.4:
+        return rng.choice([1, -12.5e3, 123456789, 0.5, True, False, None, "s\"}{,x", "é"])
+    if chance < 0.7:
+        return [make_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{i}": make_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+def test_json_object_stream() -> None:
+    """Tests `JSONObjectStream` against `json.loads` with chunks, which split values."""
+
+    rng: random.Random = random.Random(3)
+    for _ in range(100):
+        document: Dict[str, Any] = {f"k{i}": make_value(rng) for i in range(rng.randint(0, 5))}
+        text: str = json.dumps(document, indent=rng.choice([None, 2]), ensure_ascii=rng.random() < 0.5)
+
+        for chunk_size in (1, 2, 3, 7, 1000):
+            stream: untils.JSONObjectStream = untils.JSONObjectStream(io.StringIO(text), chunk_size)
+            assert read_object(stream) == document, (chunk_size, text)
+            assert stream.peek() == ""
+
+def test_json_object_stream_invalid() -> None:
+    """Tests errors of `JSONObjectStream`."""
+
+    for text in ('{"a": 1 "b": 2}', '{"a" 1}', '{a: 1}', '{"a": [1, 2}', '{"a": 1'):
+        with pytest.raises(json.JSONDecodeError):
+            read_object(untils.JSONObjectStream(io.StringIO(text), 2))
@@ -0,0 +1,89 @@
+"""`src/parsed_input.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import pickle
+import sys
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def parsed_input() -> untils.ParsedInput:
+    """Fixture for `pytest`."""
+
+    return untils.ParsedInput(["go", "north"], {"quiet": True, "fast": False}, {"speed": "5"})
+
+def test_access(parsed_input: untils.ParsedInput) -> None:
+    """Tests `InputDict` style access."""
+
+    size: int = sys.getsizeof(parsed_input)
+
+    assert parsed_input["path"] == ("go", "north")
+    assert parsed_input["flags"] == {"quiet": True, "fast": False}
+    assert parsed_input["options"]["speed"] == "5"
+    assert list(parsed_input) == ["path", "flags", "options"]
+    assert "flags" in parsed_input and "other" not in parsed_input
+    pytest.raises(KeyError, parsed_input.__getitem__, "other")
+    assert sys.getsizeof(parsed_input) == size
+
+def test_immutable(parsed_input: untils.ParsedInput) -> None:
+    """Tests `ParsedInput` immutability."""
+
+    pytest.raises(AttributeError, setattr, parsed_input, "path", ())
+    with pytest.raises(TypeError):
+        parsed_input.flags["quiet"] = False    # pyright: ignore[reportIndexIssue]
+    pytest.raises(AttributeError, setattr, parsed_input, "extra", 1)
+
+def test_conversions(parsed_input: untils.ParsedInput) -> None:
+    """Tests equality, conversions and pickling."""
+
+    input_dict: untils.utils.InputDict = parsed_input.to_dict()
+
+    assert input_dict == {"path": ["go", "north"], "flags": {"quiet": True, "fast": False}, "options": {"speed": "5"}}
+    assert parsed_input == input_dict
+    assert untils.ParsedInput.from_dict(input_dict) == parsed_input
+    assert untils.ParsedInput.from_dict(parsed_input) is parsed_input
+    assert hash(untils.ParsedInput.from_dict(input_dict)) == hash(parsed_input)
+    assert parsed_input != untils.ParsedInput(["go"])
+    assert pickle.loads(pickle.dumps(parsed_input)) == parsed_input
+
+def test_equality(parsed_input: untils.ParsedInput, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests equality and hash regardless of the order of names without building mappings."""
+
+    reordered: untils.ParsedInput = untils.ParsedInput(["go", "north"], {"fast": False, "quiet": True}, {"speed": "5"})
+
+    monkeypatch.setattr(untils.parsed_input, "MappingProxyType", None)
+
+    assert parsed_input == reordered and hash(parsed_input) == hash(reordered)
+    assert parsed_input == {"path": ["go", "north"], "flags": {"fast": False, "quiet": True}, "options": {"speed": "5"}}
+    assert parsed_input != untils.ParsedInput(["go", "north"], {"quiet": True, "fast": True}, {"speed": "5"})
+    assert parsed_input != {"path": ["go", "north"], "flags": {"quiet": True}, "options": {"speed": "5"}}
+    assert parsed_input != {"path": ["go", "north"], "flags": {"quiet": True, "fast": False}, "options": ["speed"]}
+
+def test_interning() -> None:
+    """Tests, that path parts and names are shared between inputs."""
+
+    first: untils.ParsedInput = untils.ParsedInput(["".join(("go", "!"))], {"".join(("quiet", "!")): True})
+    second: untils.ParsedInput = untils.ParsedInput(["".join(("go", "!"))], {"".join(("quiet", "!")): True})
+
+    assert first.path[0] is second.path[0]
+    assert next(iter(first.flags)) is next(iter(second.flags))
+
+def test_command_system(parsed_input: untils.ParsedInput) -> None:
+    """Tests `ParsedInput` in `CommandSystem` history and routing."""
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+
+    assert command_system.access_path(parsed_input, ["go", ["north", "n"]])
+    assert command_system.access_path(("go", "north"), ["go", "-any"])
+
+    command_system.write_history("go north", parsed_input.to_dict())
+    assert isinstance(command_system.get_history_dict()[0], untils.ParsedInput)
+    assert command_system.get_history_dict()[0] == parsed_input
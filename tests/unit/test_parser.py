@@ -0,0 +1,72 @@
+"""`src/parser.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import sys
+
+from typing import Any, Dict
+
+import untils
+
+def test_parse_commands() -> None:
+    """Tests `Parser.parse_commands` method."""
+
+    stats: untils.ParseStats = untils.ParseStats()
+    commands = untils.Parser.parse_commands({
+        "go": {
+            "aliases": ["g"],
+            "type": "word",
+            "children": {
+                "north": {"aliases": ["n"], "type": "word"},
+                "$where": {"type": "fallback", "children": {"fast": {"aliases": ["f"], "type": "flag", "default": None}}},
+                "speed": {"aliases": ["s"], "type": "option", "default": "1"}
+            }
+        },
+        "look": {"aliases": [], "type": "word"}
+    }, stats)
+
+    go: untils.CommandWordNode = commands[0]    # pyright: ignore[reportAssignmentType]
+    assert [command.name for command in commands] == ["go", "look"]
+    assert [command.name for command in go.children] == ["north", "$where", "speed"]
+    assert go.aliases == [untils.AliasNode("go", "g")]
+    assert go.children[1].children[0].type == "flag"    # pyright: ignore[reportAttributeAccessIssue]
+    assert go.children[2].default == "1"    # pyright: ignore[reportAttributeAccessIssue]
+
+    assert (stats.nodes, stats.words, stats.fallbacks, stats.flags, stats.options) == (6, 3, 1, 1, 1)
+    assert (stats.aliases, stats.alias_nodes, stats.depth) == (4, 4, 3)
+
+def test_interning() -> None:
+    """Tests interning of names and aliases in `Parser.parse_commands` method."""
+
+    child: Dict[str, Any] = {"hit": {"aliases": ["h"], "type": "word"}}
+    commands = untils.Parser.parse_commands({
+        "a": {"aliases": [], "type": "word", "children": dict(child)},
+        "b": {"aliases": [], "type": "word", "children": {"$x": {"type": "fallback", "children": dict(child)}}}
+    })
+
+    first: untils.CommandWordNode = commands[0].children[0]    # pyright: ignore[reportAttributeAccessIssue]
+    second: untils.CommandWordNode = commands[1].children[0].children[0]    # pyright: ignore[reportAttributeAccessIssue]
+    assert first.aliases[0] is second.aliases[0]
+    assert first.name is sys.intern("".join(["h", "it"]))
+
+def test_deep_tree() -> None:
+    """Tests `Parser.parse_config` method on a tree deeper than the recursion limit."""
+
+    depth: int = sys.getrecursionlimit() * 2
+    commands: Dict[str, Any] = {}
+    level: Dict[str, Any] = commands
+    for i in range(depth):
+        level[f"c{i}"] = {"aliases": [], "type": "word", "children": {}}
+        level = level[f"c{i}"]["children"]
+
+    stats: untils.ParseStats = untils.ParseStats()
+    config: untils.CommandsConfig = untils.Parser.parse_config({"version": 1, "states": {}, "commands": commands}, stats)
+
+    assert stats.depth == depth
+    assert stats.config_time >= stats.commands_time > 0
+    assert config.trie.words["c0"].words["c1"].name == "c1"
@@ -0,0 +1,227 @@
+"""`src/processor.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import io
+import json
+import os
+import pathlib
+import random
+import warnings
+
+from typing import Any, List, Tuple
+
+import pytest
+
+import untils
+
+INPUTS: Tuple[str, ...] = (
+    "",
+    "go",
+    "go n -q",
+    "go -q n",
+    "give bob sword --count 5 -!silent",
+    "give 'Some Player'",
+    "give -v bob",
+    "--count",
+    "-",
+    "-!",
+    "- !x",
+    "--'' 'x'",
+    "go--x y",
+    "unknown ! words"
+)
+"""Inputs for parity of pipelines."""
+
+@pytest.fixture
+def config() -> untils.CommandsConfig:
+    """Fixture for `pytest`."""
+
+    return untils.Parser.parse_config({
+        "version": 1,
+        "states": {
+            "__base__": ["go", "give"]
+        },
+        "commands": {
+            "go": {
+                "aliases": ["g"],
+                "type": "word",
+                "children": {
+                    "north": {"aliases": ["n"], "type": "word"},
+                    "quiet": {"aliases": ["q"], "type": "flag", "default": None}
+                }
+            },
+            "give": {
+                "aliases": [],
+                "type": "word",
+                "children": {
+                    "$player": {
+                        "type": "fallback",
+                        "default": "me",
+                        "children": {
+                            "sword": {"aliases": [], "type": "word"},
+                            "count": {"aliases": [], "type": "option", "default": "1"}
+                        }
+                    }
+                }
+            }
+        }
+    })
+
+def process(settings: untils.Settings, config: untils.CommandsConfig, input_str: str) -> Tuple[Any, List[str]]:
+    """Processes an input and catches the result or an exception with warning messages."""
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            result: Any = untils.Processor.process_input(settings, config, input_str)
+        except Exception as exception:    # pylint: disable=broad-exception-caught
+            result = (type(exception), str(exception))
+
+    return result, [str(warning.message) for warning in caught]
+
+def test_fused_parity(config: untils.CommandsConfig) -> None:
+    """Tests `Processor.process_input_fused` against the staged pipeline."""
+
+    settings: untils.Settings = untils.Settings()
+
+    for level in untils.utils.WarningsLevel:
+        settings.warnings_level = level
+
+        for input_str in INPUTS:
+            settings.is_fused_input = False
+            expected: Tuple[Any, List[str]] = process(settings, config, input_str)
+
+            settings.is_fused_input = True
+            assert process(settings, config, input_str) == expected, (level, input_str)
+
+FRAGMENTS: Tuple[str, ...] = ("go", "n", "q", "give", "bob", "sword", "count", "5", " ", "-", "--", "!", "'", "\"", "x y", "\\")
+"""Fragments for random parity inputs."""
+
+def test_fused_random_parity(config: untils.CommandsConfig) -> None:
+    """Tests `Processor.process_input_fused` against the staged pipeline on random inputs."""
+
+    generator: random.Random = random.Random(11)
+    settings: untils.Settings = untils.Settings()
+
+    for _ in range(3000):
+        input_str: str = "".join(generator.choice(FRAGMENTS) for _ in range(generator.randint(0, 8)))
+        settings.warnings_level = generator.choice(list(untils.utils.WarningsLevel))
+        settings.tokenizer_backend = generator.choice(list(untils.utils.TokenizerBackend))
+
+        settings.is_fused_input = False
+        expected: Tuple[Any, List[str]] = process(settings, config, input_str)
+
+        settings.is_fused_input = True
+        assert process(settings, config, input_str) == expected, (settings.warnings_level, input_str)
+
+STREAMING_CONFIGS: Tuple[str, ...] = (
+    '{"version": 1, "states": {"__base__": ["go", "give"]}, "commands": {"go": {"aliases": ["g"], "type": "word", "children": {"north": {"aliases": ["n"], "type": "word"}, "quiet": {"aliases": ["q"], "type": "flag", "default": null}}}, "give": {"aliases": [], "type": "word", "children": {"$player": {"type": "fallback", "default": "me", "children": {"count": {"aliases": [], "type": "option", "default": 1.5e2}}}}}}}',
+    '{"commands": {"go": {"aliases": ["g", "g"], "type": "word"}, "run": {"aliases": ["g", "run"], "type": "word"}, "bad": {"type": "unknown"}}, "states": {"__init__": ["go", "missing"]}, "version": 99}',
+    '{"version": 1, "commands": [], "states": {}}',
+    '{"version": 1, "states": {"__base__": ["go"]}, "commands": {"go": {"aliases": [], "type": "word"}, "go": {"aliases": ["x"], "type": "word"}}}',
+    '[1, 2]',
+    '{"version": 1, "commands": {"go": {"type": "word"'
+)
+"""Config files for parity of loaders."""
+
+def load(settings: untils.Settings, file_path: str, is_streaming: bool) -> Tuple[Any, List[str]]:
+    """Loads a config and catches the result or an exception with warning messages."""
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            if is_streaming:
+                result: Any = untils.Processor.load_config_streaming(settings, file_path, chunk_size=7)
+            else:
+                result = untils.Processor.load_config(settings, file_path)
+        except Exception as exception:    # pylint: disable=broad-exception-caught
+            result = type(exception)
+
+    return result, [str(warning.message) for warning in caught]
+
+def test_streaming_parity(tmp_path: pathlib.Path) -> None:
+    """Tests `Processor.load_config_streaming` against `Processor.load_config`."""
+
+    settings: untils.Settings = untils.Settings()
+
+    for i, text in enumerate(STREAMING_CONFIGS):
+        path: pathlib.Path = tmp_path / f"config{i}.json"
+        path.write_text(text, encoding="utf-8")
+
+        for level in untils.utils.WarningsLevel:
+            settings.warnings_level = level
+            expected: Tuple[Any, List[str]] = load(settings, str(path), False)
+            result: Tuple[Any, List[str]] = load(settings, str(path), True)
+
+            assert result[0] == expected[0], (level, text)
+            # Version and states are validated after commands.
+            assert sorted(result[1]) == sorted(expected[1]), (level, text)
+
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+    assert load(settings, str(tmp_path / "missing.json"), True) == load(settings, str(tmp_path / "missing.json"), False)
+
+def test_load_config_from_memory(tmp_path: pathlib.Path) -> None:
+    """Tests loading of configs from mappings, bytes and file objects against `Processor.load_config`."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+
+    for i, text in enumerate(STREAMING_CONFIGS[:4]):
+        path: pathlib.Path = tmp_path / f"config{i}.json"
+        path.write_text(text, encoding="utf-8")
+        expected: Tuple[Any, List[str]] = load(settings, str(path), False)
+
+        config_dict: Any = json.loads(text)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            assert untils.Processor.load_config_from_mapping(settings, config_dict) == expected[0], text
+            assert untils.Processor.load_config_from_bytes(settings, text.encode("utf-8")) == expected[0], text
+            assert untils.Processor.load_config_from_bytes(settings, text.encode("utf-16")) == expected[0], text
+            assert untils.Processor.load_config_from_stream(settings, io.StringIO(text)) == expected[0], text
+
+            stream: io.BytesIO = io.BytesIO(text.encode("utf-8"))
+            assert untils.Processor.load_config_from_stream(settings, stream, is_streaming=True) == expected[0], text
+            assert not stream.closed
+
+        assert [str(warning.message) for warning in caught][:len(expected[1])] == expected[1]
+        # The mapping is not changed by validation.
+        assert config_dict == json.loads(text)
+
+    with pytest.warns(untils.utils.FileWarning):
+        untils.Processor.load_config_from_bytes(settings, STREAMING_CONFIGS[0], ".json5")
+
+    command_system: untils.CommandSystem = untils.CommandSystem(settings)
+    command_system.load_config_from_mapping(json.loads(STREAMING_CONFIGS[0]))
+    assert command_system.get_normalized_path(command_system.process_input("g n")) == ["go", "north"]
+
+def test_validate_config_path(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests, that `IOValidator.validate_config_path` stats a path once."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+    path: pathlib.Path = tmp_path / "config.json"
+    path.write_text(STREAMING_CONFIGS[0], encoding="utf-8")
+
+    calls: List[str] = []
+    stat = os.stat
+
+    def counting_stat(file_path: Any, *args: Any, **kwargs: Any) -> os.stat_result:
+        calls.append(str(file_path))
+        return stat(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "stat", counting_stat)
+    assert untils.IOValidator.validate_config_path(settings, str(path))
+    assert calls == [str(path)]
+
+    (tmp_path / "config.txt").write_text("", encoding="utf-8")
+    assert not untils.IOValidator.validate_config_path(settings, str(tmp_path / "config.txt"))
+    monkeypatch.undo()
+
+    with pytest.warns(untils.utils.FileWarning):
+        assert not untils.IOValidator.validate_config_path(settings, str(tmp_path))
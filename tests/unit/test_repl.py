@@ -0,0 +1,139 @@
+"""`src/repl.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import Iterator, List, Union
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def command_system() -> untils.CommandSystem:
+    """Fixture for `pytest`."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+
+    return untils.CommandSystem(settings, untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__base__": ["go", "wait", "look"]},
+        "commands": {
+            "go": {"aliases": [], "type": "word"},
+            "wait": {"aliases": [], "type": "word"},
+            "look": {"aliases": [], "type": "word"}
+        }
+    }))
+
+def test_execute_async(command_system: untils.CommandSystem) -> None:
+    """Tests `CommandSystem.execute_async` method."""
+
+    calls: List[str] = []
+
+    async def go(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        await asyncio.sleep(0)
+        calls.append(input_str)
+
+    def look(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        calls.append(threading.current_thread().name)
+
+    async def wait(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        await asyncio.sleep(10)
+
+    command_system.register_command(("go",), go)
+    command_system.register_command(("look",), look)
+    command_system.register_command(("wait",), wait)
+
+    async def main() -> List[bool]:
+        return [
+            await command_system.execute_async("go", untils.ParsedInput(["go"]), ["go"]),
+            await command_system.execute_async("look", untils.ParsedInput(["look"]), ["look"]),
+            await command_system.execute_async("wait", untils.ParsedInput(["wait"]), ["wait"], timeout=0.01),
+            await command_system.execute_async("run", untils.ParsedInput(["run"]), ["run"])
+        ]
+
+    assert asyncio.run(main()) == [True, True, False, False]
+    assert calls[0] == "go" and calls[1] != threading.current_thread().name
+    assert list(command_system.get_history_input()) == ["go", "look", "wait", "run"]
+
+def test_repl(command_system: untils.CommandSystem) -> None:
+    """Tests `AsyncRepl` loop and cancellation."""
+
+    calls: List[str] = []
+    lines: Iterator[str] = iter(["go\n", "go -! x\n", "look\n", "exit\n", "go\n"])
+
+    async def read_line() -> str:
+        return next(lines, "")
+
+    def record(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        calls.append(input_str)
+
+    command_system.register_command(("go",), record)
+    command_system.register_command(("look",), record)
+
+    with pytest.warns(untils.utils.InputStructureWarning):
+        asyncio.run(untils.AsyncRepl(command_system, read_line, output=None).run())
+    assert calls == ["go", "look"]
+
+    async def block() -> str:
+        await asyncio.sleep(10)
+        return ""
+
+    async def cancel() -> bool:
+        repl: untils.AsyncRepl = untils.AsyncRepl(command_system, block, output=None)
+        task: asyncio.Task[None] = asyncio.create_task(repl.run())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return repl.is_running
+
+    assert not asyncio.run(cancel())
+
+def test_repl_suggestions(command_system: untils.CommandSystem, caplog: pytest.LogCaptureFixture) -> None:
+    """Tests "did you mean" suggestions of rejected inputs."""
+
+    caplog.set_level("INFO", command_system.settings.logger.name)
+    with pytest.warns(untils.utils.InputValuesWarning):
+        assert not asyncio.run(untils.AsyncRepl(command_system, output=None).process("lokk"))
+    assert "Did you mean 'look'?" in caplog.text
+
+def test_repl_exceptions(command_system: untils.CommandSystem, caplog: pytest.LogCaptureFixture) -> None:
+    """Tests command exceptions in `AsyncRepl` loop and `TimeoutError` of commands."""
+
+    calls: List[str] = []
+    lines: Iterator[str] = iter(["go\n", "wait\n", "look\n"])
+
+    async def read_line() -> str:
+        return next(lines, "")
+
+    def go(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        raise RuntimeError("broken")
+
+    async def wait(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        raise TimeoutError("own timeout")
+
+    def look(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        calls.append(input_str)
+
+    command_system.register_command(("go",), go)
+    command_system.register_command(("wait",), wait)
+    command_system.register_command(("look",), look)
+
+    with pytest.raises(TimeoutError, match="own timeout"):
+        asyncio.run(command_system.execute_async("wait", untils.ParsedInput(["wait"]), ["wait"], timeout=10.0))
+
+    asyncio.run(untils.AsyncRepl(command_system, read_line, output=None, timeout=10.0).run())
+    assert calls == ["look"]
+    assert "Unexpected exception: broken" in caplog.text
+    assert "Unexpected exception: own timeout" in caplog.text
+    assert "Timed out" not in caplog.text
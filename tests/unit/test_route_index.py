@@ -0,0 +1,109 @@
+"""`src/route_index.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import random
+
+from typing import Any, List, Tuple
+
+import untils
+
+PARTS: Tuple[Any, ...] = ("a", "b", "c", "-any", ("a", "b"), ("c", "-any"), ("b",))
+"""Parts for random command paths."""
+
+def test_precedence() -> None:
+    """Tests `RouteIndex.resolve` precedence."""
+
+    index: untils.RouteIndex = untils.RouteIndex([
+        ("-any",), ("go", "-any"), ("go", ("north", "south")), ("go", "north"), ("go", "north", "fast"), ("look",)
+    ])
+
+    assert index.resolve(["go", "north"]) == ("go", "north")
+    assert index.resolve(["go", "south"]) == ("go", ("north", "south"))
+    assert index.resolve(["go", "west"]) == ("go", "-any")
+    assert index.resolve(["go", "north", "slow"]) == ("go", "north")
+    assert index.resolve(["go"]) == ("go", "-any")
+    assert index.resolve(["run"]) == ("-any",)
+    assert index.resolve(["look", "around"]) == ("look",)
+
+    # Registration order is only the last tie-break.
+    assert untils.RouteIndex([("go", ("north", "south")), ("go", "-any")]).resolve(["go", "north"]) == ("go", ("north", "south"))
+    assert untils.RouteIndex([("-any", "x"), (("a",), "x")]).resolve(["a", "x"]) == (("a",), "x")
+
+def test_random_matches() -> None:
+    """Tests `RouteIndex.resolve` against `CommandSystem.access_path` and incremental updates."""
+
+    generator: random.Random = random.Random(3)
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+
+    for _ in range(500):
+        path: Tuple[Any, ...] = tuple(generator.choice(PARTS) for _ in range(generator.randint(0, 3)))
+        if generator.random() < 0.3:
+            command_system.unload_command(path)
+        else:
+            command_system.register_command(path, lambda input_str, input_dict: None)
+
+        normalized_path: List[str] = [generator.choice("abcd") for _ in range(generator.randint(1, 4))]
+        matches: List[Any] = [route for route in command_system.route if command_system.access_path(normalized_path, route, False)]
+        resolved: Any = command_system.route_index.resolve(normalized_path)
+
+        assert (resolved is None) == (matches == [])
+        assert resolved is None or resolved in matches
+        assert len(command_system.route_index) == len(command_system.route)
+
+    for path in list(command_system.route):
+        command_system.unload_command(path)
+    assert command_system.route_index.root.is_empty()
+
+def test_execute() -> None:
+    """Tests `CommandSystem.execute` dispatch."""
+
+    called: List[str] = []
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+    command_system.register_command(("go", "-any"), lambda input_str, input_dict: called.append("any"))
+    command_system.register_command(("go", "north"), lambda input_str, input_dict: called.append("north"))
+
+    assert command_system.execute("go north", untils.ParsedInput(["go", "north"]), ["go", "north"], False)
+    assert command_system.execute("go n", untils.ParsedInput(["go", "n"]), ["go", "n"], False)
+    assert not command_system.execute("run", untils.ParsedInput(["run"]), ["run"], False)
+    assert called == ["north", "any"]
+
+    command_system.change_command(("go", "north"), lambda input_str, input_dict: called.append("changed"))
+    command_system.route[("run",)] = lambda input_str, input_dict: called.append("run")
+    assert command_system.execute("go north", untils.ParsedInput(["go", "north"]), ["go", "north"], False)
+    assert command_system.execute("run", untils.ParsedInput(["run"]), ["run"], False)
+    assert called[2:] == ["changed", "run"]
+
+def test_direct_changes() -> None:
+    """Tests `CommandSystem.resolve_command` after direct changes of the command routing."""
+
+    def run(input_str: str, input_dict: Any) -> None:
+        pass
+
+    command_system: untils.CommandSystem = untils.CommandSystem(untils.Settings())
+    command_system.register_command(("a",), run)
+
+    # The count of routes is kept.
+    del command_system.route[("a",)]
+    command_system.route[("b",)] = run
+    assert command_system.resolve_command(["b"]) is run
+    assert command_system.resolve_command(["a"]) is None
+
+    command_system.route.update({("c", "-any"): run})
+    command_system.register_command(("d",), run)
+    assert command_system.resolve_command(["c", "x"]) is run
+    assert command_system.resolve_command(["d"]) is run
+
+    command_system.route = {("e",): run}
+    assert isinstance(command_system.route, untils.RouteTable)
+    assert command_system.resolve_command(["e"]) is run
+    assert command_system.resolve_command(["b"]) is None
+
+    version: int = command_system.route.version
+    command_system.change_command(("e",), lambda input_str, input_dict: None)
+    assert command_system.route.version == version
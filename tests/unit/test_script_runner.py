@@ -0,0 +1,110 @@
+"""`src/script_runner.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import List, Union
+
+import io
+import pathlib
+import warnings
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def command_system() -> untils.CommandSystem:
+    """Fixture for `pytest`."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+
+    return untils.CommandSystem(settings, untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__base__": ["go", "fail", "look"]},
+        "commands": {
+            "go": {"aliases": ["g"], "type": "word", "children": {"$where": {"type": "fallback"}}},
+            "fail": {"aliases": [], "type": "word"},
+            "look": {"aliases": [], "type": "word"}
+        }
+    }))
+
+def test_run(command_system: untils.CommandSystem) -> None:
+    """Tests order, failures and summary of `ScriptRunner.run`."""
+
+    calls: List[str] = []
+
+    def go(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        calls.append(input_str)
+
+    def fail(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        raise RuntimeError("boom")
+
+    command_system.register_command(("go",), go)
+    command_system.register_command(("fail",), fail)
+
+    script: List[str] = ["# comment", ""] + [f"g {i}" for i in range(50)] + ["fail", "look", "jump", "go 50"]
+    output: io.StringIO = io.StringIO()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        summary: untils.ScriptSummary = untils.ScriptRunner(command_system, chunk_size=7, max_workers=3, output=output).run(script)
+
+    assert calls == [f"g {i}" for i in range(50)] + ["go 50"]
+    assert (summary.lines, summary.skipped, summary.executed) == (56, 2, 51)
+    assert (summary.input_errors, summary.not_implemented, summary.command_errors) == (1, 1, 1)
+    assert [failure[0] for failure in summary.failures] == [53, 54, 55]
+    assert summary.failures[0][2] == "RuntimeError: boom"
+    assert output.getvalue().startswith("Script: 56 lines")
+    assert len(command_system.get_history()) == 0
+
+def test_file(command_system: untils.CommandSystem, tmp_path: pathlib.Path) -> None:
+    """Tests `CommandSystem.run_script` with a file and a process pool."""
+
+    path: pathlib.Path = tmp_path / "script.txt"
+    path.write_text("go 1\r\nlook\ngo 2\n", encoding="utf-8")
+
+    summary: untils.ScriptSummary = command_system.run_script(path, max_workers=2, is_processes=True, tracking=True, output=None)
+
+    assert (summary.lines, summary.executed, summary.not_implemented) == (3, 0, 3)
+    assert list(command_system.get_history_input()) == ["go 1", "look", "go 2"]
+
+def test_state_changes() -> None:
+    """Tests validation of lines in the state, which is set by previous lines of the script."""
+
+    settings: untils.Settings = untils.Settings()
+    settings.warnings_level = untils.utils.WarningsLevel.BASIC
+    command_system: untils.CommandSystem = untils.CommandSystem(settings, untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__init__": ["enter"], "inside": ["look"]},
+        "commands": {
+            "enter": {"aliases": [], "type": "word"},
+            "look": {"aliases": [], "type": "word"}
+        }
+    }))
+    calls: List[str] = []
+
+    def enter(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        settings.current_state = "inside"
+
+    def look(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        calls.append(input_str)
+
+    command_system.register_command(("enter",), enter)
+    command_system.register_command(("look",), look)
+
+    with untils.Session().activate():
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            summary: untils.ScriptSummary = untils.ScriptRunner(command_system, chunk_size=1, max_workers=2, output=None).run(
+                ["look", "enter", "look", "look"]
+            )
+
+    assert calls == ["look", "look"]
+    assert (summary.executed, summary.input_errors) == (3, 1)
+    assert [failure[0] for failure in summary.failures] == [1]
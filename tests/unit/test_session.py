@@ -0,0 +1,143 @@
+"""`src/session.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import Dict, List, Union
+
+import asyncio
+import pathlib
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def command_system() -> untils.CommandSystem:
+    """Fixture for `pytest`."""
+
+    return untils.CommandSystem(untils.Settings(), untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__base__": ["look"], "__init__": ["start"], "fight": ["hit"]},
+        "commands": {
+            "look": {"aliases": [], "type": "word"},
+            "start": {"aliases": [], "type": "word"},
+            "hit": {"aliases": [], "type": "word"}
+        }
+    }))
+
+def test_activate(command_system: untils.CommandSystem) -> None:
+    """Tests `Session` state, warnings level and history."""
+
+    settings: untils.Settings = command_system.settings
+    session: untils.Session = command_system.create_session("fight", untils.utils.WarningsLevel.IGNORE)
+
+    assert untils.Session.get_current() is None
+    with session.activate():
+        assert untils.Session.get_current() is session
+        assert settings.current_state == "fight"
+        assert settings.warnings_level == untils.utils.WarningsLevel.IGNORE
+        assert command_system.is_input_valid(command_system.process_input("hit"))
+        assert not command_system.is_input_valid(command_system.process_input("start"))
+
+        settings.current_state = "other"
+        command_system.write_history("hit", untils.ParsedInput(["hit"]))
+
+    assert (session.current_state, list(session.history.get_latest(0)[1].path)) == ("other", ["hit"])
+    assert settings.current_state == "__init__" and settings.warnings_level == untils.utils.WarningsLevel.STRICT
+    assert len(command_system.get_history()) == 0
+    assert session.history.max_size == command_system.history["max_size"]
+
+def test_tasks(command_system: untils.CommandSystem) -> None:
+    """Tests isolation of sessions in `asyncio` tasks and executor threads."""
+
+    states: Dict[str, List[str]] = {}
+
+    def record(input_str: str, input_dict: Union[untils.utils.InputDict, untils.ParsedInput]) -> None:
+        states.setdefault(input_str, []).append(command_system.settings.current_state)
+
+    command_system.register_command(("look",), record)
+
+    async def play(name: str, state: str) -> None:
+        with command_system.create_session(state).activate():
+            for _ in range(3):
+                await command_system.execute_async(name, untils.ParsedInput(["look"]), ["look"])
+                await asyncio.sleep(0)
+
+    async def main() -> None:
+        await asyncio.gather(play("a", "fight"), play("b", "__init__"), play("c", "trade"))
+
+    asyncio.run(main())
+    assert states == {"a": ["fight"] * 3, "b": ["__init__"] * 3, "c": ["trade"] * 3}
+
+    with untils.CommandExecutor(2) as executor, command_system.create_session("fight").activate():
+        executor.submit(record, "d", untils.ParsedInput()).result()
+    assert states["d"] == ["fight"]
+
+def test_current_state(command_system: untils.CommandSystem) -> None:
+    """Tests the same validation of the current state in and out of sessions."""
+
+    settings: untils.Settings = command_system.settings
+
+    def change() -> str:
+        pytest.raises(ValueError, setattr, settings, "current_state", untils.utils.InternalState.BASE)
+        assert settings.current_state == "__init__"
+        settings.current_state = "fight"
+        return settings.current_state
+
+    with command_system.create_session().activate() as session:
+        assert change() == session.current_state == "fight"
+    assert change() == "fight"
+
+def test_initial_state(command_system: untils.CommandSystem) -> None:
+    """Tests the same validation of initial and directly set states of sessions."""
+
+    pytest.raises(ValueError, untils.Session, untils.utils.InternalState.BASE)
+    pytest.raises(ValueError, untils.Session, "__base__")
+    pytest.raises(ValueError, command_system.create_session, "__base__")
+    assert untils.Session(untils.utils.InternalState.INIT).current_state == "__init__"
+    assert command_system.create_session("fight").current_state == "fight"
+
+    session: untils.Session = untils.Session()
+    pytest.raises(ValueError, setattr, session, "current_state", "__base__")
+    assert session.current_state == "__init__"
+
+    command_system.settings.warnings_level = untils.utils.WarningsLevel.IGNORE
+    assert command_system.create_session("__base__").current_state == "__init__"
+
+def test_history_log(command_system: untils.CommandSystem, tmp_path: pathlib.Path) -> None:
+    """Tests, that session history is not written to and not read from the shared history log."""
+
+    with untils.HistoryLog(str(tmp_path / "history.log"), is_background_flush=False) as log:
+        command_system.history_log = log
+        command_system.write_history("look", untils.ParsedInput(["look"]))
+
+        with command_system.create_session().activate():
+            command_system.write_history("start", untils.ParsedInput(["start"]))
+            assert list(command_system.get_history_input()) == ["start"]
+            assert list(command_system.search_history("")) == [(0, "start")]
+
+        assert list(log.get_inputs()) == ["look"]
+        assert list(command_system.search_history("")) == [(0, "look")]
+
+def test_diagnostics(command_system: untils.CommandSystem) -> None:
+    """Tests diagnostics collectors of sessions in `asyncio` tasks."""
+
+    settings: untils.Settings = command_system.settings
+
+    async def play(input_str: str) -> List[str]:
+        with command_system.create_session(warnings_level=untils.utils.WarningsLevel.BASIC).activate():
+            with settings.collect_diagnostics() as diagnostics:
+                await asyncio.sleep(0)
+                command_system.is_input_valid(command_system.process_input(input_str))
+                await asyncio.sleep(0)
+        return [str(record.fields) for record in diagnostics]
+
+    async def main() -> List[List[str]]:
+        return list(await asyncio.gather(play("jump"), play("look"), play("fly")))
+
+    assert asyncio.run(main()) == [[str({"name": "jump"})], [], [str({"name": "fly"})]]
@@ -0,0 +1,108 @@
+"""`src/suggestions.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+from typing import List
+
+import random
+
+import pytest
+
+import untils
+
+@pytest.fixture
+def command_system() -> untils.CommandSystem:
+    """Fixture for `pytest`."""
+
+    return untils.CommandSystem(untils.Settings(), untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__base__": ["status"], "__init__": ["start", "stop"], "fight": ["strike"]},
+        "commands": {
+            "start": {
+                "aliases": ["begin"],
+                "type": "word",
+                "children": {"server": {"aliases": ["srv"], "type": "word"}, "service": {"aliases": [], "type": "word"}}
+            },
+            "stop": {"aliases": [], "type": "word"},
+            "status": {"aliases": ["st"], "type": "word"},
+            "strike": {"aliases": [], "type": "word"}
+        }
+    }))
+
+def texts(suggestions: List[untils.Suggestion]) -> List[str]:
+    """Returns texts of suggestions."""
+
+    return [suggestion.text for suggestion in suggestions]
+
+def test_get_edit_distance() -> None:
+    """Tests `get_edit_distance` function."""
+
+    assert untils.get_edit_distance("", "") == 0
+    assert untils.get_edit_distance("abc", "") == 3
+    assert untils.get_edit_distance("kitten", "sitting") == 3
+    assert untils.get_edit_distance("stop", "stpo") == 2
+    assert untils.get_edit_distance("flaw", "lawn") == 2
+
+def test_deletion_index() -> None:
+    """Tests `DeletionIndex.search` against a linear scan."""
+
+    rng: random.Random = random.Random(1)
+    words: List[str] = list({"".join(rng.choice("abcd") for _ in range(rng.randint(1, 6))) for _ in range(300)})
+    index: untils.DeletionIndex = untils.DeletionIndex([(word, word) for word in words], 2)
+    assert len(index) == len(words)
+
+    for _ in range(50):
+        query: str = "".join(rng.choice("abcde") for _ in range(rng.randint(1, 6)))
+        for max_distance in (1, 2):
+            expected: List[str] = sorted(word for word in words if untils.get_edit_distance(query, word) <= max_distance)
+            assert sorted(suggestion.text for suggestion in index.search(query, max_distance)) == expected
+
+    with pytest.raises(ValueError):
+        index.search("abc", 3)
+
+def test_suggest(command_system: untils.CommandSystem) -> None:
+    """Tests `CommandSystem.suggest` method."""
+
+    assert texts(command_system.suggest(command_system.process_input("stpo"))) == ["stop", "st"]
+    assert texts(command_system.suggest(command_system.process_input("statsu"))) == ["status"]
+    assert texts(command_system.suggest(command_system.process_input("stop"))) == []
+    assert texts(command_system.suggest(command_system.process_input("xyzzy"))) == []
+
+    # Deeper levels and limits.
+    assert texts(command_system.suggest(command_system.process_input("start servre"))) == ["server", "service"]
+    assert texts(command_system.suggest(command_system.process_input("begin servce"), limit=1)) == ["service"]
+
+    suggestion: untils.Suggestion = command_system.suggest(command_system.process_input("stt"))[0]
+    assert (suggestion.text, suggestion.name, suggestion.distance) == ("st", "status", 1)
+
+def test_suggest_states(command_system: untils.CommandSystem) -> None:
+    """Tests filtering of suggestions by states."""
+
+    # `strike` is not legal in `__init__`.
+    assert "strike" not in texts(command_system.suggest(command_system.process_input("strke"), limit=10))
+
+    with untils.Session("fight").activate():
+        assert texts(command_system.suggest(command_system.process_input("strke"), limit=10)) == ["strike"]
+        # `stop` is legal in `__init__` only.
+        assert texts(command_system.suggest(command_system.process_input("sotp"))) == ["st"]
+
+def test_suggest_index(command_system: untils.CommandSystem) -> None:
+    """Tests rebuilding of the suggestion index."""
+
+    command_system.suggest(command_system.process_input("stpo"))
+    index = command_system.suggestion_index
+    command_system.suggest(command_system.process_input("start servre"))
+    assert command_system.suggestion_index is index
+
+    command_system.config = untils.Parser.parse_config({
+        "version": 1,
+        "states": {"__init__": ["quit"]},
+        "commands": {"quit": {"aliases": [], "type": "word"}}
+    })
+    assert texts(command_system.suggest(command_system.process_input("quti"))) == ["quit"]
+    assert command_system.suggestion_index is not index
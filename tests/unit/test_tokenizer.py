@@ -0,0 +1,218 @@
+"""`src/tokenizer.py` tests."""
+
+# pyright: reportUnusedImport=false
+
+# pylint: disable=unused-import
+# pylint: disable=line-too-long
+# pylint: disable=unused-variable
+# pylint: disable=redefined-outer-name
+
+import random
+
+from typing import List, Optional, Tuple, Type
+
+import pytest
+
+import untils
+
+ALPHABET: str = "ab1Z_ \t-!.'\"\\$é٣"
+"""Characters for random parity inputs: words, specials, quotes, escapes and skipped characters."""
+
+SAMPLES: Tuple[str, ...] = (
+    "",
+    "base",
+    "go 1 --name value -!flag",
+    "say 'hello world' \"quoted \\\" text\"",
+    "escapes 'a\\'b' 'c\\\\d' 'e\\xf'",
+    "unterminated 'string",
+    "skipped.characters_and\ttabs",
+    "юникод ٣٤ wörd",
+    "'\\'",
+    "---",
+    "!!"
+)
+"""Handwritten inputs for parity."""
+
+@pytest.fixture
+def settings() -> untils.Settings:
+    """Fixture for `pytest`."""
+
+    return untils.Settings()
+
+def tokenize(
+    settings: untils.Settings,
+    backend: untils.utils.TokenizerBackend,
+    input_str: str
+) -> Tuple[Optional[List[untils.RawInputToken]], Optional[Type[Exception]]]:
+    """Tokenizes an input with a backend and catches an exception type."""
+
+    settings.tokenizer_backend = backend
+
+    try:
+        return untils.Tokenizer(settings, input_str).tokenize_input(), None
+    except Exception as exception:    # pylint: disable=broad-exception-caught
+        return None, type(exception)
+
+def assert_parity(settings: untils.Settings, input_str: str) -> None:
+    """Asserts the same tokens for all backends."""
+
+    expected = tokenize(settings, untils.utils.TokenizerBackend.CHARACTER, input_str)
+    for backend in untils.utils.TokenizerBackend:
+        assert tokenize(settings, backend, input_str) == expected, (backend, input_str)
+
+def test_backend_setting(settings: untils.Settings) -> None:
+    """Tests `Settings.tokenizer_backend` property."""
+
+    assert settings.tokenizer_backend == untils.utils.TokenizerBackend.CHARACTER
+
+    settings.tokenizer_backend = untils.utils.TokenizerBackend.TABLE
+    assert settings.tokenizer_backend == untils.utils.TokenizerBackend.TABLE
+
+def test_table_tokens(settings: untils.Settings) -> None:
+    """Tests `Tokenizer.tokenize_input_table` method."""
+
+    tokenizer: untils.Tokenizer = untils.Tokenizer(settings, "go -!f 'a b'")
+
+    assert tokenizer.tokenize_input_table() == [
+        untils.RawInputToken(untils.utils.RawTokenType.WORD, "go"),
+        untils.RawInputToken(untils.utils.RawTokenType.SPACE, ' '),
+        untils.RawInputToken(untils.utils.RawTokenType.MINUS, '-'),
+        untils.RawInputToken(untils.utils.RawTokenType.NOT, '!'),
+        untils.RawInputToken(untils.utils.RawTokenType.WORD, "f"),
+        untils.RawInputToken(untils.utils.RawTokenType.SPACE, ' '),
+        untils.RawInputToken(untils.utils.RawTokenType.STRING, "a b")
+    ]
+
+def test_parity_samples(settings: untils.Settings) -> None:
+    """Tests the backends parity on handwritten inputs."""
+
+    for input_str in SAMPLES:
+        assert_parity(settings, input_str)
+
+def test_parity_random(settings: untils.Settings) -> None:
+    """Tests the backends parity on random inputs."""
+
+    generator: random.Random = random.Random(42)
+
+    for _ in range(2000):
+        length: int = generator.randint(0, 24)
+        assert_parity(settings, ''.join(generator.choice(ALPHABET) for _ in range(length)))
+
+def test_parity_trailing_backslash(settings: untils.Settings) -> None:
+    """Tests the backends parity on a backslash at the end of an unterminated string."""
+
+    assert tokenize(settings, untils.utils.TokenizerBackend.CHARACTER, "'abc\\")[1] is IndexError
+    assert_parity(settings, "'abc\\")
+
+def test_span_tokens(settings: untils.Settings) -> None:
+    """Tests `Tokenizer.tokenize_input_spans` method."""
+
+    input_str: str = "say 'a\\'b' \"c\""
+    tokens = untils.Tokenizer(settings, input_str).tokenize_input_spans()
+
+    assert [(token.start, token.end, token.is_escaped) for token in tokens] == [    # pyright: ignore[reportAttributeAccessIssue]
+        (0, 3, False), (3, 4, False), (5, 9, True), (10, 11, False), (12, 13, False)
+    ]
+    assert [token.value for token in tokens] == ["say", ' ', "a'b", ' ', "c"]
+
+def test_span_pipeline(settings: untils.Settings) -> None:
+    """Tests `Processor.process_input` parity with span tokens."""
+
+    config: untils.CommandsConfig = untils.CommandsConfig(1, [], [])
+
+    for input_str in ("go 'far away' --speed \"fast\" -!quiet", "a-b --opt-name 'x\\\\y'"):
+        settings.tokenizer_backend = untils.utils.TokenizerBackend.CHARACTER
+        expected: untils.utils.InputDict = untils.Processor.process_input(settings, config, input_str)
+
+        settings.tokenizer_backend = untils.utils.TokenizerBackend.SPAN
+        assert untils.Processor.process_input(settings, config, input_str) == expected
+
+def test_retokenize(settings: untils.Settings) -> None:
+    """Tests `Tokenizer.retokenize` method against full tokenization after random edits."""
+
+    generator: random.Random = random.Random(7)
+    alphabet: str = ALPHABET.replace('\\', '')
+    input_str: str = "go 'far away' --speed fast -!quiet"
+    tokens = untils.Tokenizer(settings, input_str).tokenize_input_spans()
+
+    for _ in range(2000):
+        position: int = generator.randint(0, len(input_str))
+        deleted: int = generator.randint(0, min(3, len(input_str) - position))
+        inserted: str = ''.join(generator.choice(alphabet) for _ in range(generator.randint(0, 3)))
+        input_str = input_str[:position] + inserted + input_str[position + deleted:]
+
+        tokens = untils.Tokenizer(settings, input_str).retokenize(tokens, position, deleted, inserted)
+        expected = untils.Tokenizer(settings, input_str).tokenize_input_spans()
+
+        assert [(token.type, token.start, token.end, token.value) for token in tokens] == [    # pyright: ignore[reportAttributeAccessIssue]
+            (token.type, token.start, token.end, token.value) for token in expected    # pyright: ignore[reportAttributeAccessIssue]
+        ], input_str
+        assert all(token.source is input_str for token in tokens), input_str    # pyright: ignore[reportAttributeAccessIssue]
+        assert len({id(token.span_source) for token in tokens}) <= 2, input_str    # pyright: ignore[reportAttributeAccessIssue]
+
+def test_retokenize_rebases(settings: untils.Settings, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests, that `Tokenizer.retokenize` method moves only tokens between edits to other sources."""
+
+    rebases: List[int] = [0]
+    rebase = untils.SpanInputToken.rebase
+
+    def count(token: untils.SpanInputToken, source: untils.SpanSource) -> None:
+        rebases[0] += 1
+        rebase(token, source)
+
+    monkeypatch.setattr(untils.SpanInputToken, "rebase", count)
+
+    input_str: str = "go north " * 2000
+    tokens = untils.Tokenizer(settings, input_str).tokenize_input_spans()
+
+    for position in (len(input_str), len(input_str) // 2, 0):
+        moved: int = rebases[0]
+        for i, char in enumerate("abc d"):
+            input_str = input_str[:position] + char + input_str[position:]
+            tokens = untils.Tokenizer(settings, input_str).retokenize(tokens, position, 0, char)
+            position += 1
+
+            # Only the first edit at a new place moves the gap.
+            if i == 0:
+                assert rebases[0] - moved <= len(tokens) // 2 + 1
+            else:
+                assert rebases[0] - moved <= 2
+            moved = rebases[0]
+
+        assert tokens == untils.Tokenizer(settings, input_str).tokenize_input_spans()
+
+def test_tokenize_many(settings: untils.Settings) -> None:
+    """Tests `Tokenizer.tokenize_many` method against tokenization by line."""
+
+    lines: List[str] = [input_str for input_str in SAMPLES if '\n' not in input_str]
+    buffer: untils.TokenBuffer = untils.Tokenizer.tokenize_many(settings, iter(lines))
+
+    assert len(buffer) == len(lines)
+    assert buffer.types.typecode == 'B'
+    assert buffer.starts.typecode == 'I'
+
+    for i, input_str in enumerate(lines):
+        assert buffer.get_input(i) == input_str
+        assert list(buffer[i]) == untils.Tokenizer(settings, input_str).tokenize_input_table()
+
+    line: untils.TokenBufferLine = buffer[len(lines) - 1]
+    assert line[0] is line[0]
+
+def test_tokenize_many_overflow(settings: untils.Settings, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests `Tokenizer.tokenize_many` method with inputs, which don't fit into offset arrays."""
+
+    monkeypatch.setattr(untils.tokenizer, "_OFFSET_LIMIT", 8)
+
+    assert len(untils.Tokenizer.tokenize_many(settings, ["go", "far"])) == 2
+    with pytest.raises(OverflowError):
+        untils.Tokenizer.tokenize_many(settings, ["go", "away!"])
+
+def test_process_many(settings: untils.Settings) -> None:
+    """Tests `Processor.process_many` method."""
+
+    config: untils.CommandsConfig = untils.CommandsConfig(1, [], [])
+    lines: List[str] = ["go 'far away' --speed fast", "", "look -!quiet", "say 'open"]
+
+    assert list(untils.Processor.process_many(settings, config, lines)) == [
+        untils.Processor.process_input(settings, config, input_str) for input_str in lines
+    ]